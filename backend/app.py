@@ -3,8 +3,8 @@ LinkedIn Post Bot API - FastAPI Application
 
 This is the main application entry point. It only contains:
 - FastAPI app initialization
-- CORS middleware setup
-- Database lifecycle hooks
+- CORS and GZip middleware setup
+- Application lifespan (database connect/disconnect)
 - Global exception handler
 - Router registration
 
@@ -14,6 +14,7 @@ All configuration is in backend/core/config.py
 """
 import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # =============================================================================
@@ -34,28 +35,35 @@ from dotenv import load_dotenv
 load_dotenv(backend_dir.parent / '.env')
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 # Import configuration from core module
 from core.config import (
     logger,
-    CORS_ORIGINS,
+    CORS_ORIGINS_SET,
+    CORS_MAX_AGE,
+    CORS_ALLOW_METHODS,
+    CORS_ALLOW_HEADERS,
+    POOL_WARM,
     RATE_LIMITING_ENABLED,
-    TEMPLATES,
+    DEV_MODE,
+    NPLUSONE_THRESHOLD,
     validate_environment,
 )
 
-# =============================================================================
-# VALIDATE ENVIRONMENT ON STARTUP
-# =============================================================================
-validate_environment()
-
 # =============================================================================
 # SERVICE IMPORTS - FAIL FAST (No defensive try/except)
 # =============================================================================
 # Database connection
-from services.db import connect_db, disconnect_db
+from services.db import connect_db, disconnect_db, warm_pool
+# Shared outbound HTTP session (keep-alive pool)
+from services.http_client import close_async_http, close_http_session
+# Per-request repository row cache
+from middleware.row_cache import RowCacheMiddleware
+# Per-request structlog context (request_id, path)
+from middleware.log_context import LogContextMiddleware
 
 # NOTE: Background task scheduling is now handled by Celery workers.
 # See services/celery_app.py and services/tasks.py
@@ -63,6 +71,43 @@ from services.db import connect_db, disconnect_db
 
 logger.info("Core services imported successfully")
 
+# =============================================================================
+# APPLICATION LIFESPAN
+# =============================================================================
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open (and warm) the database pool on startup and close it on shutdown.
+    
+    Note: Schema is managed by Alembic migrations.
+    Run 'alembic upgrade head' to apply migrations.
+    
+    Background Tasks: Scheduled post publishing is now handled by Celery.
+    The API server no longer runs background loops - this improves:
+    - Horizontal scaling (multiple API replicas without duplicate tasks)
+    - Reliability (tasks survive API restarts)
+    - Observability (Celery provides task monitoring)
+    """
+    # Validate environment here rather than at import time so importing
+    # this module (tests, uvicorn --reload) stays side-effect-free.
+    validate_environment()
+    
+    await connect_db()
+    await warm_pool(POOL_WARM)
+    
+    # Build the OpenAPI schema now (routers are mounted by the time lifespan
+    # runs) so the first /docs or /openapi.json hit doesn't pay for it.
+    # FastAPI memoizes the result on app.openapi_schema.
+    app.openapi()
+    
+    logger.info("Application startup complete (Celery handles background tasks)")
+    
+    yield
+    
+    await disconnect_db()
+    close_http_session()
+    await close_async_http()
+    logger.info("Application shutdown complete")
+
 # =============================================================================
 # FASTAPI APP INITIALIZATION
 # =============================================================================
@@ -94,6 +139,9 @@ app = FastAPI(
     license_info={
         "name": "MIT",
     },
+    lifespan=lifespan,
+    # orjson encodes route return values in C instead of stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 # =============================================================================
@@ -103,49 +151,54 @@ app = FastAPI(
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler for unhandled errors."""
     logger.error(f"Unhandled exception on {request.method} {request.url.path}: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"error": "Internal Server Error", "detail": str(exc)},
     )
 
 # =============================================================================
-# DATABASE LIFECYCLE HOOKS
+# REQUEST-SCOPED ROW CACHE
 # =============================================================================
-@app.on_event("startup")
-async def startup():
-    """Initialize database connection pool.
-    
-    Note: Schema is managed by Alembic migrations.
-    Run 'alembic upgrade head' to apply migrations.
-    
-    Background Tasks: Scheduled post publishing is now handled by Celery.
-    The API server no longer runs background loops - this improves:
-    - Horizontal scaling (multiple API replicas without duplicate tasks)
-    - Reliability (tasks survive API restarts)
-    - Observability (Celery provides task monitoring)
-    """
-    await connect_db()
-    logger.info("Application startup complete (Celery handles background tasks)")
+# Repeated repository get_by_id lookups within one request hit the DB once.
+app.add_middleware(RowCacheMiddleware)
 
+# =============================================================================
+# REQUEST LOG CONTEXT
+# =============================================================================
+# Every log line for a request carries its request_id and path via
+# structlog contextvars instead of per-handler bound loggers.
+app.add_middleware(LogContextMiddleware)
 
-@app.on_event("shutdown")
-async def shutdown():
-    """Close database connection pool."""
-    await disconnect_db()
-    logger.info("Application shutdown complete")
+# =============================================================================
+# N+1 QUERY DETECTION (development only)
+# =============================================================================
+# Logs "potential_n_plus_1" when the same SQL runs repeatedly from one line
+# within a single request. Added after the row-cache and log-context
+# middleware, so it wraps both and sees every query the handler issues.
+if DEV_MODE:
+    from services.query_tracker import QueryTrackerMiddleware
+    app.add_middleware(QueryTrackerMiddleware, threshold=NPLUSONE_THRESHOLD)
 
 # =============================================================================
-# CORS MIDDLEWARE
+# RESPONSE COMPRESSION
 # =============================================================================
-# Clean up CORS origins
-cors_origins = [origin.strip() for origin in CORS_ORIGINS if origin.strip()]
+# JSON list payloads (post history, activity, templates) compress 5-10x.
+# Small bodies are left alone since gzip overhead outweighs the savings.
+# Registered before CORS so CORS stays the outermost middleware.
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
 
+# =============================================================================
+# CORS MIDDLEWARE
+# =============================================================================
+# Origins are normalized in core.config; the frozenset keeps lookups O(1)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=cors_origins,
+    allow_origins=CORS_ORIGINS_SET,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=CORS_ALLOW_METHODS,
+    allow_headers=CORS_ALLOW_HEADERS,
+    expose_headers=[],
+    max_age=CORS_MAX_AGE,
 )
 
 # =============================================================================
@@ -155,7 +208,7 @@ try:
     # Import existing routers
     from routes.auth import router as auth_router
     from routes.feedback import router as feedback_router
-    from routes.posts import router as posts_router
+    from routes.posts import router as posts_router, tasks_router
     from routes.webhooks import router as webhooks_router
     from routes.settings import router as settings_router
     
@@ -170,6 +223,7 @@ try:
     app.include_router(auth_router)
     app.include_router(feedback_router)
     app.include_router(posts_router)
+    app.include_router(tasks_router)
     app.include_router(webhooks_router)
     app.include_router(settings_router)
     app.include_router(github_router)
@@ -191,19 +245,16 @@ except ImportError as e:
 # =============================================================================
 # HEALTH CHECK ENDPOINT
 # =============================================================================
+# Load balancers poll this constantly, so skip JSON encoding entirely.
+# Only the body is shared: a Response instance can't be reused because
+# middleware (CORS) appends to its header list in place.
+_HEALTH_BODY = b'{"status":"healthy"}'
+
+
 @app.get("/health", tags=["Health"])
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy"}
-
-
-# =============================================================================
-# TEMPLATES ENDPOINT
-# =============================================================================
-@app.get("/api/templates", tags=["Templates"])
-async def get_templates():
-    """Get post templates."""
-    return {"templates": TEMPLATES}
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
 # =============================================================================
@@ -211,4 +262,15 @@ async def get_templates():
 # =============================================================================
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", 8000)))
+    # uvloop/httptools ship with uvicorn[standard]. Multiple workers need the
+    # app as an import string; lifespan (DB pool) runs once per worker, and no
+    # background scheduler runs in-process, so scaling out is safe.
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", 8000)),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        proxy_headers=True,
+    )
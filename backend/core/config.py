@@ -32,7 +32,33 @@ logger = setup_logging()
 # =============================================================================
 # CORS_ORIGINS env var should be comma-separated list of allowed origins
 # Example: CORS_ORIGINS=http://localhost:3000,https://your-app.vercel.app
-CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+# Normalized once at import: whitespace stripped, empty entries dropped.
+CORS_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+    if origin.strip()
+)
+
+# Set form for O(1) origin checks (Starlette only tests membership)
+CORS_ORIGINS_SET = frozenset(CORS_ORIGINS)
+
+# How long (seconds) browsers may cache a CORS preflight response.
+# Starlette defaults to 600s; 24h avoids an OPTIONS round-trip before most POSTs.
+# Lower this in staging if CORS settings are being changed frequently.
+CORS_MAX_AGE = int(os.getenv("CORS_MAX_AGE", "86400"))
+
+# Explicit method/header allow-lists (instead of "*") so the preflight
+# response is static and Starlette doesn't echo request headers back.
+# Add to these if the frontend starts sending a new method or header.
+CORS_ALLOW_METHODS = ("GET", "POST", "PUT", "DELETE", "OPTIONS")
+CORS_ALLOW_HEADERS = ("Authorization", "Content-Type", "X-Requested-With")
+
+# =============================================================================
+# DATABASE POOL
+# =============================================================================
+# Number of pool connections to prime with SELECT 1 during startup so the
+# first burst of requests doesn't pay connection handshake latency (0 = off)
+POOL_WARM = int(os.getenv("POOL_WARM", "5"))
 
 # =============================================================================
 # FEATURE FLAGS
@@ -40,76 +66,43 @@ CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
 RATE_LIMITING_ENABLED = True
 ROUTERS_ENABLED = True
 
-# =============================================================================
-# TEMPLATES
-# =============================================================================
-TEMPLATES = [
-    {
-        "id": "code_release",
-        "name": "Code Release",
-        "description": "Announce a new version or release",
-        "icon": "🚀",
-        "context": {"type": "milestone", "milestone": "v1.0.0"}
-    },
-    {
-        "id": "learning",
-        "name": "Learning Journey",
-        "description": "Share what you learned",
-        "icon": "📚",
-        "context": {"type": "generic"}
-    },
-    {
-        "id": "project_update",
-        "name": "Project Update",
-        "description": "Share progress on a project",
-        "icon": "🔨",
-        "context": {"type": "push", "commits": 5}
-    },
-    {
-        "id": "collaboration",
-        "name": "Collaboration",
-        "description": "Thank contributors or collaborators",
-        "icon": "🤝",
-        "context": {"type": "pull_request"}
-    },
-    {
-        "id": "new_project",
-        "name": "New Project",
-        "description": "Announce a new repository",
-        "icon": "✨",
-        "context": {"type": "new_repo"}
-    }
-]
+# Local development mode (same flag middleware.clerk_auth reads; never in production)
+DEV_MODE = os.getenv("DEV_MODE", "false").lower() == "true"
+# Warn when one query runs more than this many times from one line per request
+NPLUSONE_THRESHOLD = int(os.getenv("NPLUSONE_THRESHOLD", "5"))
 
 # =============================================================================
 # ENVIRONMENT VALIDATION
 # =============================================================================
+# (name, purpose) pairs checked by validate_environment()
+_REQUIRED_VARS: tuple[tuple[str, str], ...] = (
+    ("GROQ_API_KEY", "AI content generation"),
+    ("LINKEDIN_CLIENT_ID", "LinkedIn OAuth"),
+    ("LINKEDIN_CLIENT_SECRET", "LinkedIn OAuth"),
+)
+
+_OPTIONAL_VARS: tuple[tuple[str, str], ...] = (
+    ("GITHUB_CLIENT_ID", "GitHub OAuth (private repos)"),
+    ("GITHUB_CLIENT_SECRET", "GitHub OAuth (private repos)"),
+    ("UNSPLASH_ACCESS_KEY", "Image generation"),
+    ("STRIPE_SECRET_KEY", "Stripe payments"),
+    ("STRIPE_WEBHOOK_SECRET", "Stripe webhook verification"),
+)
+
+
 def validate_environment() -> None:
     """Validate required environment variables on startup."""
-    required_vars = {
-        "GROQ_API_KEY": "AI content generation",
-        "LINKEDIN_CLIENT_ID": "LinkedIn OAuth",
-        "LINKEDIN_CLIENT_SECRET": "LinkedIn OAuth",
-    }
-    
-    optional_but_recommended = {
-        "GITHUB_CLIENT_ID": "GitHub OAuth (private repos)",
-        "GITHUB_CLIENT_SECRET": "GitHub OAuth (private repos)",
-        "UNSPLASH_ACCESS_KEY": "Image generation",
-        "STRIPE_SECRET_KEY": "Stripe payments",
-        "STRIPE_WEBHOOK_SECRET": "Stripe webhook verification",
-    }
-    
-    missing_required = []
-    missing_optional = []
-    
-    for var, purpose in required_vars.items():
-        if not os.getenv(var):
-            missing_required.append(f"  - {var}: {purpose}")
-    
-    for var, purpose in optional_but_recommended.items():
-        if not os.getenv(var):
-            missing_optional.append(f"  - {var}: {purpose}")
+    env = os.environ
+    missing_required = [
+        f"  - {var}: {purpose}"
+        for var, purpose in _REQUIRED_VARS
+        if not env.get(var)
+    ]
+    missing_optional = [
+        f"  - {var}: {purpose}"
+        for var, purpose in _OPTIONAL_VARS
+        if not env.get(var)
+    ]
     
     if missing_required:
         logger.warning("Missing REQUIRED environment variables:")
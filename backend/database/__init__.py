@@ -1,12 +1,25 @@
 # backend/database - Database schema and configuration
-from .schema import metadata, accounts, user_settings, post_history, scheduled_posts, feedback, tickets
+#
+# Table objects are loaded lazily (PEP 562) so importing this package does not
+# build the SQLAlchemy schema until a table/metadata attribute is first used.
 
 __all__ = [
     "metadata",
     "accounts",
-    "user_settings", 
+    "user_settings",
     "post_history",
     "scheduled_posts",
     "feedback",
     "tickets",
 ]
+
+_EXPORTS = frozenset(__all__)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        from . import schema
+        value = getattr(schema, name)
+        globals()[name] = value  # Cache so later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -58,8 +58,8 @@ user_settings = Table(
     Column("preferences", Text, default="{}"),
     Column("persona", Text, default="{}"),  # User's writing persona for AI
     Column("onboarding_complete", Integer, default=0),
-    Column("subscription_tier", Text, default="free"),
-    Column("subscription_status", Text, default="active"),
+    Column("subscription_tier", String(16), default="free"),
+    Column("subscription_status", String(32), default="active"),  # Raw Stripe status, e.g. incomplete_expired
     Column("subscription_expires_at", BigInteger),
     Column("created_at", BigInteger),
     Column("updated_at", BigInteger),
@@ -76,20 +76,16 @@ post_history = Table(
     Column("id", Integer, primary_key=True, autoincrement=True),
     Column("user_id", Text, index=True),
     Column("post_content", Text),
-    Column("post_type", Text),
+    Column("post_type", String(16)),
     Column("context", Text),
-    Column("status", Text),
+    Column("status", String(16)),
     Column("linkedin_post_id", Text),
     Column("engagement", Text),
     Column("created_at", BigInteger),
     Column("published_at", BigInteger),
-    # Indexes defined via Index objects below
+    # Indexes defined in _INDEX_SPECS below
 )
 
-# Additional indexes for post_history
-Index("idx_post_history_user", post_history.c.user_id)
-Index("idx_post_history_status", post_history.c.user_id, post_history.c.status)
-
 # =============================================================================
 # TABLE: scheduled_posts
 # Stores posts scheduled for future publishing
@@ -103,18 +99,13 @@ scheduled_posts = Table(
     Column("post_content", Text, nullable=False),
     Column("image_url", Text),
     Column("scheduled_time", BigInteger, nullable=False),
-    Column("status", Text, default="pending"),
+    Column("status", String(16), default="pending"),
     Column("error_message", Text),
     Column("created_at", BigInteger, nullable=False),
     Column("published_at", BigInteger),
     UniqueConstraint("user_id", "scheduled_time", name="uq_scheduled_user_time"),
 )
 
-# Indexes for scheduled_posts
-Index("idx_scheduled_time", scheduled_posts.c.scheduled_time)
-Index("idx_scheduled_user", scheduled_posts.c.user_id)
-Index("idx_scheduled_status", scheduled_posts.c.status)
-
 # =============================================================================
 # TABLE: feedback
 # Stores user feedback submissions
@@ -133,9 +124,6 @@ feedback = Table(
     Column("email_sent", Integer, default=0),
 )
 
-# Index for feedback
-Index("idx_feedback_user", feedback.c.user_id, feedback.c.created_at.desc())
-
 # =============================================================================
 # TABLE: tickets
 # Stores support ticket submissions (replaces JSON file storage)
@@ -174,7 +162,46 @@ subscriptions = Table(
     Column("updated_at", BigInteger),
 )
 
-# Indexes for subscriptions
-Index("idx_subscriptions_user", subscriptions.c.user_id)
-Index("idx_subscriptions_customer", subscriptions.c.stripe_customer_id)
-Index("idx_subscriptions_status", subscriptions.c.status)
+# =============================================================================
+# INDEXES
+# (name, *columns[, options]) - registered on their tables in a single pass.
+# options are Index() keyword arguments (postgresql_where, postgresql_using,
+# ...) plus "dialect" to emit the index on that dialect only.
+# =============================================================================
+# Partial indexes over pending scheduled posts only stay small as
+# published/failed rows accumulate, and their scheduled_time ordering needs
+# no extra sort.
+_PENDING = scheduled_posts.c.status == "pending"
+_PENDING_ONLY = {"postgresql_where": _PENDING, "sqlite_where": _PENDING}
+
+_INDEX_SPECS = (
+    # post_history
+    ("idx_post_history_user", post_history.c.user_id),
+    ("idx_post_history_status", post_history.c.user_id, post_history.c.status),
+    # BRIN for created_at range scans. Timestamps stay Unix-epoch BigInteger
+    # (all queries compare against int(time.time())), but rows are appended
+    # in created_at order, which is exactly what BRIN needs.
+    ("brin_post_history_created", post_history.c.created_at,
+     {"postgresql_using": "brin", "dialect": "postgresql"}),
+    # scheduled_posts
+    ("idx_scheduled_time", scheduled_posts.c.scheduled_time),
+    ("idx_scheduled_user", scheduled_posts.c.user_id),
+    # per-user "my pending posts, by time" queries
+    ("idx_scheduled_pending", scheduled_posts.c.user_id, scheduled_posts.c.scheduled_time,
+     _PENDING_ONLY),
+    # the scheduler's global get_due_posts scan, which has no user_id
+    ("idx_scheduled_pending_time", scheduled_posts.c.scheduled_time, _PENDING_ONLY),
+    # feedback
+    ("idx_feedback_user", feedback.c.user_id, feedback.c.created_at.desc()),
+    # subscriptions (user_id and stripe_customer_id are already indexed by
+    # their unique constraints, so they need no separate index here)
+    ("idx_subscriptions_status", subscriptions.c.status),
+)
+
+for _name, *_columns in _INDEX_SPECS:
+    _options = dict(_columns.pop()) if isinstance(_columns[-1], dict) else {}
+    _dialect = _options.pop("dialect", None)
+    _index = Index(_name, *_columns, **_options)
+    if _dialect:
+        _index.ddl_if(dialect=_dialect)
+del _name, _columns, _options, _dialect, _index
@@ -19,19 +19,20 @@ from fastapi import Depends, HTTPException
 # =============================================================================
 from middleware.clerk_auth import get_current_user, require_auth
 
-# Re-export auth dependencies for use in routers
+# Re-export auth dependencies for use in routers.
+# Built once and shared by the helpers below instead of a new Depends() per call.
 require_auth_dep = Depends(require_auth) if require_auth else None
 get_user_dep = Depends(get_current_user) if get_current_user else None
 
 
 def get_auth_dependency():
     """Get the authentication dependency for router endpoints."""
-    return Depends(require_auth) if require_auth else None
+    return require_auth_dep
 
 
 def get_optional_auth_dependency():
     """Get optional authentication dependency (allows unauthenticated access)."""
-    return Depends(get_current_user) if get_current_user else None
+    return get_user_dep
 
 
 # =============================================================================
@@ -66,26 +67,13 @@ async def get_current_user_id(
     Raises:
         HTTPException 401 if not authenticated
     """
-    if not current_user or not current_user.get("user_id"):
+    try:
+        user_id = current_user["user_id"]
+    except (TypeError, KeyError):
         raise HTTPException(status_code=401, detail="Authentication required")
-    return current_user["user_id"]
-
-
-async def get_post_repository(
-    user_id: str = Depends(get_current_user_id),
-    db = Depends(get_db)
-) -> PostRepository:
-    """
-    Get PostRepository injected with current user's ID.
-    
-    This ensures all queries are automatically scoped to the authenticated user.
-    
-    Usage:
-        @router.get("/posts")
-        async def get_posts(post_repo: PostRepository = Depends(get_post_repository)):
-            return await post_repo.get_posts()
-    """
-    return PostRepository(db, user_id)
+    if not user_id:
+        raise HTTPException(status_code=401, detail="Authentication required")
+    return user_id
 
 
 async def get_settings_repository(
@@ -119,13 +107,36 @@ async def get_optional_user_id(
     return None
 
 
-async def get_post_repository_optional(
-    user_id: str | None = Depends(get_optional_user_id),
-    db = Depends(get_db)
-) -> PostRepository | None:
+def _make_post_repo_dep(required: bool):
     """
-    Get PostRepository if user is authenticated, otherwise None.
+    Build a PostRepository dependency scoped to the current user's ID.
+    
+    Both variants share the same get_db sub-dependency, so FastAPI resolves
+    it once per request even when an endpoint uses both.
+    
+    Args:
+        required: If True, unauthenticated requests are rejected with 401;
+                  otherwise the dependency yields None for anonymous users.
     """
-    if user_id:
-        return PostRepository(db, user_id)
-    return None
+    user_id_dep = get_current_user_id if required else get_optional_user_id
+    
+    async def dep(
+        user_id: str | None = Depends(user_id_dep),
+        db = Depends(get_db)
+    ) -> PostRepository | None:
+        return PostRepository(db, user_id) if user_id else None
+    
+    return dep
+
+
+# Get PostRepository injected with current user's ID.
+# This ensures all queries are automatically scoped to the authenticated user.
+#
+# Usage:
+#     @router.get("/posts")
+#     async def get_posts(post_repo: PostRepository = Depends(get_post_repository)):
+#         return await post_repo.get_posts()
+get_post_repository = _make_post_repo_dep(required=True)
+
+# Get PostRepository if user is authenticated, otherwise None.
+get_post_repository_optional = _make_post_repo_dep(required=False)
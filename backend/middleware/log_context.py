@@ -0,0 +1,29 @@
+"""
+Request Log Context Middleware
+
+Binds a request_id and path into structlog's context variables for each
+HTTP request, so every log line emitted while handling it carries them
+without handlers having to allocate bound loggers. Handlers add their own
+fields (e.g. user_id) with structlog.contextvars.bind_contextvars; the
+context is cleared when the next request starts.
+"""
+
+from uuid import uuid4
+
+from structlog.contextvars import bound_contextvars, clear_contextvars
+
+
+class LogContextMiddleware:
+    """Pure ASGI middleware that scopes structlog context to each request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        clear_contextvars()
+        with bound_contextvars(request_id=uuid4().hex, path=scope.get("path")):
+            await self.app(scope, receive, send)
@@ -0,0 +1,26 @@
+"""
+Request-Scoped Repository Row Cache Middleware
+
+Gives every HTTP request its own get_by_id row cache (see
+repositories.base.request_row_cache), so repeated lookups of the same
+record within one request - e.g. an ownership check followed by the
+handler's own read - cost a single query. The cache is discarded when the
+request ends and is never shared between requests or users.
+"""
+
+from repositories.base import request_row_cache
+
+
+class RowCacheMiddleware:
+    """Pure ASGI middleware that scopes a fresh row cache to each request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with request_row_cache():
+            await self.app(scope, receive, send)
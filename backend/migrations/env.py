@@ -11,7 +11,7 @@ from pathlib import Path
 
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
-from sqlalchemy.ext.asyncio import async_engine_from_config
+from sqlalchemy.ext.asyncio import AsyncEngine, async_engine_from_config
 
 from alembic import context
 
@@ -40,6 +40,12 @@ if config.config_file_name is not None:
 # =============================================================================
 # DATABASE URL CONFIGURATION
 # =============================================================================
+# Heroku/Render URL prefixes -> asyncpg driver prefix
+_PREFIX_MAP = (
+    ("postgres://", "postgresql+asyncpg://"),
+    ("postgresql://", "postgresql+asyncpg://"),
+)
+
 DATABASE_URL = os.getenv("DATABASE_URL")
 
 if not DATABASE_URL:
@@ -47,11 +53,10 @@ if not DATABASE_URL:
     sqlite_path = backend_dir / "dev_database.db"
     DATABASE_URL = f"sqlite+aiosqlite:///{sqlite_path}"
 else:
-    # Handle Heroku/Render postgres:// -> postgresql+asyncpg://
-    if DATABASE_URL.startswith("postgres://"):
-        DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql+asyncpg://", 1)
-    elif DATABASE_URL.startswith("postgresql://"):
-        DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+    for _old, _new in _PREFIX_MAP:
+        if DATABASE_URL.startswith(_old):
+            DATABASE_URL = _new + DATABASE_URL[len(_old):]
+            break
 
 # Override the sqlalchemy.url from alembic.ini
 config.set_main_option("sqlalchemy.url", DATABASE_URL)
@@ -89,27 +94,60 @@ def do_run_migrations(connection: Connection) -> None:
         context.run_migrations()
 
 
+def _engine_for(url: str) -> AsyncEngine:
+    """Get the async engine for url, building it once per Config.
+    
+    Alembic re-executes this file for every command, so the cache lives on
+    config.attributes: callers that reuse one Config across commands (e.g.
+    test suites calling command.upgrade repeatedly) skip config parsing and
+    dialect resolution after the first run. NullPool holds no connections,
+    so a cached engine is safe to reuse across event loops.
+    """
+    engines = config.attributes.setdefault("engines", {})
+    if url not in engines:
+        engines[url] = async_engine_from_config(
+            config.get_section(config.config_ini_section, {}),
+            prefix="sqlalchemy.",
+            poolclass=pool.NullPool,
+        )
+    return engines[url]
+
+
 async def run_async_migrations() -> None:
     """Run migrations asynchronously.
     
-    Creates an async engine and runs migrations via run_sync.
+    Uses a cached async engine and runs migrations via run_sync.
     This is required for asyncpg driver compatibility.
     """
-    connectable = async_engine_from_config(
-        config.get_section(config.config_ini_section, {}),
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
+    connectable = _engine_for(DATABASE_URL)
 
     async with connectable.connect() as connection:
         await connection.run_sync(do_run_migrations)
 
-    await connectable.dispose()
+    # NullPool keeps nothing open, so disposing is only needed on request
+    if os.getenv("ALEMBIC_DISPOSE"):
+        await connectable.dispose()
 
 
 def run_migrations_online() -> None:
-    """Run migrations in 'online' mode."""
-    asyncio.run(run_async_migrations())
+    """Run migrations in 'online' mode.
+    
+    Callers that already hold a connection (e.g. a test fixture running
+    inside its own event loop) can pass it via
+    ``config.attributes["connection"]`` to skip engine and loop setup.
+    Otherwise a private event loop is created and closed explicitly, without
+    the signal-handler and executor bookkeeping of asyncio.run().
+    """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run_async_migrations())
+    finally:
+        loop.close()
 
 
 if context.is_offline_mode():
@@ -0,0 +1,47 @@
+"""bound_status_columns
+
+Revision ID: 4b7e2c91d5a3
+Revises: 88922ef82cf0
+Create Date: 2026-10-16 10:12:41.207315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7e2c91d5a3'
+down_revision: Union[str, Sequence[str], None] = '88922ef82cf0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, length) for columns holding short, enum-like status strings.
+# subscription_status stores Stripe's raw status (e.g. "incomplete_expired"),
+# so it gets more room than our own enums.
+_STATUS_COLUMNS = (
+    ('post_history', 'status', 16),
+    ('post_history', 'post_type', 16),
+    ('scheduled_posts', 'status', 16),
+    ('user_settings', 'subscription_tier', 16),
+    ('user_settings', 'subscription_status', 32),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, length in _STATUS_COLUMNS:
+        op.alter_column(table, column,
+                   existing_type=sa.TEXT(),
+                   type_=sa.String(length=length),
+                   existing_nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, length in reversed(_STATUS_COLUMNS):
+        op.alter_column(table, column,
+                   existing_type=sa.String(length=length),
+                   type_=sa.TEXT(),
+                   existing_nullable=True)
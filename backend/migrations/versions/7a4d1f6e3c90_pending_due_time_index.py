@@ -0,0 +1,34 @@
+"""pending_due_time_index
+
+Revision ID: 7a4d1f6e3c90
+Revises: e5f3a9b27d04
+Create Date: 2026-10-16 14:22:37.481905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a4d1f6e3c90'
+down_revision: Union[str, Sequence[str], None] = 'e5f3a9b27d04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_PENDING = sa.text("status = 'pending'")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # idx_scheduled_pending leads with user_id, so the scheduler's global
+    # due-posts scan cannot use it
+    op.create_index('idx_scheduled_pending_time', 'scheduled_posts',
+                    ['scheduled_time'], unique=False,
+                    postgresql_where=_PENDING, sqlite_where=_PENDING)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_scheduled_pending_time', table_name='scheduled_posts')
@@ -0,0 +1,35 @@
+"""partial_pending_index
+
+Revision ID: 9d31f0a6c8e2
+Revises: 4b7e2c91d5a3
+Create Date: 2026-10-16 10:48:05.613092
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d31f0a6c8e2'
+down_revision: Union[str, Sequence[str], None] = '4b7e2c91d5a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_PENDING = sa.text("status = 'pending'")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # idx_scheduled_status was only ever created by init_tables()
+    op.drop_index('idx_scheduled_status', table_name='scheduled_posts', if_exists=True)
+    op.create_index('idx_scheduled_pending', 'scheduled_posts',
+                    ['user_id', 'scheduled_time'], unique=False,
+                    postgresql_where=_PENDING, sqlite_where=_PENDING)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_scheduled_pending', table_name='scheduled_posts')
+    op.create_index('idx_scheduled_status', 'scheduled_posts', ['status'], unique=False)
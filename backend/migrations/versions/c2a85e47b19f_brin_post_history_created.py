@@ -0,0 +1,35 @@
+"""brin_post_history_created
+
+Revision ID: c2a85e47b19f
+Revises: 9d31f0a6c8e2
+Create Date: 2026-10-16 11:20:37.884516
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2a85e47b19f'
+down_revision: Union[str, Sequence[str], None] = '9d31f0a6c8e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _is_postgresql() -> bool:
+    return op.get_context().dialect.name == 'postgresql'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _is_postgresql():
+        op.create_index('brin_post_history_created', 'post_history', ['created_at'],
+                        unique=False, postgresql_using='brin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _is_postgresql():
+        op.drop_index('brin_post_history_created', table_name='post_history')
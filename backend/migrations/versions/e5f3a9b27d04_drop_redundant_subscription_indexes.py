@@ -0,0 +1,31 @@
+"""drop_redundant_subscription_indexes
+
+Revision ID: e5f3a9b27d04
+Revises: c2a85e47b19f
+Create Date: 2026-10-16 11:41:52.370218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f3a9b27d04'
+down_revision: Union[str, Sequence[str], None] = 'c2a85e47b19f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Both columns are UNIQUE, which already maintains a b-tree on them
+    op.drop_index('idx_subscriptions_customer', table_name='subscriptions', if_exists=True)
+    op.drop_index('idx_subscriptions_user', table_name='subscriptions', if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('idx_subscriptions_user', 'subscriptions', ['user_id'], unique=False)
+    op.create_index('idx_subscriptions_customer', 'subscriptions', ['stripe_customer_id'], unique=False)
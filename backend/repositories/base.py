@@ -12,13 +12,50 @@ Usage:
     repo = PostRepository(db, user_id="user_123")
     posts = await repo.get_all()  # Automatically filters by user_id
 """
-from typing import Any, Optional, List, Dict, Union
-from sqlalchemy import Table, select, insert, update, delete, and_, text
-from sqlalchemy.sql import Select
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Optional, List, Dict, Tuple, Union
+from sqlalchemy import Table, select, insert, update, delete, and_, bindparam, func, literal_column
 from sqlalchemy.dialects import postgresql
+import logging
 import structlog
 
 logger = structlog.get_logger(__name__)
+# structlog is routed through stdlib logging (filter_by_level), so the stdlib
+# level is what decides whether debug events are emitted
+_stdlib_logger = logging.getLogger(__name__)
+
+# Compile to PostgreSQL-style $1, $2 placeholders so queries follow the same
+# convention as the rest of the codebase (and DatabaseWrapper's SQLite shim).
+_DIALECT = postgresql.dialect(paramstyle="numeric_dollar")
+
+
+# Per-request cache of get_by_id rows keyed by (table, id, user_id).
+# None outside a request scope, so background jobs always hit the database.
+_row_cache: ContextVar[Optional[dict]] = ContextVar("repository_row_cache", default=None)
+
+
+@contextmanager
+def request_row_cache():
+    """
+    Scope a fresh get_by_id row cache to one unit of work (e.g. a request).
+    
+    Usage:
+        with request_row_cache():
+            await handle_request()
+    """
+    token = _row_cache.set({})
+    try:
+        yield
+    finally:
+        _row_cache.reset(token)
+
+
+@lru_cache(maxsize=None)
+def _column_keys(table: Table) -> frozenset:
+    """Column names of a table, computed once per table."""
+    return frozenset(table.c.keys())
 
 
 class BaseRepository:
@@ -33,12 +70,20 @@ class BaseRepository:
     - Automatic user_id enforcement (multi-tenant isolation)
     - Input sanitization through SQLAlchemy's query builder
     
+    PERFORMANCE:
+    Statements are built with bindparam() placeholders and compiled once per
+    query shape; the SQL text is cached on the class and reused for every
+    later call with the same shape, so hot paths skip SQLAlchemy entirely.
+    
     Attributes:
         db: Database wrapper instance
         user_id: Current user's ID (used for all queries)
         table: SQLAlchemy Table object for this repository
     """
     
+    # (table, operation, *shape) -> (sql_text, bind param names in order)
+    _compiled_cache: Dict[tuple, Tuple[str, Tuple[str, ...]]] = {}
+    
     def __init__(self, db, user_id: str, table: Table):
         """
         Initialize repository with database and user context.
@@ -51,61 +96,77 @@ class BaseRepository:
         self.db = db
         self.user_id = user_id
         self.table = table
-        self._log = logger.bind(
+    
+    @cached_property
+    def _log(self):
+        """Logger bound to this repository; built on first use."""
+        user_id = self.user_id
+        return logger.bind(
             repository=self.__class__.__name__,
             user_id=user_id[:8] + "..." if user_id and len(user_id) > 8 else user_id
         )
     
     def _user_filter(self):
-        """Get the base user_id filter condition."""
-        return self.table.c.user_id == self.user_id
+        """Get the base user_id filter condition (bound as :user_id)."""
+        return self.table.c.user_id == bindparam("user_id")
     
-    async def _execute_query(
-        self, 
-        stmt, 
-        fetch_mode: str = "all",
-        operation: str = "query"
+    def _filter_columns(self, filters: Dict[str, Any]) -> Tuple[str, ...]:
+        """Known column names in filters, sorted (unknown names are ignored)."""
+        columns = _column_keys(self.table)
+        return tuple(sorted(c for c in filters if c in columns))
+    
+    def _filter_conditions(self, filter_cols: Tuple[str, ...]) -> list:
+        """user_id filter plus one bound equality per filter column (as :f_<column>)."""
+        # SQLAlchemy handles parameterization
+        return [self._user_filter()] + [
+            self.table.c[column] == bindparam(f"f_{column}") for column in filter_cols
+        ]
+    
+    def _forget_row(self, record_id: int) -> None:
+        """Drop a record from the per-request row cache (after update/delete)."""
+        cache = _row_cache.get()
+        if cache is not None:
+            cache.pop((self.table.name, record_id, self.user_id), None)
+    
+    def _id_and_user_filter(self):
+        """Get the record id + user_id filter condition (bound as :id, :user_id)."""
+        return and_(self.table.c.id == bindparam("id"), self._user_filter())
+    
+    async def _run(
+        self,
+        query_text: str,
+        values: list,
+        fetch_mode: str,
+        operation: str
     ) -> Union[List[Dict], Optional[Dict], int, bool]:
-        """
-        Execute a parameterized query safely.
-        
-        SECURITY: This method compiles SQLAlchemy statements with proper
-        parameter binding, preventing SQL injection attacks.
-        
-        Args:
-            stmt: SQLAlchemy statement object
-            fetch_mode: "all", "one", "execute", or "scalar"
-            operation: Description for logging
-            
-        Returns:
-            Query results based on fetch_mode
-        """
+        """Execute compiled SQL text with positional values."""
         try:
-            # Compile the statement to get SQL and parameters separately
-            # This is the SECURE way - parameters are passed separately
-            compiled = stmt.compile(dialect=postgresql.dialect())
-            query_text = str(compiled)
-            params = compiled.params
-            
-            self._log.debug(
-                "executing_query",
-                operation=operation,
-                fetch_mode=fetch_mode,
-                # Don't log sensitive parameter values in production
-                param_count=len(params) if params else 0
-            )
+            # Skip building the event entirely when debug logging is off
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                self._log.debug(
+                    "executing_query",
+                    operation=operation,
+                    fetch_mode=fetch_mode,
+                    # Don't log sensitive parameter values in production
+                    param_count=len(values)
+                )
             
             if fetch_mode == "all":
-                result = await self.db.fetch_all(query=query_text, values=params)
+                result = await self.db.fetch_all(query_text, values)
                 return [dict(row) for row in result] if result else []
+            elif fetch_mode == "records":
+                # Raw driver rows (read-only mappings), no per-row dict copy
+                result = await self.db.fetch_all(query_text, values)
+                return result or []
             elif fetch_mode == "one":
-                result = await self.db.fetch_one(query=query_text, values=params)
+                # Single-row reads (get_by_id, exists) use a prepared statement
+                result = await self.db.prepared_fetch_one(query_text, values)
                 return dict(result) if result else None
             elif fetch_mode == "scalar":
-                result = await self.db.fetch_one(query=query_text, values=params)
+                result = await self.db.fetch_one(query_text, values)
                 return result[0] if result else 0
             else:  # execute
-                result = await self.db.execute(query=query_text, values=params)
+                result = await self.db.execute(query_text, values)
                 return result
                 
         except Exception as e:
@@ -117,37 +178,133 @@ class BaseRepository:
             )
             raise
     
-    async def get_all(self, order_by=None, limit: int = None, **filters) -> List[Dict]:
+    async def _execute_query(
+        self, 
+        stmt, 
+        fetch_mode: str = "all",
+        operation: str = "query"
+    ) -> Union[List[Dict], Optional[Dict], int, bool]:
         """
-        Get all records for current user with optional filtering.
+        Execute a one-off parameterized statement safely.
+        
+        SECURITY: This method compiles SQLAlchemy statements with proper
+        parameter binding, preventing SQL injection attacks.
+        
+        Prefer _cached_execute for repeated query shapes; this compiles
+        the statement on every call.
         
         Args:
-            order_by: Column or list of columns for ordering
-            limit: Maximum number of records to return
-            **filters: Additional column filters (e.g., status='published')
+            stmt: SQLAlchemy statement object
+            fetch_mode: "all", "records", "one", "execute", or "scalar"
+            operation: Description for logging
             
         Returns:
-            List of record dictionaries
+            Query results based on fetch_mode
         """
-        stmt = select(self.table).where(self._user_filter())
-        
-        # Apply additional filters (SQLAlchemy handles parameterization)
-        for column, value in filters.items():
-            if hasattr(self.table.c, column):
-                stmt = stmt.where(getattr(self.table.c, column) == value)
+        # Compile the statement to get SQL and parameters separately
+        # This is the SECURE way - parameters are passed separately
+        compiled = stmt.compile(dialect=_DIALECT)
+        params = compiled.params
+        values = [params[name] for name in compiled.positiontup]
+        return await self._run(str(compiled), values, fetch_mode, operation)
+    
+    async def _cached_execute(
+        self,
+        shape: tuple,
+        build: Callable[[], Any],
+        params: Dict[str, Any],
+        fetch_mode: str,
+        operation: str
+    ) -> Union[List[Dict], Optional[Dict], int, bool]:
+        """
+        Execute a statement whose compiled SQL is cached by query shape.
         
-        # Apply ordering
-        if order_by is not None:
-            if hasattr(order_by, '__iter__') and not isinstance(order_by, str):
-                stmt = stmt.order_by(*order_by)
-            else:
-                stmt = stmt.order_by(order_by)
+        Args:
+            shape: Everything that changes the SQL text (never values)
+            build: Builds the statement with bindparam() placeholders;
+                   only called on a cache miss
+            params: Bind values keyed by bindparam name
+            fetch_mode: "all", "records", "one", "execute", or "scalar"
+            operation: Description for logging
+            
+        Returns:
+            Query results based on fetch_mode
+        """
+        query_text, values = self._compile_cached(shape, build, params, operation)
+        return await self._run(query_text, values, fetch_mode, operation)
+    
+    def _compile_cached(
+        self,
+        shape: tuple,
+        build: Callable[[], Any],
+        params: Dict[str, Any],
+        operation: str
+    ) -> Tuple[str, list]:
+        """Get (sql_text, positional values), compiling on a cache miss only."""
+        key = (self.table.name, operation, *shape)
+        cached = self._compiled_cache.get(key)
+        if cached is None:
+            compiled = build().compile(dialect=_DIALECT)
+            cached = (str(compiled), tuple(compiled.positiontup))
+            self._compiled_cache[key] = cached
+        
+        query_text, names = cached
+        return query_text, [params[name] for name in names]
+    
+    def _select_all(self, order_by, limit: Optional[int], filters: Dict[str, Any]):
+        """Get (shape, build, params) for a filtered/ordered select of the user's rows."""
+        filter_cols = self._filter_columns(filters)
+        
+        if order_by is None:
+            order_cols = ()
+        elif hasattr(order_by, '__iter__') and not isinstance(order_by, str):
+            order_cols = tuple(order_by)
+        else:
+            order_cols = (order_by,)
+        
+        def build():
+            # One where()/order_by()/limit() each instead of a clone per filter
+            return select(self.table).where(
+                *self._filter_conditions(filter_cols)
+            ).order_by(
+                *order_cols
+            ).limit(
+                bindparam("limit") if limit is not None else None
+            )
         
-        # Apply limit (as integer, safe from injection)
+        params = {"user_id": self.user_id}
+        params.update((f"f_{column}", filters[column]) for column in filter_cols)
         if limit is not None:
-            stmt = stmt.limit(int(limit))
+            # Apply limit (as integer, safe from injection)
+            params["limit"] = int(limit)
         
-        return await self._execute_query(stmt, fetch_mode="all", operation="get_all")
+        # Ordering is part of the SQL text, so it is part of the shape
+        shape = (filter_cols, tuple(str(o) for o in order_cols), limit is not None)
+        return shape, build, params
+    
+    async def get_all(
+        self,
+        order_by=None,
+        limit: int = None,
+        records: bool = False,
+        **filters
+    ) -> List[Dict]:
+        """
+        Get all records for current user with optional filtering.
+        
+        Args:
+            order_by: Column or list of columns for ordering
+            limit: Maximum number of records to return
+            records: Return raw driver rows (read-only mappings supporting
+                     row["column"]) instead of copying each row into a dict
+            **filters: Additional column filters (e.g., status='published')
+            
+        Returns:
+            List of record dictionaries (or raw rows if records=True)
+        """
+        shape, build, params = self._select_all(order_by, limit, filters)
+        fetch_mode = "records" if records else "all"
+        return await self._cached_execute(shape, build, params, fetch_mode=fetch_mode, operation="get_all")
     
     async def get_by_id(self, record_id: int) -> Optional[Dict]:
         """
@@ -162,13 +319,25 @@ class BaseRepository:
         # Ensure record_id is an integer (type safety)
         record_id = int(record_id)
         
-        stmt = select(self.table).where(
-            and_(
-                self.table.c.id == record_id,
-                self._user_filter()
-            )
+        # Repeat lookups within one request are served from the row cache
+        cache = _row_cache.get()
+        key = (self.table.name, record_id, self.user_id)
+        if cache is not None and key in cache:
+            return dict(cache[key])
+        
+        row = await self._cached_execute(
+            (),
+            lambda: select(self.table).where(self._id_and_user_filter()),
+            {"id": record_id, "user_id": self.user_id},
+            fetch_mode="one",
+            operation="get_by_id"
         )
-        return await self._execute_query(stmt, fetch_mode="one", operation="get_by_id")
+        
+        if cache is not None and row is not None:
+            cache[key] = row
+            # Callers get a copy so they can't mutate the cached row
+            return dict(row)
+        return row
     
     async def create(self, **data) -> int:
         """
@@ -185,10 +354,17 @@ class BaseRepository:
         
         # Remove any None values to let DB defaults work
         clean_data = {k: v for k, v in data.items() if v is not None}
-        
-        stmt = insert(self.table).values(**clean_data).returning(self.table.c.id)
-        
-        result = await self._execute_query(stmt, fetch_mode="scalar", operation="create")
+        columns = tuple(sorted(clean_data))
+        
+        result = await self._cached_execute(
+            columns,
+            lambda: insert(self.table).values(
+                {c: bindparam(f"v_{c}") for c in columns}
+            ).returning(self.table.c.id),
+            {f"v_{c}": clean_data[c] for c in columns},
+            fetch_mode="scalar",
+            operation="create"
+        )
         
         self._log.info("record_created", record_id=result)
         return result
@@ -214,14 +390,20 @@ class BaseRepository:
             self._log.warning("update_skipped_no_data", record_id=record_id)
             return False
         
-        stmt = update(self.table).where(
-            and_(
-                self.table.c.id == record_id,
-                self._user_filter()
-            )
-        ).values(**clean_data)
-        
-        result = await self._execute_query(stmt, fetch_mode="execute", operation="update")
+        columns = tuple(sorted(clean_data))
+        params = {f"v_{c}": clean_data[c] for c in columns}
+        params.update(id=record_id, user_id=self.user_id)
+        
+        result = await self._cached_execute(
+            columns,
+            lambda: update(self.table).where(self._id_and_user_filter()).values(
+                {c: bindparam(f"v_{c}") for c in columns}
+            ),
+            params,
+            fetch_mode="execute",
+            operation="update"
+        )
+        self._forget_row(record_id)
         
         success = result is not None
         if success:
@@ -241,14 +423,14 @@ class BaseRepository:
         # Type safety
         record_id = int(record_id)
         
-        stmt = delete(self.table).where(
-            and_(
-                self.table.c.id == record_id,
-                self._user_filter()
-            )
+        result = await self._cached_execute(
+            (),
+            lambda: delete(self.table).where(self._id_and_user_filter()),
+            {"id": record_id, "user_id": self.user_id},
+            fetch_mode="execute",
+            operation="delete"
         )
-        
-        result = await self._execute_query(stmt, fetch_mode="execute", operation="delete")
+        self._forget_row(record_id)
         
         success = result is not None
         if success:
@@ -265,14 +447,16 @@ class BaseRepository:
         Returns:
             Count of matching records
         """
-        from sqlalchemy import func
-        stmt = select(func.count()).select_from(self.table).where(self._user_filter())
+        filter_cols = self._filter_columns(filters)
         
-        for column, value in filters.items():
-            if hasattr(self.table.c, column):
-                stmt = stmt.where(getattr(self.table.c, column) == value)
+        def build():
+            return select(func.count()).select_from(self.table).where(
+                *self._filter_conditions(filter_cols)
+            )
         
-        return await self._execute_query(stmt, fetch_mode="scalar", operation="count")
+        params = {"user_id": self.user_id}
+        params.update((f"f_{column}", filters[column]) for column in filter_cols)
+        return await self._cached_execute(filter_cols, build, params, fetch_mode="scalar", operation="count")
     
     async def exists(self, record_id: int) -> bool:
         """
@@ -284,17 +468,14 @@ class BaseRepository:
         Returns:
             True if record exists and belongs to user
         """
-        record_id = int(record_id)
-        
-        from sqlalchemy import func, exists as sql_exists
-        
-        subquery = select(self.table.c.id).where(
-            and_(
-                self.table.c.id == record_id,
-                self._user_filter()
-            )
-        ).exists()
-        
-        stmt = select(subquery)
-        result = await self._execute_query(stmt, fetch_mode="scalar", operation="exists")
-        return bool(result)
+        # SELECT 1 ... LIMIT 1: no EXISTS wrapper, just a row-or-no-row check
+        row = await self._cached_execute(
+            (),
+            lambda: select(literal_column("1")).select_from(self.table).where(
+                self._id_and_user_filter()
+            ).limit(bindparam("limit")),
+            {"id": int(record_id), "user_id": self.user_id, "limit": 1},
+            fetch_mode="one",
+            operation="exists"
+        )
+        return row is not None
@@ -6,12 +6,70 @@ Extends BaseRepository with post-specific query methods.
 """
 from typing import Optional, List, Dict
 from sqlalchemy import desc
+import json
 import time
 
 from .base import BaseRepository
 from database.schema import post_history
 
 
+# get_recent_published: published posts since $2
+_RECENT_PUBLISHED_SQL = """
+    SELECT * FROM post_history 
+    WHERE user_id = $1 
+    AND status = 'published' 
+    AND published_at >= $2
+    ORDER BY published_at DESC
+"""
+
+# get_stats: counts per status (NULL counts as draft) plus the grand total
+_STATS_SQL = """
+    SELECT 
+        COALESCE(status, 'draft') as status,
+        COUNT(*) as count,
+        CAST(SUM(COUNT(*)) OVER () AS BIGINT) as total
+    FROM post_history
+    WHERE user_id = $1
+    GROUP BY COALESCE(status, 'draft')
+"""
+
+# get_bot_stats: counts per status for bot-generated posts
+_BOT_STATS_SQL = """
+    SELECT 
+        status,
+        COUNT(*) as count
+    FROM post_history
+    WHERE user_id = $1 AND post_type = 'bot'
+    GROUP BY status
+"""
+
+# get_today_count: posts created since midnight UTC, as computed by the
+# database so the boundary never depends on the app server's clock. This is
+# the only definition of "today" for post counts; reuse it rather than
+# deriving midnight in Python.
+_TODAY_COUNT_SQL = """
+    SELECT COUNT(*) FROM post_history
+    WHERE user_id = $1
+      AND created_at >= EXTRACT(EPOCH FROM date_trunc('day', NOW() AT TIME ZONE 'UTC'))::bigint
+"""
+
+# SQLite (local development) has no date_trunc
+_TODAY_COUNT_SQLITE_SQL = """
+    SELECT COUNT(*) FROM post_history
+    WHERE user_id = $1
+      AND created_at >= CAST(strftime('%s', 'now', 'start of day') AS INTEGER)
+"""
+
+# Statuses always present in get_stats(), even with no posts
+_EMPTY_STATS = {
+    'total': 0,
+    'draft': 0,
+    'published': 0,
+    'scheduled': 0,
+    'failed': 0
+}
+
+
 class PostRepository(BaseRepository):
     """
     Repository for post_history table operations.
@@ -35,7 +93,8 @@ class PostRepository(BaseRepository):
             status: Filter by status ('draft', 'published', etc.)
             
         Returns:
-            List of post dictionaries ordered by created_at DESC
+            List of read-only post rows ordered by created_at DESC
+            (access columns with row['status']; use dict(row) to copy)
         """
         filters = {}
         if status:
@@ -44,6 +103,7 @@ class PostRepository(BaseRepository):
         return await self.get_all(
             order_by=desc(post_history.c.created_at),
             limit=limit,
+            records=True,
             **filters
         )
     
@@ -59,14 +119,7 @@ class PostRepository(BaseRepository):
         """
         cutoff = int(time.time()) - (days * 24 * 60 * 60)
         # Using raw query for complex date comparison
-        query = f"""
-            SELECT * FROM post_history 
-            WHERE user_id = $1 
-            AND status = 'published' 
-            AND published_at >= $2
-            ORDER BY published_at DESC
-        """
-        result = await self.db.fetch_all(query, [self.user_id, cutoff])
+        result = await self.db.fetch_all(_RECENT_PUBLISHED_SQL, [self.user_id, cutoff])
         return [dict(row) for row in result] if result else []
     
     async def get_stats(self) -> Dict:
@@ -76,32 +129,13 @@ class PostRepository(BaseRepository):
         Returns:
             Dictionary with counts by status
         """
-        query = """
-            SELECT 
-                status,
-                COUNT(*) as count
-            FROM post_history
-            WHERE user_id = $1
-            GROUP BY status
-        """
-        result = await self.db.fetch_all(query, [self.user_id])
+        result = await self.db.fetch_all(_STATS_SQL, [self.user_id])
         
-        stats = {
-            'total': 0,
-            'draft': 0,
-            'published': 0,
-            'scheduled': 0,
-            'failed': 0
+        return {
+            **_EMPTY_STATS,
+            **{row['status']: row['count'] for row in result},
+            'total': result[0]['total'] if result else 0,
         }
-        
-        if result:
-            for row in result:
-                status = row['status'] or 'draft'
-                count = row['count']
-                stats[status] = count
-                stats['total'] += count
-        
-        return stats
 
     async def get_bot_stats(self) -> Dict:
         """
@@ -110,15 +144,7 @@ class PostRepository(BaseRepository):
         Returns:
             Dictionary with generated and published counts
         """
-        query = """
-            SELECT 
-                status,
-                COUNT(*) as count
-            FROM post_history
-            WHERE user_id = $1 AND post_type = 'bot'
-            GROUP BY status
-        """
-        result = await self.db.fetch_all(query, [self.user_id])
+        result = await self.db.fetch_all(_BOT_STATS_SQL, [self.user_id])
         
         stats = {
             'generated': 0,
@@ -156,8 +182,6 @@ class PostRepository(BaseRepository):
         Returns:
             ID of the created post
         """
-        import json
-        
         data = {
             'post_content': post_content,
             'post_type': post_type,
@@ -200,16 +224,6 @@ class PostRepository(BaseRepository):
         Returns:
             Number of posts created today
         """
-        # Start of today (midnight UTC)
-        import time
-        from datetime import datetime, timezone
-        
-        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-        today_ts = int(today.timestamp())
-        
-        query = """
-            SELECT COUNT(*) FROM post_history
-            WHERE user_id = $1 AND created_at >= $2
-        """
-        result = await self.db.fetch_one(query, [self.user_id, today_ts])
+        sql = _TODAY_COUNT_SQLITE_SQL if self.db.is_sqlite else _TODAY_COUNT_SQL
+        result = await self.db.fetch_one(sql, [self.user_id])
         return result[0] if result else 0
@@ -11,6 +11,30 @@ import json
 
 from .base import BaseRepository
 from database.schema import user_settings
+from services.user_settings import invalidate_user_settings_cache
+
+
+# get_settings: the user's settings row
+_GET_SETTINGS_SQL = """
+    SELECT * FROM user_settings WHERE user_id = $1
+"""
+
+# save_settings: single round-trip upsert. Omitted (None) fields fall back to
+# the column defaults on insert and keep their stored value on update.
+_UPSERT_SETTINGS_SQL = """
+    INSERT INTO user_settings 
+    (user_id, github_username, preferences, onboarding_complete, subscription_tier, created_at, updated_at)
+    VALUES ($1, $2, COALESCE($3, '{}'), COALESCE($4, 0), COALESCE($5, 'free'), $6, $6)
+    ON CONFLICT (user_id) DO UPDATE
+    SET github_username = COALESCE($2, user_settings.github_username),
+        preferences = COALESCE($3, user_settings.preferences),
+        onboarding_complete = COALESCE($4, user_settings.onboarding_complete),
+        subscription_tier = COALESCE($5, user_settings.subscription_tier),
+        updated_at = $6
+"""
+
+# Marks the per-instance settings cache as not yet loaded (None means "no row")
+_UNLOADED = object()
 
 
 class SettingsRepository(BaseRepository):
@@ -23,19 +47,26 @@ class SettingsRepository(BaseRepository):
     
     def __init__(self, db, user_id: str):
         super().__init__(db, user_id, user_settings)
+        # Instances are request-scoped (see dependencies.get_settings_repository),
+        # so the row is loaded at most once per request.
+        self._settings_cache = _UNLOADED
     
     async def get_settings(self) -> Optional[Dict]:
         """
         Get the current user's settings.
         
+        The row is cached on this instance, so the helper getters below
+        share a single query.
+        
         Returns:
             Settings dictionary or None if not found
         """
-        query = """
-            SELECT * FROM user_settings WHERE user_id = $1
-        """
-        result = await self.db.fetch_one(query, [self.user_id])
+        if self._settings_cache is not _UNLOADED:
+            return self._settings_cache
+        
+        result = await self.db.fetch_one(_GET_SETTINGS_SQL, [self.user_id])
         
+        settings = None
         if result:
             settings = dict(result)
             # Parse JSON preferences
@@ -44,8 +75,9 @@ class SettingsRepository(BaseRepository):
                     settings['preferences'] = json.loads(settings['preferences'])
                 except json.JSONDecodeError:
                     settings['preferences'] = {}
-            return settings
-        return None
+        
+        self._settings_cache = settings
+        return settings
     
     async def save_settings(self, **data) -> bool:
         """
@@ -61,47 +93,19 @@ class SettingsRepository(BaseRepository):
         if 'preferences' in data and isinstance(data['preferences'], dict):
             data['preferences'] = json.dumps(data['preferences'])
         
-        # Check if settings exist
-        existing = await self.get_settings()
-        
-        if existing:
-            # Update existing
-            data['updated_at'] = int(time.time())
-            query = """
-                UPDATE user_settings 
-                SET github_username = COALESCE($2, github_username),
-                    preferences = COALESCE($3, preferences),
-                    onboarding_complete = COALESCE($4, onboarding_complete),
-                    subscription_tier = COALESCE($5, subscription_tier),
-                    updated_at = $6
-                WHERE user_id = $1
-            """
-            await self.db.execute(query, [
-                self.user_id,
-                data.get('github_username'),
-                data.get('preferences'),
-                data.get('onboarding_complete'),
-                data.get('subscription_tier'),
-                data['updated_at']
-            ])
-        else:
-            # Create new
-            now = int(time.time())
-            query = """
-                INSERT INTO user_settings 
-                (user_id, github_username, preferences, onboarding_complete, subscription_tier, created_at, updated_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7)
-            """
-            await self.db.execute(query, [
-                self.user_id,
-                data.get('github_username'),
-                data.get('preferences', '{}'),
-                data.get('onboarding_complete', 0),
-                data.get('subscription_tier', 'free'),
-                now,
-                now
-            ])
+        now = int(time.time())
+        await self.db.execute(_UPSERT_SETTINGS_SQL, [
+            self.user_id,
+            data.get('github_username'),
+            data.get('preferences'),
+            data.get('onboarding_complete'),
+            data.get('subscription_tier'),
+            now
+        ])
         
+        # Next read must see the saved values
+        self._settings_cache = _UNLOADED
+        invalidate_user_settings_cache(self.user_id)
         return True
     
     async def get_github_username(self) -> Optional[str]:
@@ -8,13 +8,25 @@ SECURITY NOTES:
 - State parameter prevents CSRF attacks
 """
 
+import asyncio
 import os
-import base64
-from uuid import uuid4
-from fastapi import APIRouter
+import secrets
+from fastapi import APIRouter, Query
 from fastapi.responses import RedirectResponse
 from pydantic import BaseModel
-from typing import Optional
+import httpx
+from typing import Annotated
+
+from schemas import OAuthCallbackQuery
+from services.http_client import get_async_http
+from services.oauth_state import (
+    BACKEND_CALLBACK_URI,
+    DEFAULT_FRONTEND_REDIRECT,
+    decode_state,
+    encode_state,
+    error_code,
+    frontend_redirect,
+)
 
 # =============================================================================
 # ROUTER SETUP
@@ -34,6 +46,11 @@ except ImportError:
     get_user_settings = None
     save_user_settings = None
 
+try:
+    from services.token_store import save_github_token
+except ImportError:
+    save_github_token = None
+
 try:
     from services.auth_service import (
         get_authorize_url,
@@ -84,18 +101,8 @@ async def linkedin_start(redirect_uri: str, user_id: str = None):
     If user_id is provided, uses that user's saved LinkedIn credentials.
     Otherwise falls back to global env vars.
     """
-    # Generate random state
-    random_state = uuid4().hex
-    
-    # Store user_id and frontend redirect_uri in state
-    safe_redirect = redirect_uri or "http://localhost:3000/settings"
-    safe_user_id = user_id or ""
-    
-    state_payload = f"{safe_user_id}|{safe_redirect}|{random_state}"
-    state = base64.urlsafe_b64encode(state_payload.encode()).decode()
-    
-    # The callback URI registered in LinkedIn Developer Portal MUST match this
-    backend_callback_uri = "http://localhost:8000/auth/linkedin/callback"
+    # Format: user_id|frontend_redirect_uri|random_state
+    state = encode_state(user_id, redirect_uri)
     
     # Try to use per-user credentials if user_id provided
     if user_id and get_user_settings:
@@ -104,64 +111,37 @@ async def linkedin_start(redirect_uri: str, user_id: str = None):
             if settings and settings.get('linkedin_client_id') and get_authorize_url_for_user:
                 url = get_authorize_url_for_user(
                     settings['linkedin_client_id'],
-                    backend_callback_uri,
+                    BACKEND_CALLBACK_URI,
                     state
                 )
                 return RedirectResponse(url)
-        except Exception as e:
-            print(f"Failed to get user settings: {e}")
+        except Exception:
+            logger.error("user_settings_lookup_failed", user_id=user_id, exc_info=True)
     
     # Fallback to global credentials
     if not get_authorize_url:
         return {"error": "OAuth service not available"}
         
-    url = get_authorize_url(backend_callback_uri, state)
+    url = get_authorize_url(BACKEND_CALLBACK_URI, state)
     return RedirectResponse(url)
 
 
 @router.get('/linkedin/callback')
-async def linkedin_callback(code: str = None, state: str = None, redirect_uri: str = None):
+async def linkedin_callback(query: Annotated[OAuthCallbackQuery, Query()]):
     """
     Exchange code for token and redirect back to frontend.
     
-    Redirects to: {frontend_redirect}?linkedin_success=true&linkedin_urn=...
-    Or on error: {frontend_redirect}?linkedin_success=false&error=...
+    Redirects to: {redirect_to}?linkedin_success=true&linkedin_urn=...
+    Or on error: {redirect_to}?linkedin_success=false&error=...
     """
-    # Default redirect if decoding fails
-    frontend_redirect = "http://localhost:3000/settings"
-    user_id = None
+    code, state = query.code, query.state
     
-    backend_callback_uri = "http://localhost:8000/auth/linkedin/callback"
-    
-    # Decode state to get user_id and frontend_redirect
-    if state:
-        try:
-            decoded = base64.urlsafe_b64decode(state).decode()
-            parts = decoded.split('|')
-            if len(parts) >= 2:
-                user_id_part = parts[0]
-                redirect_part = parts[1]
-                
-                if user_id_part:
-                    user_id = user_id_part
-                if redirect_part and (redirect_part.startswith('http') or redirect_part.startswith('/')):
-                    frontend_redirect = redirect_part
-                    if 'localhost:8000' in frontend_redirect:
-                        frontend_redirect = "http://localhost:3000/settings"
-            
-            # Legacy state support
-            elif ':' in decoded:
-                parts = decoded.split(':', 1)
-                if parts[0]: user_id = parts[0]
+    user_id, redirect_to = (
+        decode_state(state) if state else (None, DEFAULT_FRONTEND_REDIRECT)
+    )
 
-        except Exception as e:
-            print(f"Error decoding state: {e}")
-            if state and ':' in state:
-                parts = state.split(':', 1)
-                if parts[0]: user_id = parts[0]
-    
     if not code:
-        return RedirectResponse(f"{frontend_redirect}?linkedin_success=false&error=missing_code")
+        return frontend_redirect(redirect_to, linkedin_success='false', error='missing_code')
     
     try:
         result = None
@@ -174,40 +154,38 @@ async def linkedin_callback(code: str = None, state: str = None, redirect_uri: s
                     settings['linkedin_client_id'],
                     settings['linkedin_client_secret'],
                     code,
-                    backend_callback_uri,
+                    BACKEND_CALLBACK_URI,
                     user_id
                 )
-                if save_user_settings:
-                    settings['linkedin_user_urn'] = result.linkedin_user_urn
-                    await save_user_settings(user_id, settings)
+                # The URN is persisted with the token (accounts table) by the exchange
         
         # Fallback to global credentials
         if not result:
             if not exchange_code_for_token:
-                return RedirectResponse(f"{frontend_redirect}?linkedin_success=false&error=oauth_not_available")
+                return frontend_redirect(redirect_to, linkedin_success='false', error='oauth_not_available')
             
-            result = await exchange_code_for_token(code, backend_callback_uri, user_id)
+            result = await exchange_code_for_token(code, BACKEND_CALLBACK_URI, user_id)
         
         linkedin_urn = result.linkedin_user_urn if hasattr(result, 'linkedin_user_urn') else result.get("linkedin_user_urn", "")
-        return RedirectResponse(f"{frontend_redirect}?linkedin_success=true&linkedin_urn={linkedin_urn}")
+        return frontend_redirect(redirect_to, linkedin_success='true', linkedin_urn=linkedin_urn)
     
     except AuthConfigurationError as e:
         logger.error("oauth_config_error", user_id=user_id, error=str(e))
-        return RedirectResponse(f"{frontend_redirect}?linkedin_success=false&error=oauth_not_configured")
+        return frontend_redirect(redirect_to, linkedin_success='false', error='oauth_not_configured')
     
     except AuthProviderError as e:
         logger.error("oauth_provider_error", user_id=user_id, error=str(e), status_code=e.status_code)
-        return RedirectResponse(f"{frontend_redirect}?linkedin_success=false&error=linkedin_unavailable")
+        return frontend_redirect(redirect_to, linkedin_success='false', error='linkedin_unavailable')
     
     except AuthServiceError as e:
         logger.error("oauth_service_error", user_id=user_id, error=str(e))
-        error_msg = str(e).replace(" ", "_")[:50]
-        return RedirectResponse(f"{frontend_redirect}?linkedin_success=false&error={error_msg}")
+        error_msg = error_code(e)
+        return frontend_redirect(redirect_to, linkedin_success='false', error=error_msg)
         
     except Exception as e:
         logger.exception("oauth_unexpected_error", user_id=user_id)
-        error_msg = str(e).replace(" ", "_")[:50]
-        return RedirectResponse(f"{frontend_redirect}?linkedin_success=false&error={error_msg}")
+        error_msg = error_code(e)
+        return frontend_redirect(redirect_to, linkedin_success='false', error=error_msg)
 
 
 # =============================================================================
@@ -224,7 +202,7 @@ def github_oauth_start(redirect_uri: str, user_id: str):
     if not GITHUB_CLIENT_ID:
         return {"error": "GitHub OAuth not configured"}
     
-    state = f"{user_id}:{uuid4().hex}"
+    state = f"{user_id}:{secrets.token_urlsafe(16)}"
     scopes = "read:user,repo"
     
     auth_url = (
@@ -252,22 +230,16 @@ async def github_oauth_callback(code: str = None, state: str = None, redirect_ur
     # Extract user_id from state
     user_id = None
     if state and ':' in state:
-        parts = state.split(':', 1)
-        user_id = parts[0]
+        user_id = state.partition(':')[0]
     
     if not user_id:
         return {"error": "missing user_id in state", "status": "failed"}
     
-    import requests
-    from requests.exceptions import RequestException, Timeout, ConnectionError
-    
-    # SSL verification setting (default to True for security)
-    ssl_verify = os.getenv('SSL_VERIFY', 'true').lower() != 'false'
-    request_timeout = int(os.getenv('AUTH_REQUEST_TIMEOUT', '15'))
-    
     try:
-        # Exchange code for access token
-        token_response = requests.post(
+        # Exchange code for access token (shared async client: non-blocking,
+        # pooled connections; timeout/SSL verify are set on the client)
+        http = get_async_http()
+        token_response = await http.post(
             'https://github.com/login/oauth/access_token',
             data={
                 'client_id': GITHUB_CLIENT_ID,
@@ -275,8 +247,6 @@ async def github_oauth_callback(code: str = None, state: str = None, redirect_ur
                 'code': code,
             },
             headers={'Accept': 'application/json'},
-            timeout=request_timeout,
-            verify=ssl_verify,
         )
         token_response.raise_for_status()
         
@@ -292,15 +262,16 @@ async def github_oauth_callback(code: str = None, state: str = None, redirect_ur
             logger.error("github_no_token", user_id=user_id)
             return {"error": "No access token received", "status": "failed"}
         
-        # Get GitHub username from API
-        user_response = requests.get(
-            'https://api.github.com/user',
-            headers={
-                'Authorization': f'Bearer {access_token}',
-                'Accept': 'application/vnd.github.v3+json'
-            },
-            timeout=request_timeout,
-            verify=ssl_verify,
+        # Get GitHub username from API while loading the user's settings
+        user_response, settings = await asyncio.gather(
+            http.get(
+                'https://api.github.com/user',
+                headers={
+                    'Authorization': f'Bearer {access_token}',
+                    'Accept': 'application/vnd.github.v3+json'
+                },
+            ),
+            get_user_settings(user_id) if get_user_settings else asyncio.sleep(0),
         )
         user_response.raise_for_status()
         
@@ -308,12 +279,11 @@ async def github_oauth_callback(code: str = None, state: str = None, redirect_ur
         github_username = github_user.get('login', '')
         
         # Store the token encrypted
-        from services.token_store import save_github_token
         await save_github_token(user_id, github_username, access_token)
         
         # Also update user settings with username
         if save_user_settings and get_user_settings:
-            settings = await get_user_settings(user_id) or {}
+            settings = settings or {}
             settings['github_username'] = github_username
             await save_user_settings(user_id, settings)
         
@@ -324,15 +294,15 @@ async def github_oauth_callback(code: str = None, state: str = None, redirect_ur
             "github_connected": True
         }
     
-    except Timeout:
+    except httpx.TimeoutException:
         logger.error("github_oauth_timeout", user_id=user_id)
         return {"error": "GitHub API request timed out", "status": "failed"}
     
-    except ConnectionError:
+    except httpx.TransportError:
         logger.error("github_oauth_connection_error", user_id=user_id)
         return {"error": "Unable to connect to GitHub", "status": "failed"}
     
-    except RequestException as e:
+    except httpx.HTTPError as e:
         logger.error("github_oauth_request_error", user_id=user_id, error=str(e))
         return {"error": f"GitHub API error: {str(e)}", "status": "failed"}
     
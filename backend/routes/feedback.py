@@ -7,14 +7,17 @@ and improvement suggestions.
 """
 
 import os
-from fastapi import APIRouter
+from fastapi import APIRouter, BackgroundTasks
 from pydantic import BaseModel
 from typing import Optional
 
+import structlog
+
 # =============================================================================
 # ROUTER SETUP
 # =============================================================================
 router = APIRouter(prefix="/api/feedback", tags=["Feedback"])
+logger = structlog.get_logger(__name__)
 
 # =============================================================================
 # SERVICE IMPORTS
@@ -37,6 +40,21 @@ except ImportError:
     email_service = None
 
 
+# Star strings for ratings 0-5, indexed by rating
+_STARS = tuple('⭐' * i for i in range(6))
+
+# Admin notification sent for each new feedback submission
+_FEEDBACK_EMAIL_TEMPLATE = (
+    "New Beta Feedback Received!\n"
+    "\n"
+    "User ID: {user_id}\n"
+    "Rating: {stars}\n"
+    "Liked: {liked}\n"
+    "Improvements: {improvements}\n"
+    "Suggestions: {suggestions}\n"
+)
+
+
 # =============================================================================
 # REQUEST MODELS
 # =============================================================================
@@ -53,14 +71,14 @@ class FeedbackRequest(BaseModel):
 # ENDPOINTS
 # =============================================================================
 @router.post("/submit")
-async def submit_feedback(req: FeedbackRequest):
+async def submit_feedback(req: FeedbackRequest, background_tasks: BackgroundTasks):
     """Submit user feedback (stored in SQLite and optionally emailed)."""
     if not save_feedback:
         return {"error": "Feedback service not available"}
     
     try:
         # Save to database
-        result = save_feedback(
+        result = await save_feedback(
             user_id=req.user_id,
             rating=req.rating,
             liked=req.liked,
@@ -68,36 +86,35 @@ async def submit_feedback(req: FeedbackRequest):
             suggestions=req.suggestions
         )
         
-        # Also send email notification if email service available
+        # Also send email notification if email service available.
+        # Runs after the response is sent, so SMTP latency never delays the user.
         if email_service and result.get('success'):
-            try:
-                email_body = f"""
-New Beta Feedback Received!
-
-User ID: {req.user_id}
-Rating: {'⭐' * req.rating}
-Liked: {req.liked or 'Not provided'}
-Improvements: {req.improvements}
-Suggestions: {req.suggestions or 'None'}
-                """
-                email_service.send_email(
-                    to_email=os.getenv('ADMIN_EMAIL', 'admin@example.com'),
-                    subject=f"[LinkedIn Bot] New Feedback - {req.rating}⭐",
-                    body=email_body
-                )
-            except Exception as e:
-                print(f"Failed to send feedback email: {e}")
+            # Ratings are 1-5; clamp so unexpected values can't index out of range
+            stars = _STARS[min(max(req.rating, 0), 5)]
+            email_body = _FEEDBACK_EMAIL_TEMPLATE.format_map({
+                'user_id': req.user_id,
+                'stars': stars,
+                'liked': req.liked or 'Not provided',
+                'improvements': req.improvements,
+                'suggestions': req.suggestions or 'None',
+            })
+            background_tasks.add_task(
+                email_service.send_email,
+                to_email=os.getenv('ADMIN_EMAIL', 'admin@example.com'),
+                subject=f"[LinkedIn Bot] New Feedback - {stars}",
+                body=email_body
+            )
         
         return result
     except Exception as e:
-        print(f"Error saving feedback: {e}")
+        logger.exception("feedback_save_failed", user_id=req.user_id)
         return {"success": False, "error": str(e)}
 
 
 @router.get("/status/{user_id}")
-def get_feedback_status(user_id: str):
-    """Check if user has already submitted feedback."""
+async def get_feedback_status(user_id: str):
+    """Check if user has already submitted feedback (cached once true)."""
     if not has_user_submitted_feedback:
         return {"has_submitted": False}
     
-    return {"has_submitted": has_user_submitted_feedback(user_id)}
+    return {"has_submitted": await has_user_submitted_feedback(user_id)}
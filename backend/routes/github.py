@@ -6,12 +6,15 @@ Handles:
 - GitHub disconnect
 - GitHub activity fetching and scanning
 """
+import asyncio
 import os
-from uuid import uuid4
-from fastapi import APIRouter, Depends, HTTPException
+from itertools import islice
+import secrets
+import time
+from types import MappingProxyType
+from fastapi import APIRouter, Depends, HTTPException, Response
 from fastapi.responses import RedirectResponse
-import requests
-from requests.exceptions import RequestException, Timeout, ConnectionError
+import httpx
 import structlog
 
 from schemas import ScanRequest, DisconnectRequest
@@ -19,6 +22,8 @@ from middleware.clerk_auth import require_auth
 from services.github_activity import get_user_activity, get_repo_details
 from services.user_settings import get_user_settings, save_user_settings
 from services.token_store import get_token_by_user_id, save_github_token
+from services.db import get_database
+from services.http_client import get_async_http
 
 logger = structlog.get_logger(__name__)
 
@@ -28,9 +33,25 @@ router = APIRouter(prefix="/api", tags=["github"])
 GITHUB_CLIENT_ID = os.getenv('GITHUB_CLIENT_ID', '')
 GITHUB_CLIENT_SECRET = os.getenv('GITHUB_CLIENT_SECRET', '')
 
-# Security settings
-SSL_VERIFY = os.getenv('SSL_VERIFY', 'true').lower() != 'false'
-REQUEST_TIMEOUT = int(os.getenv('AUTH_REQUEST_TIMEOUT', '15'))
+# Scan activity_type values -> parsed activity 'type'
+_SCAN_TYPE_MAPPING = MappingProxyType({
+    'push': 'push',
+    'pull_request': 'pull_request',
+    'new_repo': 'new_repo',
+    'commits': 'push',  # commits are part of push events
+})
+
+# disconnect_github: fixed SQL text, so asyncpg's per-connection statement
+# cache (DB_STATEMENT_CACHE_SIZE) prepares it once and reuses the plan
+_DISCONNECT_GITHUB_SQL = """
+    UPDATE accounts 
+    SET github_access_token = NULL 
+    WHERE user_id = $1
+"""
+
+# Browser-side reuse of activity/repo lookups while a post is being composed
+# (the service layer already caches GitHub responses for 5-10 minutes)
+GITHUB_CACHE_CONTROL = "private, max-age=120"
 
 
 # =============================================================================
@@ -56,7 +77,7 @@ async def github_oauth_start(redirect_uri: str, user_id: str):
         logger.error("github_oauth_not_configured", user_id=user_id)
         return {"error": "GitHub OAuth not configured"}
     
-    state = f"{user_id}:{uuid4().hex}"
+    state = f"{user_id}:{secrets.token_urlsafe(16)}"
     
     # Request read:user and repo scope for private activity access
     scopes = "read:user,repo"
@@ -88,8 +109,7 @@ async def github_oauth_callback(code: str = None, state: str = None, redirect_ur
     # Extract user_id from state
     user_id = None
     if state and ':' in state:
-        parts = state.split(':', 1)
-        user_id = parts[0]
+        user_id = state.partition(':')[0]
     
     if not user_id:
         logger.warning("github_oauth_missing_user_id")
@@ -100,7 +120,10 @@ async def github_oauth_callback(code: str = None, state: str = None, redirect_ur
     try:
         # Exchange code for access token
         log.debug("github_token_exchange_started")
-        token_response = requests.post(
+        # Shared async client: doesn't block the event loop and reuses
+        # pooled connections to GitHub (timeout/SSL verify set on the client)
+        http = get_async_http()
+        token_response = await http.post(
             'https://github.com/login/oauth/access_token',
             data={
                 'client_id': GITHUB_CLIENT_ID,
@@ -108,8 +131,6 @@ async def github_oauth_callback(code: str = None, state: str = None, redirect_ur
                 'code': code,
             },
             headers={'Accept': 'application/json'},
-            timeout=REQUEST_TIMEOUT,
-            verify=SSL_VERIFY,
         )
         token_response.raise_for_status()
         
@@ -125,15 +146,16 @@ async def github_oauth_callback(code: str = None, state: str = None, redirect_ur
             log.error("github_no_access_token")
             return {"error": "No access token received", "status": "failed"}
         
-        # Get GitHub username from API
-        user_response = requests.get(
-            'https://api.github.com/user',
-            headers={
-                'Authorization': f'Bearer {access_token}',
-                'Accept': 'application/vnd.github.v3+json'
-            },
-            timeout=REQUEST_TIMEOUT,
-            verify=SSL_VERIFY,
+        # Get GitHub username from API while loading the user's settings
+        user_response, settings = await asyncio.gather(
+            http.get(
+                'https://api.github.com/user',
+                headers={
+                    'Authorization': f'Bearer {access_token}',
+                    'Accept': 'application/vnd.github.v3+json'
+                },
+            ),
+            get_user_settings(user_id),
         )
         user_response.raise_for_status()
         
@@ -144,7 +166,7 @@ async def github_oauth_callback(code: str = None, state: str = None, redirect_ur
         await save_github_token(user_id, github_username, access_token)
         
         # Also update user settings with username
-        settings = await get_user_settings(user_id) or {}
+        settings = settings or {}
         settings['github_username'] = github_username
         await save_user_settings(user_id, settings)
         
@@ -155,15 +177,15 @@ async def github_oauth_callback(code: str = None, state: str = None, redirect_ur
             "github_connected": True
         }
     
-    except Timeout:
+    except httpx.TimeoutException:
         log.error("github_oauth_timeout")
         return {"error": "GitHub API request timed out", "status": "failed"}
     
-    except ConnectionError:
+    except httpx.TransportError:
         log.error("github_oauth_connection_error")
         return {"error": "Unable to connect to GitHub", "status": "failed"}
     
-    except RequestException as e:
+    except httpx.HTTPError as e:
         log.error("github_oauth_request_error", error=str(e))
         return {"error": f"GitHub API error: {str(e)}", "status": "failed"}
     
@@ -179,7 +201,7 @@ async def github_oauth_callback(code: str = None, state: str = None, redirect_ur
 @router.post("/disconnect-github")
 async def disconnect_github(
     request: DisconnectRequest,
-    current_user: dict = Depends(require_auth) if require_auth else None
+    current_user: dict = Depends(require_auth)
 ):
     """
     Disconnect a user's GitHub OAuth token (secured - verifies ownership).
@@ -189,15 +211,10 @@ async def disconnect_github(
         raise HTTPException(status_code=403, detail="Cannot disconnect other user's GitHub")
     
     try:
-        from services.db import get_database
         db = get_database()
         
         # Clear only the GitHub token, keep the rest
-        await db.execute("""
-            UPDATE accounts 
-            SET github_access_token = NULL 
-            WHERE user_id = $1
-        """, [request.user_id])
+        await db.execute(_DISCONNECT_GITHUB_SQL, [request.user_id])
         
         return {"success": True, "message": "GitHub disconnected"}
     except Exception as e:
@@ -205,25 +222,29 @@ async def disconnect_github(
 
 
 @router.get("/github/activity/{username}")
-async def github_activity(username: str, limit: int = 10):
+async def github_activity(username: str, response: Response, limit: int = 10):
     """Get GitHub activity for a user"""
     if not get_user_activity:
         return {"error": "GitHub service not available"}
     try:
         activities = get_user_activity(username, limit)
+        response.headers["Cache-Control"] = GITHUB_CACHE_CONTROL
         return {"activities": activities}
     except Exception as e:
         return {"error": str(e)}
 
 
 @router.get("/github/repo/{owner}/{repo}")
-async def github_repo(owner: str, repo: str):
+async def github_repo(owner: str, repo: str, response: Response):
     """Get GitHub repository details"""
     if not get_repo_details:
         return {"error": "GitHub service not available"}
     try:
         repo_info = get_repo_details(f"{owner}/{repo}")
-        return repo_info or {"error": "Repository not found"}
+        if not repo_info:
+            return {"error": "Repository not found"}
+        response.headers["Cache-Control"] = GITHUB_CACHE_CONTROL
+        return repo_info
     except Exception as e:
         return {"error": str(e)}
 
@@ -231,7 +252,7 @@ async def github_repo(owner: str, repo: str):
 @router.post("/github/scan")
 async def scan_github_activity(
     req: ScanRequest,
-    current_user: dict = Depends(require_auth) if require_auth else None
+    current_user: dict = Depends(require_auth)
 ):
     """Scan GitHub for recent activity (secured)
     
@@ -246,14 +267,23 @@ async def scan_github_activity(
     if not get_user_activity:
         return {"error": "GitHub activity service not available"}
     
+    # Settings (tier + GitHub username) and the stored token are independent
+    # lookups - run them together
+    settings, token_data = await asyncio.gather(
+        get_user_settings(req.user_id, cached=True),
+        get_token_by_user_id(req.user_id),
+        return_exceptions=True,
+    )
+    if isinstance(settings, Exception):
+        logger.error("user_settings_lookup_failed", user_id=req.user_id, exc_info=settings)
+        settings = None
+    if isinstance(token_data, Exception):
+        logger.error("user_token_lookup_failed", user_id=req.user_id, exc_info=token_data)
+        token_data = None
+    settings = settings or {}
+    
     # Get user's subscription tier
-    user_tier = 'free'  # Default
-    try:
-        settings = await get_user_settings(req.user_id)
-        if settings:
-            user_tier = settings.get('subscription_tier', 'free')
-    except Exception as e:
-        logger.debug(f"Failed to get user settings for tier: {e}")
+    user_tier = settings.get('subscription_tier', 'free')
     
     # TIER ENFORCEMENT: Force Free tier restrictions
     scan_hours = req.hours
@@ -264,13 +294,7 @@ async def scan_github_activity(
         scan_activity_type = 'all'  # Free tier: No filtering
     
     # Get user's GitHub username from settings
-    github_username = None
-    try:
-        settings = await get_user_settings(req.user_id)
-        if settings:
-            github_username = settings.get('github_username')
-    except Exception as e:
-        logger.error("Error getting user settings", exc_info=True)
+    github_username = settings.get('github_username')
     
     # Fallback to env var
     if not github_username:
@@ -280,59 +304,45 @@ async def scan_github_activity(
         return {"error": "No GitHub username configured", "activities": [], "all_activities": []}
     
     # Get user's GitHub token if available
-    github_token = None
-    try:
-        token_data = await get_token_by_user_id(req.user_id)
-        if token_data:
-            github_token = token_data.get('github_access_token')
-    except Exception as e:
-        logger.error("Error getting user token", exc_info=True)
+    github_token = token_data.get('github_access_token') if token_data else None
 
     try:
         # Get activities (passing user token if available)
         # This will auto-select private or public endpoint based on token presence
         activities = get_user_activity(github_username, limit=30, token=github_token)
         
-        # Filter to recent hours
-        from datetime import datetime, timezone, timedelta
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=scan_hours)
+        # Filter to recent hours (Unix seconds; activities without a parsable
+        # timestamp are kept)
+        cutoff_ts = time.time() - scan_hours * 3600
         
-        all_recent_activities = []
-        for activity in activities:
-            # Check if activity has context (our parsed format)
-            if activity.get('context'):
-                all_recent_activities.append({
-                    'id': activity.get('id'),
-                    'type': activity.get('type'),
-                    'icon': activity.get('icon', '📦'),
-                    'title': activity.get('title'),
-                    'description': activity.get('description'),
-                    'time_ago': activity.get('time_ago'),
-                    'context': activity.get('context'),
-                    'repo': activity.get('repo')
-                })
+        # Only recent activities with context (our parsed format); the parsed
+        # dicts are returned as-is rather than copied field by field
+        all_recent_activities = [
+            a for a in activities
+            if a.get('context') and (a.get('timestamp') is None or a['timestamp'] >= cutoff_ts)
+        ]
         
         # Filter by activity type if specified (and Pro tier)
-        filtered_activities = all_recent_activities
-        if scan_activity_type and scan_activity_type not in ['all', 'generic']:
-            type_mapping = {
-                'push': 'push',
-                'pull_request': 'pull_request',
-                'new_repo': 'new_repo',
-                'commits': 'push'  # commits are part of push events
-            }
-            target_type = type_mapping.get(scan_activity_type, scan_activity_type)
-            filtered_activities = [a for a in all_recent_activities if a.get('type') == target_type]
+        target_type = None
+        if scan_activity_type and scan_activity_type not in ('all', 'generic'):
+            target_type = _SCAN_TYPE_MAPPING.get(scan_activity_type, scan_activity_type)
         
         # FREE TIER LIMIT: Cap at 10 activities (aligns with 10 posts/day limit)
-        if user_tier == 'free':
-            filtered_activities = filtered_activities[:10]
+        limit = 10 if user_tier == 'free' else None
+        
+        # Single pass that stops as soon as the cap is reached
+        filtered_activities = list(islice(
+            (a for a in all_recent_activities if target_type is None or a.get('type') == target_type),
+            limit,
+        ))
         
         return {
             "success": True,
             "github_username": github_username,
             "activities": filtered_activities,
-            "all_activities": all_recent_activities,  # For suggesting alternatives
+            # Alternatives are only suggested when the type filter matched
+            # nothing; otherwise they would just duplicate "activities"
+            "all_activities": all_recent_activities if not filtered_activities else [],
             "count": len(filtered_activities)
         }
     except Exception as e:
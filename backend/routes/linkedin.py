@@ -6,15 +6,14 @@ Handles:
 - LinkedIn disconnect
 """
 import os
-import base64
-from uuid import uuid4
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Annotated
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from fastapi.responses import RedirectResponse
 
 import structlog
-from schemas import DisconnectRequest
+from schemas import DisconnectRequest, OAuthCallbackQuery
 from middleware.clerk_auth import require_auth
-from services.user_settings import get_user_settings, save_user_settings
+from services.user_settings import get_user_settings
 from services.auth_service import (
     get_authorize_url,
     exchange_code_for_token,
@@ -27,6 +26,14 @@ from services.auth_service import (
     TokenRefreshError,
 )
 from services.token_store import delete_token_by_user_id
+from services.oauth_state import (
+    BACKEND_CALLBACK_URI,
+    DEFAULT_FRONTEND_REDIRECT,
+    decode_state,
+    encode_state,
+    error_code,
+    frontend_redirect,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -43,20 +50,8 @@ async def linkedin_start(redirect_uri: str, user_id: str = None):
     If user_id is provided, uses that user's saved LinkedIn credentials.
     Otherwise falls back to global env vars.
     """
-    # Generate random state
-    random_state = uuid4().hex
-    
-    # Store user_id and frontend redirect_uri in state
     # Format: user_id|frontend_redirect_uri|random_state
-    safe_redirect = redirect_uri or "http://localhost:3000/settings"
-    safe_user_id = user_id or ""
-    
-    # Simple delimiter-based state
-    state_payload = f"{safe_user_id}|{safe_redirect}|{random_state}"
-    state = base64.urlsafe_b64encode(state_payload.encode()).decode()
-    
-    # The callback URI registered in LinkedIn Developer Portal MUST match this
-    backend_callback_uri = "http://localhost:8000/auth/linkedin/callback"
+    state = encode_state(user_id, redirect_uri)
     
     # Try to use per-user credentials if user_id provided
     if user_id:
@@ -65,67 +60,37 @@ async def linkedin_start(redirect_uri: str, user_id: str = None):
             if settings and settings.get('linkedin_client_id'):
                 url = get_authorize_url_for_user(
                     settings['linkedin_client_id'],
-                    backend_callback_uri,
+                    BACKEND_CALLBACK_URI,
                     state
                 )
                 return RedirectResponse(url)
-        except Exception as e:
-            logger.error("Failed to get user settings", exc_info=True)
+        except Exception:
+            logger.error("user_settings_lookup_failed", user_id=user_id, exc_info=True)
     
     # Fallback to global credentials
     if not get_authorize_url:
         return {"error": "OAuth service not available"}
         
-    url = get_authorize_url(backend_callback_uri, state)
+    url = get_authorize_url(BACKEND_CALLBACK_URI, state)
     return RedirectResponse(url)
 
 
 @auth_router.get('/auth/linkedin/callback')
-async def linkedin_callback(code: str = None, state: str = None, redirect_uri: str = None):
+async def linkedin_callback(query: Annotated[OAuthCallbackQuery, Query()]):
     """
     Exchange code for token and redirect back to frontend.
     
-    Redirects to: {frontend_redirect}?linkedin_success=true&linkedin_urn=...
-    Or on error: {frontend_redirect}?linkedin_success=false&error=...
+    Redirects to: {redirect_to}?linkedin_success=true&linkedin_urn=...
+    Or on error: {redirect_to}?linkedin_success=false&error=...
     """
-    # Default redirect if decoding fails
-    frontend_redirect = "http://localhost:3000/settings"
-    user_id = None
-    
-    # Define the backend callback URI that must be used for exchange
-    backend_callback_uri = "http://localhost:8000/auth/linkedin/callback"
+    code, state = query.code, query.state
     
-    # Decode state to get user_id and frontend_redirect
-    if state:
-        try:
-            decoded = base64.urlsafe_b64decode(state).decode()
-            parts = decoded.split('|')
-            if len(parts) >= 2:
-                user_id_part = parts[0]
-                redirect_part = parts[1]
-                
-                if user_id_part:
-                    user_id = user_id_part
-                if redirect_part and (redirect_part.startswith('http') or redirect_part.startswith('/')):
-                    frontend_redirect = redirect_part
-                    # Clean up any Double encoding if present
-                    if 'localhost:8000' in frontend_redirect:
-                         frontend_redirect = "http://localhost:3000/settings"
-            
-            # Legacy state support (user_id:random) - in case old link used
-            elif ':' in decoded:
-                 parts = decoded.split(':', 1)
-                 if parts[0]: user_id = parts[0]
+    user_id, redirect_to = (
+        decode_state(state) if state else (None, DEFAULT_FRONTEND_REDIRECT)
+    )
 
-        except Exception as e:
-            logger.error("Error decoding state", exc_info=True)
-            # Try legacy format (raw string)
-            if state and ':' in state:
-                parts = state.split(':', 1)
-                if parts[0]: user_id = parts[0]
-    
     if not code:
-        return RedirectResponse(f"{frontend_redirect}?linkedin_success=false&error=missing_code")
+        return frontend_redirect(redirect_to, linkedin_success='false', error='missing_code')
     
     try:
         result = None
@@ -138,66 +103,59 @@ async def linkedin_callback(code: str = None, state: str = None, redirect_uri: s
                     settings['linkedin_client_id'],
                     settings['linkedin_client_secret'],
                     code,
-                    backend_callback_uri,
+                    BACKEND_CALLBACK_URI,
                     user_id
                 )
-                # Also save the URN to user settings (result is now TokenResponse dataclass)
-                settings['linkedin_user_urn'] = result.linkedin_user_urn
-                await save_user_settings(user_id, settings)
+                # The URN is persisted with the token (accounts table) by the exchange
         
         # Fallback to global credentials
         if not result:
             if not exchange_code_for_token:
-                return RedirectResponse(f"{frontend_redirect}?linkedin_success=false&error=oauth_not_available")
+                return frontend_redirect(redirect_to, linkedin_success='false', error='oauth_not_available')
             
             # Pass user_id for multi-tenant token storage
-            result = await exchange_code_for_token(code, backend_callback_uri, user_id)
+            result = await exchange_code_for_token(code, BACKEND_CALLBACK_URI, user_id)
         
         # Handle both TokenResponse object and dict (for backwards compatibility)
         linkedin_urn = result.linkedin_user_urn if hasattr(result, 'linkedin_user_urn') else result.get("linkedin_user_urn", "")
         logger.info("oauth_callback_success", user_id=user_id, linkedin_urn=linkedin_urn)
-        return RedirectResponse(f"{frontend_redirect}?linkedin_success=true&linkedin_urn={linkedin_urn}")
+        return frontend_redirect(redirect_to, linkedin_success='true', linkedin_urn=linkedin_urn)
     
     except AuthConfigurationError as e:
         logger.error("oauth_config_error", user_id=user_id, error=str(e))
-        return RedirectResponse(f"{frontend_redirect}?linkedin_success=false&error=oauth_not_configured")
+        return frontend_redirect(redirect_to, linkedin_success='false', error='oauth_not_configured')
     
     except AuthProviderError as e:
         logger.error("oauth_provider_error", user_id=user_id, error=str(e), status_code=e.status_code)
-        return RedirectResponse(f"{frontend_redirect}?linkedin_success=false&error=linkedin_unavailable")
+        return frontend_redirect(redirect_to, linkedin_success='false', error='linkedin_unavailable')
     
     except AuthServiceError as e:
         logger.error("oauth_service_error", user_id=user_id, error=str(e))
-        error_msg = str(e).replace(" ", "_")[:50]  # Sanitize for URL
-        return RedirectResponse(f"{frontend_redirect}?linkedin_success=false&error={error_msg}")
+        error_msg = error_code(e)
+        return frontend_redirect(redirect_to, linkedin_success='false', error=error_msg)
         
     except Exception as e:
         logger.exception("oauth_unexpected_error", user_id=user_id)
-        error_msg = str(e).replace(" ", "_")[:50]  # Sanitize for URL
-        return RedirectResponse(f"{frontend_redirect}?linkedin_success=false&error={error_msg}")
+        error_msg = error_code(e)
+        return frontend_redirect(redirect_to, linkedin_success='false', error=error_msg)
 
 
 @router.post("/disconnect-linkedin")
 async def disconnect_linkedin(
     request: DisconnectRequest,
-    current_user: dict = Depends(require_auth) if require_auth else None
+    background_tasks: BackgroundTasks,
+    current_user: dict = Depends(require_auth)
 ):
     """
     Disconnect a user's LinkedIn account (secured - verifies ownership).
     
     Removes the stored OAuth token, requiring re-authentication
-    to post again.
+    to post again. The delete runs after the response is sent; failures
+    are logged by delete_token_by_user_id.
     """
     # SECURITY: Verify user is disconnecting their own account
     if current_user and current_user.get("user_id") != request.user_id:
         raise HTTPException(status_code=403, detail="Cannot disconnect other user's account")
     
-    try:
-        deleted = await delete_token_by_user_id(request.user_id)
-        
-        if deleted:
-            return {"success": True, "message": "LinkedIn disconnected"}
-        else:
-            return {"success": False, "message": "No connection found"}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    background_tasks.add_task(delete_token_by_user_id, request.user_id)
+    return {"success": True, "message": "Disconnect queued"}
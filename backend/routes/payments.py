@@ -5,15 +5,18 @@ API endpoints for:
 - POST /api/checkout: Create checkout session (authenticated)
 - POST /api/billing-portal: Create billing portal session (authenticated)
 - POST /api/subscription: Get subscription status (authenticated)
+- POST /api/batch: Run several of the above in one request (authenticated)
 - POST /webhook/stripe: Handle Stripe webhooks (unauthenticated, signature verified)
 """
-from typing import Optional
+import asyncio
+from typing import Dict, Optional
 
 from fastapi import APIRouter, Request, HTTPException, Header, Depends
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 
 import structlog
+from structlog.contextvars import bind_contextvars
 
 from services.payment_service import (
     create_checkout_session,
@@ -23,6 +26,7 @@ from services.payment_service import (
     PaymentServiceError,
     StripeNotConfiguredError,
     WebhookVerificationError,
+    WebhookSignatureVerifier,
     CustomerNotFoundError,
 )
 from middleware.clerk_auth import require_auth
@@ -44,39 +48,70 @@ webhook_router = APIRouter(tags=["Webhooks"])
 # REQUEST/RESPONSE MODELS
 # =============================================================================
 
+def _check_redirect_url(value):
+    """Stripe redirect URLs must be absolute http(s) URLs of at most 500 chars."""
+    if value is None:
+        return value
+    if not isinstance(value, str) or len(value) > 500 or not value.startswith(("http://", "https://")):
+        raise ValueError("must be an http(s) URL of at most 500 characters")
+    return value
+
+
 class CheckoutRequest(BaseModel):
     """Request to create a checkout session."""
+    model_config = ConfigDict(extra="ignore", frozen=True, str_max_length=500)
+    
     user_id: str = Field(min_length=1, max_length=64)
     price_id: str = Field(min_length=1, max_length=128, description="Stripe Price ID (price_xxxxx)")
     email: Optional[str] = Field(default=None, max_length=254)
-    success_url: Optional[str] = Field(default=None, max_length=500)
-    cancel_url: Optional[str] = Field(default=None, max_length=500)
+    success_url: Optional[str] = None
+    cancel_url: Optional[str] = None
+    
+    @field_validator('success_url', 'cancel_url', mode='before')
+    @classmethod
+    def validate_redirect_urls(cls, v):
+        return _check_redirect_url(v)
 
 
 class CheckoutResponse(BaseModel):
     """Response with checkout session details."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
     session_id: str
     checkout_url: str
 
 
 class BillingPortalRequest(BaseModel):
     """Request to create a billing portal session."""
+    model_config = ConfigDict(extra="ignore", frozen=True, str_max_length=500)
+    
     user_id: str = Field(min_length=1, max_length=64)
-    return_url: str = Field(max_length=500, default="http://localhost:3000/settings")
+    return_url: str = "http://localhost:3000/settings"
+    
+    @field_validator('return_url', mode='before')
+    @classmethod
+    def validate_return_url(cls, v):
+        return _check_redirect_url(v)
 
 
 class BillingPortalResponse(BaseModel):
     """Response with billing portal URL."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
     portal_url: str
 
 
 class SubscriptionStatusRequest(BaseModel):
     """Request to get subscription status."""
+    model_config = ConfigDict(extra="ignore", frozen=True, str_max_length=500)
+    
     user_id: str = Field(min_length=1, max_length=64)
 
 
 class SubscriptionStatusResponse(BaseModel):
     """Response with subscription details."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
     has_subscription: bool
     status: Optional[str] = None
     plan_id: Optional[str] = None
@@ -84,6 +119,21 @@ class SubscriptionStatusResponse(BaseModel):
     cancel_at_period_end: bool = False
 
 
+class BatchItem(BaseModel):
+    """One sub-request inside a batch."""
+    model_config = ConfigDict(extra="ignore", frozen=True, str_max_length=500)
+    
+    path: str = Field(max_length=64)
+    body: dict = Field(default_factory=dict)
+
+
+class BatchRequest(BaseModel):
+    """Named sub-requests to run concurrently."""
+    model_config = ConfigDict(extra="ignore", frozen=True, str_max_length=500)
+    
+    requests: Dict[str, BatchItem] = Field(max_length=10)
+
+
 # =============================================================================
 # CHECKOUT ENDPOINT
 # =============================================================================
@@ -113,13 +163,13 @@ async def create_checkout(
     - `session_id`: Stripe session ID (for client-side redirect)
     - `checkout_url`: Direct URL to the checkout page
     """
-    log = logger.bind(user_id=body.user_id, price_id=body.price_id)
-    log.info("checkout_request_received")
+    bind_contextvars(user_id=body.user_id, price_id=body.price_id)
+    logger.info("checkout_request_received")
     
     # Verify user_id matches authenticated user
     auth_user_id = current_user.get("user_id")
     if auth_user_id and auth_user_id != body.user_id:
-        log.warning("checkout_user_mismatch", auth_user_id=auth_user_id)
+        logger.warning("checkout_user_mismatch", auth_user_id=auth_user_id)
         raise HTTPException(status_code=403, detail="User ID mismatch")
     
     try:
@@ -137,13 +187,13 @@ async def create_checkout(
         )
         
     except StripeNotConfiguredError as e:
-        log.error("stripe_not_configured", error=str(e))
+        logger.error("stripe_not_configured", error=str(e))
         raise HTTPException(
             status_code=503,
             detail="Payment service is not configured. Please contact support."
         )
     except PaymentServiceError as e:
-        log.error("checkout_failed", error=str(e))
+        logger.error("checkout_failed", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -174,13 +224,13 @@ async def create_portal(
     **Response**:
     - `portal_url`: URL to redirect user to
     """
-    log = logger.bind(user_id=body.user_id)
-    log.info("billing_portal_request_received")
+    bind_contextvars(user_id=body.user_id)
+    logger.info("billing_portal_request_received")
     
     # Verify user_id matches authenticated user
     auth_user_id = current_user.get("user_id")
     if auth_user_id and auth_user_id != body.user_id:
-        log.warning("portal_user_mismatch", auth_user_id=auth_user_id)
+        logger.warning("portal_user_mismatch", auth_user_id=auth_user_id)
         raise HTTPException(status_code=403, detail="User ID mismatch")
     
     try:
@@ -192,19 +242,19 @@ async def create_portal(
         return BillingPortalResponse(portal_url=portal_url)
         
     except CustomerNotFoundError:
-        log.warning("no_customer_for_portal")
+        logger.warning("no_customer_for_portal")
         raise HTTPException(
             status_code=404,
             detail="No subscription found. Please subscribe first."
         )
     except StripeNotConfiguredError as e:
-        log.error("stripe_not_configured", error=str(e))
+        logger.error("stripe_not_configured", error=str(e))
         raise HTTPException(
             status_code=503,
             detail="Payment service is not configured. Please contact support."
         )
     except PaymentServiceError as e:
-        log.error("portal_failed", error=str(e))
+        logger.error("portal_failed", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -233,12 +283,12 @@ async def get_subscription(
     - `current_period_end`: Unix timestamp of current billing period end
     - `cancel_at_period_end`: Whether subscription is scheduled to cancel
     """
-    log = logger.bind(user_id=body.user_id)
+    bind_contextvars(user_id=body.user_id)
     
     # Verify user_id matches authenticated user
     auth_user_id = current_user.get("user_id")
     if auth_user_id and auth_user_id != body.user_id:
-        log.warning("subscription_user_mismatch", auth_user_id=auth_user_id)
+        logger.warning("subscription_user_mismatch", auth_user_id=auth_user_id)
         raise HTTPException(status_code=403, detail="User ID mismatch")
     
     try:
@@ -256,7 +306,7 @@ async def get_subscription(
         )
         
     except Exception as e:
-        log.error("subscription_status_failed", error=str(e))
+        logger.error("subscription_status_failed", error=str(e))
         raise HTTPException(status_code=500, detail="Failed to fetch subscription status")
 
 
@@ -284,41 +334,103 @@ async def stripe_webhook(
     **SECURITY**: Webhook signature is verified using STRIPE_WEBHOOK_SECRET.
     Never process events without verification.
     """
-    log = logger.bind(endpoint="stripe_webhook")
+    bind_contextvars(endpoint="stripe_webhook")
     
     # Validate signature header exists
     if not stripe_signature:
-        log.warning("webhook_missing_signature")
+        logger.warning("webhook_missing_signature")
         raise HTTPException(status_code=400, detail="Missing Stripe-Signature header")
     
-    # Get raw body for signature verification
     try:
-        payload = await request.body()
+        verifier = WebhookSignatureVerifier(stripe_signature)
+    except WebhookVerificationError as e:
+        logger.error("webhook_verification_failed", error=str(e))
+        raise HTTPException(status_code=400, detail="Webhook signature verification failed")
+    
+    # Hash the raw body as it streams in; it is still kept for event parsing
+    payload = bytearray()
+    try:
+        async for chunk in request.stream():
+            verifier.update(chunk)
+            payload += chunk
     except Exception as e:
-        log.error("webhook_body_read_failed", error=str(e))
+        logger.error("webhook_body_read_failed", error=str(e))
         raise HTTPException(status_code=400, detail="Failed to read request body")
     
     try:
-        success, message = await handle_webhook(payload, stripe_signature)
+        success, message = await handle_webhook(payload, stripe_signature, verifier)
         
         if success:
-            log.info("webhook_processed", message=message)
-            return JSONResponse(
+            logger.info("webhook_processed", message=message)
+            return ORJSONResponse(
                 status_code=200,
                 content={"received": True, "message": message}
             )
         else:
-            log.warning("webhook_processing_issue", message=message)
-            return JSONResponse(
+            logger.warning("webhook_processing_issue", message=message)
+            return ORJSONResponse(
                 status_code=200,  # Return 200 to prevent Stripe retries
                 content={"received": True, "message": message}
             )
             
     except WebhookVerificationError as e:
-        log.error("webhook_verification_failed", error=str(e))
+        logger.error("webhook_verification_failed", error=str(e))
         raise HTTPException(status_code=400, detail="Webhook signature verification failed")
     
     except PaymentServiceError as e:
-        log.error("webhook_processing_failed", error=str(e))
+        logger.error("webhook_processing_failed", error=str(e))
         # Return 500 so Stripe will retry the webhook
         raise HTTPException(status_code=500, detail="Webhook processing failed")
+
+
+# =============================================================================
+# BATCH ENDPOINT
+# =============================================================================
+
+async def _run_batch_item(request: Request, item: BatchItem, current_user: dict) -> dict:
+    """Run one sub-request, reporting errors per item instead of failing the batch."""
+    model, handler = _BATCH_HANDLERS[item.path]
+    try:
+        result = await handler(request, model.model_validate(item.body), current_user)
+    except ValidationError as e:
+        return {"status_code": 422, "body": {"detail": e.errors(include_url=False)}}
+    except HTTPException as e:
+        return {"status_code": e.status_code, "body": {"detail": e.detail}}
+    return {"status_code": 200, "body": result.model_dump()}
+
+
+# Only the payment endpoints above can be batched; each handler still does
+# its own user_id ownership check against the shared current_user
+_BATCH_HANDLERS = {
+    "/api/checkout": (CheckoutRequest, create_checkout),
+    "/api/billing-portal": (BillingPortalRequest, create_portal),
+    "/api/subscription": (SubscriptionStatusRequest, get_subscription),
+}
+
+
+@router.post("/batch")
+async def run_batch(
+    request: Request,
+    body: BatchRequest,
+    current_user: dict = Depends(require_auth),
+):
+    """
+    Run several payment sub-requests concurrently in one round-trip.
+    
+    **Authentication Required**: Yes (Clerk JWT, verified once for the batch)
+    
+    **Request Body**:
+    - `requests`: Map of name -> `{"path": "/api/subscription", "body": {...}}`
+    
+    **Response**:
+    - `responses`: Map of name -> `{"status_code": int, "body": {...}}`
+    """
+    unknown = sorted({item.path for item in body.requests.values()} - _BATCH_HANDLERS.keys())
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unsupported batch paths: {', '.join(unknown)}")
+    
+    names = list(body.requests)
+    results = await asyncio.gather(
+        *(_run_batch_item(request, body.requests[name], current_user) for name in names)
+    )
+    return {"responses": dict(zip(names, results))}
@@ -11,8 +11,10 @@ This module contains endpoints for:
 import os
 import structlog
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 logger = structlog.get_logger(__name__)
 
@@ -21,6 +23,9 @@ logger = structlog.get_logger(__name__)
 # =============================================================================
 router = APIRouter(prefix="/api/post", tags=["Posts"])
 
+# Background task status (queued by /api/post/publish)
+tasks_router = APIRouter(prefix="/api/tasks", tags=["Tasks"])
+
 # =============================================================================
 # SERVICE IMPORTS
 # =============================================================================
@@ -42,48 +47,22 @@ try:
 except ImportError:
     build_full_persona_context = None
 
-try:
-    from services.image_service import get_relevant_image
-except ImportError:
-    get_relevant_image = None
-
-try:
-    from services.linkedin_service import post_to_linkedin, upload_image_to_linkedin
-except ImportError:
-    post_to_linkedin = None
-    upload_image_to_linkedin = None
-
 try:
     from services.user_settings import get_user_settings
 except ImportError:
     get_user_settings = None
 
-try:
-    from services.token_store import (
-        get_all_tokens,
-        get_access_token_for_urn,
-        get_token_by_user_id,
-    )
-except ImportError:
-    get_all_tokens = None
-    get_access_token_for_urn = None
-    get_token_by_user_id = None
-
 try:
     from services.scheduled_posts import schedule_post
 except ImportError:
     schedule_post = None
 
 try:
-    from services.auth_service import (
-        TokenNotFoundError,
-        TokenRefreshError,
-        AuthProviderError,
-    )
+    from services.tasks import publish_post_now_task
+    from services.celery_app import celery_app
 except ImportError:
-    TokenNotFoundError = Exception
-    TokenRefreshError = Exception
-    AuthProviderError = Exception
+    publish_post_now_task = None
+    celery_app = None
 
 try:
     from services.rate_limiter import (
@@ -97,11 +76,13 @@ except ImportError:
     publish_limiter = None
 
 try:
-    from middleware.clerk_auth import get_current_user
+    from middleware.clerk_auth import get_current_user, require_auth
 except ImportError:
     get_current_user = None
+    require_auth = None
 
 from services.db import get_database
+from services.stats_cache import invalidate_stats_cache
 from repositories.posts import PostRepository
 
 
@@ -132,7 +113,7 @@ class ScheduleRequest(BaseModel):
 class BatchGenerateRequest(BaseModel):
     """Request for batch post generation in Bot Mode."""
     user_id: str
-    activities: list  # List of GitHub activities to generate posts for
+    activities: List[Dict[str, Any]]  # GitHub activities to generate posts for
     style: Optional[str] = "standard"  # Template style
     model: Optional[str] = "groq"  # AI provider
 
@@ -143,7 +124,7 @@ class BatchGenerateRequest(BaseModel):
 @router.post("/generate-preview")
 async def generate_preview(
     req: GenerateRequest,
-    current_user: dict = Depends(get_current_user) if get_current_user else None
+    current_user: dict = Depends(get_current_user) if get_current_user else None,
 ):
     """Generate an AI post preview from context.
     
@@ -181,6 +162,7 @@ async def generate_preview(
     openai_api_key = None
     anthropic_api_key = None
     
+    settings = None
     if user_id and get_user_settings:
         try:
             settings = await get_user_settings(user_id)
@@ -212,6 +194,7 @@ async def generate_preview(
             openai_api_key=openai_api_key,
             anthropic_api_key=anthropic_api_key,
             persona_context=persona_context,
+            user_settings=settings,
         )
         
         if result:
@@ -381,6 +364,10 @@ async def generate_batch(req: BatchGenerateRequest):
         except Exception as e:
             logger.error("failed_to_generate_post", error=str(e))
             failed_count += 1
+    
+    # Drafts were saved above - dashboard counts are stale
+    if success_count:
+        invalidate_stats_cache(req.user_id)
             
     # For provider-based generation loop above, we also need persistence
     # (Note: I'm patching the loop above in a second chunk or assuming the user meant to cover both paths. 
@@ -467,9 +454,16 @@ async def list_providers(
 
 @router.post("/publish")
 async def publish(req: PostRequest):
-    """Publish a post to LinkedIn."""
+    """Generate a post and queue it for publishing to LinkedIn.
+    
+    Image lookup, upload and the LinkedIn post run in a Celery worker
+    (publish_post_now_task), so this returns as soon as the post is queued.
+    Poll GET /api/tasks/{task_id} for the outcome.
+    
+    Returns 200 with the post for test_mode previews and 202 once queued.
+    """
     if not generate_post_with_ai:
-        return {"error": "generate_post_with_ai not available (import failed)"}
+        raise HTTPException(status_code=503, detail="Post generation not available")
 
     # Get user's Groq API key if user_id provided
     groq_api_key = None
@@ -490,95 +484,64 @@ async def publish(req: PostRequest):
         except Exception as e:
             print(f"Failed to get persona: {type(e).__name__}")
 
-    post = generate_post_with_ai(req.context, groq_api_key=groq_api_key, persona_context=persona_context)
+    # Generation is a blocking SDK call - keep it off the event loop
+    post = await run_in_threadpool(
+        generate_post_with_ai,
+        req.context,
+        groq_api_key=groq_api_key,
+        persona_context=persona_context,
+    )
     if not post:
-        return {"error": "failed_to_generate_post"}
+        raise HTTPException(status_code=502, detail="failed_to_generate_post")
 
     if req.test_mode:
         return {"status": "preview", "post": post}
 
-    # Actual publishing logic
-    image_data = None
-    image_asset = None
+    if not publish_post_now_task:
+        raise HTTPException(status_code=503, detail="Publishing queue not available")
 
-    # First try: use user's specific token
-    if req.user_id and get_token_by_user_id:
-        try:
-            user_token = await get_token_by_user_id(req.user_id)
-            if user_token:
-                linkedin_urn = user_token.get('linkedin_user_urn')
-                token = user_token.get('access_token')
-                
-                if get_relevant_image and token:
-                    image_data = get_relevant_image(post)
-                if image_data and upload_image_to_linkedin and token:
-                    image_asset = upload_image_to_linkedin(image_data, access_token=token, linkedin_user_urn=linkedin_urn)
-                if post_to_linkedin and token:
-                    post_to_linkedin(post, image_asset, access_token=token, linkedin_user_urn=linkedin_urn)
-                return {"status": "posted", "post": post, "image_asset": image_asset, "account": linkedin_urn}
-        
-        except TokenNotFoundError as e:
-            logger.warning("token_not_found", user_id=req.user_id, error=str(e))
-            raise HTTPException(status_code=401, detail="LinkedIn not connected. Please reconnect your account.")
-        
-        except TokenRefreshError as e:
-            logger.warning("token_refresh_failed", user_id=req.user_id, error=str(e))
-            raise HTTPException(status_code=401, detail="LinkedIn session expired. Please reconnect your account.")
-        
-        except AuthProviderError as e:
-            logger.error("linkedin_api_unavailable", user_id=req.user_id, error=str(e))
-            raise HTTPException(status_code=502, detail="LinkedIn is temporarily unavailable. Please try again later.")
-        
-        except Exception as e:
-            logger.error("token_retrieval_failed", user_id=req.user_id, error=str(e))
-            # Continue to fallback instead of failing
-
-    # Fallback: use first stored account or environment-based service
-    accounts = []
     try:
-        accounts = await get_all_tokens() if get_all_tokens else []
+        task = publish_post_now_task.delay(post_content=post, user_id=req.user_id)
     except Exception as e:
-        logger.debug(f"Failed to get tokens: {e}")
-        accounts = []
+        logger.error("publish_enqueue_failed", user_id=req.user_id, error=str(e))
+        raise HTTPException(status_code=503, detail="Publishing queue not available")
 
-    if accounts:
-        account = accounts[0]
-        linkedin_urn = account.get('linkedin_user_urn')
-        try:
-            token = await get_access_token_for_urn(linkedin_urn)
-        
-        except TokenNotFoundError as e:
-            logger.warning("fallback_token_not_found", linkedin_urn=linkedin_urn, error=str(e))
-            raise HTTPException(status_code=401, detail="LinkedIn not connected. Please reconnect your account.")
-        
-        except TokenRefreshError as e:
-            logger.warning("fallback_token_refresh_failed", linkedin_urn=linkedin_urn, error=str(e))
-            raise HTTPException(status_code=401, detail="LinkedIn session expired. Please reconnect your account.")
-        
-        except AuthProviderError as e:
-            logger.error("fallback_linkedin_unavailable", linkedin_urn=linkedin_urn, error=str(e))
-            raise HTTPException(status_code=502, detail="LinkedIn is temporarily unavailable. Please try again later.")
-        
-        except Exception as e:
-            logger.error("fallback_token_error", linkedin_urn=linkedin_urn, error=str(e))
-            token = None
-
-        if get_relevant_image and token:
-            image_data = get_relevant_image(post)
-        if image_data and upload_image_to_linkedin and token:
-            image_asset = upload_image_to_linkedin(image_data, access_token=token, linkedin_user_urn=linkedin_urn)
-        if post_to_linkedin and token:
-            post_to_linkedin(post, image_asset, access_token=token, linkedin_user_urn=linkedin_urn)
-        return {"status": "posted", "post": post, "image_asset": image_asset, "account": linkedin_urn}
-
-    # Final fallback: environment-based linkedin service
-    if get_relevant_image:
-        image_data = get_relevant_image(post)
-    if image_data and upload_image_to_linkedin:
-        image_asset = upload_image_to_linkedin(image_data)
-    if post_to_linkedin:
-        post_to_linkedin(post, image_asset)
-    return {"status": "posted", "post": post, "image_asset": image_asset}
+    logger.info("publish_queued", user_id=req.user_id, task_id=task.id)
+    return ORJSONResponse(
+        {"status": "queued", "task_id": task.id, "post": post},
+        status_code=202,
+    )
+
+
+@tasks_router.get("/{task_id}")
+def get_task_status(
+    task_id: str,
+    current_user: dict = Depends(require_auth) if require_auth else None
+):
+    """Get the state (and result, once finished) of a queued publish task.
+    
+    Requires authentication. Results are only shown to the user who queued
+    the task; anyone else - and anyone asking about an anonymous task, whose
+    owner cannot be proven - gets 404. Failures are reported as a generic
+    error so exception text never leaks.
+    
+    Sync handler on purpose: the result-backend lookup is a blocking Redis call,
+    so FastAPI runs it in the threadpool.
+    """
+    if not celery_app:
+        raise HTTPException(status_code=503, detail="Task queue not available")
+
+    result = celery_app.AsyncResult(task_id)
+    response = {"task_id": task_id, "status": result.state.lower()}
+    if result.successful():
+        payload = result.result if isinstance(result.result, dict) else {}
+        caller_id = current_user.get("user_id") if current_user else None
+        if not caller_id or payload.get("user_id") != caller_id:
+            raise HTTPException(status_code=404, detail="Task not found")
+        response["result"] = payload
+    elif result.failed():
+        response["error"] = "publish_failed"
+    return response
 
 
 @router.post("/schedule")
@@ -596,6 +559,7 @@ async def schedule(req: ScheduleRequest):
     
     if not result.get("success"):
         raise HTTPException(status_code=400, detail=result.get("error"))
-        
+    
+    invalidate_stats_cache(req.user_id)
     return result
 
@@ -8,10 +8,23 @@ Handles:
 - GET /api/connection-status/{user_id} - Get connection status
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
 from pydantic import BaseModel
+from types import MappingProxyType
 from typing import Optional, Dict, Any
+import asyncio
+import hashlib
 import logging
+import time
+import orjson
+
+from services.stats_cache import (
+    STATS_CACHE_CONTROL,
+    get_cached_stats,
+    invalidate_stats_cache,
+    set_cached_stats,
+)
 
 # =============================================================================
 # ROUTER SETUP
@@ -163,33 +176,35 @@ async def get_usage(user_id: str, timezone: str = "UTC"):
         from services.db import get_database
         db = get_database()
         
+        # Count posts today (using UTC midnight as reset)
+        now = datetime.utcnow()
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        midnight_ts = int(midnight.timestamp())
+        
+        # Settings lookup and both counts are independent - run them concurrently
+        settings, posts_today_result, scheduled_result = await asyncio.gather(
+            get_user_settings(user_id) if get_user_settings else asyncio.sleep(0),
+            db.fetch_one(
+                "SELECT COUNT(*) as count FROM posts WHERE user_id = $1 AND created_at > $2",
+                [user_id, midnight_ts]
+            ),
+            # Count scheduled posts
+            db.fetch_one(
+                "SELECT COUNT(*) as count FROM scheduled_posts WHERE user_id = $1 AND status = 'pending'",
+                [user_id]
+            ),
+        )
+        
         # Get subscription tier
         tier = "free"
-        if get_user_settings:
-            settings = await get_user_settings(user_id)
-            if settings:
-                tier = settings.get('subscription_tier', 'free')
+        if settings:
+            tier = settings.get('subscription_tier', 'free')
         
         # Set limits based on tier
         posts_limit = 10 if tier == "free" else 50
         scheduled_limit = 3 if tier == "free" else 20
         
-        # Count posts today (using UTC midnight as reset)
-        now = datetime.utcnow()
-        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        midnight_ts = int(midnight.timestamp())
-        
-        posts_today_result = await db.fetch_one(
-            "SELECT COUNT(*) as count FROM posts WHERE user_id = $1 AND created_at > $2",
-            [user_id, midnight_ts]
-        )
         posts_today = posts_today_result['count'] if posts_today_result else 0
-        
-        # Count scheduled posts
-        scheduled_result = await db.fetch_one(
-            "SELECT COUNT(*) as count FROM scheduled_posts WHERE user_id = $1 AND status = 'pending'",
-            [user_id]
-        )
         scheduled_count = scheduled_result['count'] if scheduled_result else 0
         
         # Calculate reset time (next midnight UTC)
@@ -226,68 +241,80 @@ async def get_usage(user_id: str, timezone: str = "UTC"):
 # =============================================================================
 # STATS ENDPOINT
 # =============================================================================
+# Dashboard stats are cached briefly per user (services.stats_cache); post
+# writes anywhere invalidate.
+
+# All dashboard post counts in one pass over the user's rows.
+# $2 = 30 days ago, $3 = 7 days ago, $4 = 14 days ago.
+_STATS_COUNTS_SQL = """
+    SELECT
+        COUNT(*) AS total,
+        SUM(CASE WHEN status = 'published' THEN 1 ELSE 0 END) AS published,
+        SUM(CASE WHEN status = 'draft' THEN 1 ELSE 0 END) AS draft,
+        SUM(CASE WHEN status = 'published' AND created_at > $2 THEN 1 ELSE 0 END) AS published_this_month,
+        SUM(CASE WHEN created_at > $2 THEN 1 ELSE 0 END) AS this_month,
+        SUM(CASE WHEN created_at > $3 THEN 1 ELSE 0 END) AS this_week,
+        SUM(CASE WHEN created_at BETWEEN $4 AND $3 THEN 1 ELSE 0 END) AS last_week
+    FROM posts
+    WHERE user_id = $1
+"""
+_STATS_COUNT_KEYS = (
+    'total', 'published', 'draft', 'published_this_month',
+    'this_month', 'this_week', 'last_week',
+)
+
+
 @router.get("/stats/{user_id}")
-async def get_stats(user_id: str):
+async def get_stats(user_id: str, response: Response):
     """
     Get dashboard stats for a user.
     
     Returns post counts, credits, and growth metrics.
+    Cached per user for services.stats_cache.STATS_CACHE_TTL_SECONDS.
     """
+    cached = get_cached_stats(user_id)
+    if cached is not None:
+        response.headers["Cache-Control"] = STATS_CACHE_CONTROL
+        return cached
+    
     try:
         # Get post counts from database
         from services.db import get_database
         db = get_database()
         
-        # Count posts by status
-        counts_result = await db.fetch_all(
-            "SELECT status, COUNT(*) as count FROM posts WHERE user_id = $1 GROUP BY status",
-            [user_id]
-        )
-        
-        counts = {row['status']: row['count'] for row in counts_result}
-        posts_published = counts.get('published', 0)
-        draft_posts = counts.get('draft', 0)
-        posts_count = sum(counts.values())
-
-        # Count scheduled posts
-        scheduled_result = await db.fetch_one(
-            "SELECT COUNT(*) as count FROM scheduled_posts WHERE user_id = $1 AND status = 'pending'",
-            [user_id]
-        )
-        scheduled_posts = scheduled_result['count'] if scheduled_result else 0
-        
-        # Count posts this month
-        import time
         now = int(time.time())
         month_ago = now - (30 * 24 * 60 * 60)
         week_ago = now - (7 * 24 * 60 * 60)
         two_weeks_ago = now - (14 * 24 * 60 * 60)
         
-        # Monthly published count (for correct "this month" label)
-        monthly_published_result = await db.fetch_one(
-            "SELECT COUNT(*) as count FROM posts WHERE user_id = $1 AND status = 'published' AND created_at > $2",
-            [user_id, month_ago]
-        )
-        published_this_month = monthly_published_result['count'] if monthly_published_result else 0
-
-        monthly_result = await db.fetch_one(
-            "SELECT COUNT(*) as count FROM posts WHERE user_id = $1 AND created_at > $2",
-            [user_id, month_ago]
+        # Every posts count is folded into one aggregate pass, so the request
+        # holds at most three pooled connections at once (posts, scheduled,
+        # settings) instead of one per count.
+        counts_result, scheduled_result, settings = await asyncio.gather(
+            db.fetch_one(_STATS_COUNTS_SQL, [user_id, month_ago, week_ago, two_weeks_ago]),
+            # Count scheduled posts
+            db.fetch_one(
+                "SELECT COUNT(*) as count FROM scheduled_posts WHERE user_id = $1 AND status = 'pending'",
+                [user_id]
+            ),
+            # Usage/credits come from user settings
+            get_user_settings(user_id) if get_user_settings else asyncio.sleep(0),
         )
-        posts_this_month = monthly_result['count'] if monthly_result else 0
         
-        # Weekly growth calculation
-        weekly_result = await db.fetch_one(
-            "SELECT COUNT(*) as count FROM posts WHERE user_id = $1 AND created_at > $2",
-            [user_id, week_ago]
-        )
-        posts_this_week = weekly_result['count'] if weekly_result else 0
-
-        last_week_result = await db.fetch_one(
-            "SELECT COUNT(*) as count FROM posts WHERE user_id = $1 AND created_at BETWEEN $2 AND $3",
-            [user_id, two_weeks_ago, week_ago]
-        )
-        posts_last_week = last_week_result['count'] if last_week_result else 0
+        # SUM() over zero rows is NULL, hence the "or 0"
+        counts = {
+            key: (counts_result[key] if counts_result else 0) or 0
+            for key in _STATS_COUNT_KEYS
+        }
+        posts_count = counts['total']
+        posts_published = counts['published']
+        draft_posts = counts['draft']
+        published_this_month = counts['published_this_month']
+        posts_this_month = counts['this_month']
+        posts_this_week = counts['this_week']
+        posts_last_week = counts['last_week']
+        
+        scheduled_posts = scheduled_result['count'] if scheduled_result else 0
 
         # Calculate growth percentage
         if posts_last_week > 0:
@@ -297,12 +324,10 @@ async def get_stats(user_id: str):
         
         # Get usage/credits from user settings
         credits_remaining = 10  # Default for free tier
-        if get_user_settings:
-            settings = await get_user_settings(user_id)
-            if settings and settings.get('subscription_tier') == 'pro':
-                credits_remaining = 50
+        if settings and settings.get('subscription_tier') == 'pro':
+            credits_remaining = 50
         
-        return {
+        stats = {
             "posts_generated": posts_count,
             "posts_published": posts_published,
             "posts_published_this_month": published_this_month, # New field
@@ -314,7 +339,11 @@ async def get_stats(user_id: str):
             "credits_remaining": credits_remaining,
             "draft_posts": draft_posts
         }
+        set_cached_stats(user_id, stats)
+        response.headers["Cache-Control"] = STATS_CACHE_CONTROL
+        return stats
     except Exception as e:
+        # Defaults are not cached so the next load retries the queries
         logger.error(f"Error getting stats for {user_id}: {e}")
         # Return default stats instead of error to prevent UI breaking
         return {
@@ -455,6 +484,7 @@ async def create_post(req: PostCreateRequest):
             INSERT INTO posts (user_id, post_content, post_type, status, created_at)
             VALUES ($1, $2, $3, $4, $5)
         """, [req.user_id, req.post_content, req.post_type, req.status, now])
+        invalidate_stats_cache(req.user_id)
         
         return {"success": True, "message": "Post saved"}
     except Exception as e:
@@ -591,17 +621,30 @@ async def get_image_preview(req: ImagePreviewRequest):
 # =============================================================================
 # TEMPLATES ENDPOINT
 # =============================================================================
+# Read-only: a tuple of frozen mappings so no caller can mutate shared state
+STYLE_TEMPLATES = tuple(MappingProxyType(t) for t in (
+    {"id": "standard", "name": "Standard", "description": "Professional LinkedIn post style"},
+    {"id": "casual", "name": "Casual", "description": "Friendly and conversational tone"},
+    {"id": "technical", "name": "Technical", "description": "For technical deep dives"},
+    {"id": "storytelling", "name": "Storytelling", "description": "Narrative-driven content"},
+    {"id": "educational", "name": "Educational", "description": "Teaching and sharing knowledge"},
+))
+
+# Static list - encode once and let browsers/CDNs revalidate via ETag
+_TEMPLATES_JSON = orjson.dumps({"templates": [dict(t) for t in STYLE_TEMPLATES]})
+_TEMPLATES_ETAG = '"' + hashlib.blake2b(_TEMPLATES_JSON, digest_size=8).hexdigest() + '"'
+
+
 @router.get("/templates")
-async def get_templates():
+async def get_templates(request: Request):
     """Get available post templates."""
-    templates = [
-        {"id": "standard", "name": "Standard", "description": "Professional LinkedIn post style"},
-        {"id": "casual", "name": "Casual", "description": "Friendly and conversational tone"},
-        {"id": "technical", "name": "Technical", "description": "For technical deep dives"},
-        {"id": "storytelling", "name": "Storytelling", "description": "Narrative-driven content"},
-        {"id": "educational", "name": "Educational", "description": "Teaching and sharing knowledge"},
-    ]
-    return {"templates": templates}
+    if request.headers.get("if-none-match") == _TEMPLATES_ETAG:
+        return Response(status_code=304, headers={"ETag": _TEMPLATES_ETAG})
+    return Response(
+        _TEMPLATES_JSON,
+        media_type="application/json",
+        headers={"ETag": _TEMPLATES_ETAG, "Cache-Control": "public, max-age=3600, immutable"},
+    )
 
 
 # =============================================================================
@@ -651,6 +694,7 @@ async def schedule_post(req: ScheduleRequest):
                VALUES ($1, $2, $3, $4, 'pending', $5)""",
             [req.user_id, req.post_content, req.image_url, req.scheduled_time, now]
         )
+        invalidate_stats_cache(req.user_id)
         return {"success": True, "message": "Post scheduled"}
     except Exception as e:
         logger.error(f"Error scheduling post: {e}")
@@ -681,6 +725,7 @@ async def delete_scheduled(post_id: int, user_id: str):
         from services.db import get_database
         db = get_database()
         await db.execute("DELETE FROM scheduled_posts WHERE id = $1 AND user_id = $2", [post_id, user_id])
+        invalidate_stats_cache(user_id)
         return {"success": True}
     except Exception as e:
         logger.error(f"Error deleting scheduled post: {e}")
@@ -756,6 +801,7 @@ async def publish_full(req: PublishFullRequest):
                     )
                 except Exception as e:
                     logger.error(f"Failed to save published post: {e}")
+            invalidate_stats_cache(req.user_id)
 
             return {"success": True, "post_id": linkedin_post_id}
         except Exception as e:
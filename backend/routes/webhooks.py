@@ -24,7 +24,7 @@ import json
 import hmac
 import hashlib
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 # =============================================================================
 # ROUTER SETUP
@@ -132,7 +132,7 @@ async def handle_clerk_webhook(request: Request):
     # Handle user.deleted event
     if event_type == 'user.deleted':
         if not user_id:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"error": "Missing user ID in webhook data"}
             )
@@ -142,7 +142,7 @@ async def handle_clerk_webhook(request: Request):
             from services.user_data_cleanup import delete_all_user_data
             result = await delete_all_user_data(user_id)
             
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=200,
                 content={
                     "status": "success",
@@ -155,7 +155,7 @@ async def handle_clerk_webhook(request: Request):
             print(f"❌ Error cleaning up user data: {e}")
             # Return 200 to prevent Clerk from retrying
             # (the data can be cleaned up manually if needed)
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=200,
                 content={
                     "status": "partial",
@@ -167,7 +167,7 @@ async def handle_clerk_webhook(request: Request):
     # Handle user.created (just log)
     elif event_type == 'user.created':
         print(f"👤 New user created: {user_id[:8]}...")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={"status": "success", "event": event_type}
         )
@@ -175,7 +175,7 @@ async def handle_clerk_webhook(request: Request):
     # Handle user.updated (just log)
     elif event_type == 'user.updated':
         print(f"👤 User updated: {user_id[:8]}...")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={"status": "success", "event": event_type}
         )
@@ -183,7 +183,7 @@ async def handle_clerk_webhook(request: Request):
     # Unknown event type
     else:
         print(f"⚠️  Unhandled webhook event: {event_type}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={"status": "ignored", "event": event_type}
         )
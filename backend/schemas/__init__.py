@@ -3,6 +3,7 @@ from .requests import (
     GenerateRequest,
     PostRequest,
     DisconnectRequest,
+    OAuthCallbackQuery,
     FeedbackRequest,
     ContactRequest,
     UserSettingsRequest,
@@ -20,6 +21,7 @@ __all__ = [
     "GenerateRequest",
     "PostRequest",
     "DisconnectRequest",
+    "OAuthCallbackQuery",
     "FeedbackRequest",
     "ContactRequest",
     "UserSettingsRequest",
@@ -359,6 +359,31 @@ class DisconnectRequest(UserIdMixin):
     model_config = ConfigDict(extra="forbid")
 
 
+class OAuthCallbackQuery(BaseModel):
+    """Query parameters for OAuth provider callbacks.
+    
+    All fields are optional so a missing code still reaches the handler and
+    redirects back to the frontend with an error, but oversized values are
+    rejected by pydantic-core before any state decoding happens.
+    Extra params (e.g. error, error_description) are ignored.
+    """
+    code: Optional[str] = Field(
+        default=None,
+        max_length=MAX_URL_LENGTH,
+        description="Authorization code from the provider"
+    )
+    state: Optional[str] = Field(
+        default=None,
+        max_length=MAX_URL_LENGTH,
+        description="Opaque state created by the /start endpoint"
+    )
+    redirect_uri: Optional[str] = Field(
+        default=None,
+        max_length=MAX_URL_LENGTH,
+        description="Unused; kept for backwards compatibility"
+    )
+
+
 # =============================================================================
 # POST HISTORY
 # =============================================================================
@@ -64,6 +64,16 @@ class TestTemplatesEndpoint:
         
         template_ids = [t["id"] for t in templates]
         assert "standard" in template_ids
+    
+    def test_templates_etag_revalidation(self, sync_test_client: TestClient):
+        """Templates should be cacheable and return 304 for a matching ETag."""
+        response = sync_test_client.get("/api/templates")
+        etag = response.headers["etag"]
+        
+        assert "max-age" in response.headers["cache-control"]
+        
+        cached = sync_test_client.get("/api/templates", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
 
 
 class TestSettingsEndpoint:
@@ -88,6 +98,76 @@ class TestSettingsEndpoint:
         assert response.headers["content-type"] == "application/json"
 
 
+class TestStatsEndpoint:
+    """Tests for the /api/stats endpoint cache."""
+    
+    def test_stats_served_from_cache(self, sync_test_client: TestClient):
+        """Cached stats should be returned with a private Cache-Control header."""
+        from services.stats_cache import set_cached_stats, invalidate_stats_cache
+        
+        stats = {"posts_generated": 7, "posts_published": 3}
+        set_cached_stats("stats_user", stats)
+        try:
+            response = sync_test_client.get("/api/stats/stats_user")
+            
+            assert response.status_code == 200
+            assert response.json() == stats
+            assert response.headers["cache-control"].startswith("private")
+        finally:
+            invalidate_stats_cache("stats_user")
+    
+    def test_invalidate_drops_cached_stats(self):
+        """Invalidation should force the next request to recompute."""
+        from services.stats_cache import set_cached_stats, get_cached_stats, invalidate_stats_cache
+        
+        set_cached_stats("stats_user", {"posts_generated": 1})
+        invalidate_stats_cache("stats_user")
+        
+        assert get_cached_stats("stats_user") is None
+    
+    def test_post_counts_come_from_one_query(self, sync_test_client: TestClient, monkeypatch):
+        """All posts counts share one aggregate query (bounded pool fan-out)."""
+        from unittest.mock import AsyncMock
+        import services.db
+        import routes.settings as settings_routes
+        from services.stats_cache import invalidate_stats_cache
+        
+        db = AsyncMock()
+        db.fetch_one.side_effect = [
+            {"total": 4, "published": 2, "draft": 1, "published_this_month": 2,
+             "this_month": 3, "this_week": 2, "last_week": 1},
+            {"count": 1},
+        ]
+        monkeypatch.setattr(services.db, "get_database", lambda: db)
+        monkeypatch.setattr(settings_routes, "get_user_settings", AsyncMock(return_value={}))
+        try:
+            data = sync_test_client.get("/api/stats/agg_user").json()
+            
+            assert db.fetch_one.await_count == 2
+            assert db.fetch_all.await_count == 0
+            assert data["posts_generated"] == 4
+            assert data["posts_scheduled"] == 1
+            assert data["growth_percentage"] == 100
+        finally:
+            invalidate_stats_cache("agg_user")
+    
+    def test_scheduling_a_post_invalidates_stats(self, sync_test_client: TestClient, monkeypatch):
+        """POST /api/post/schedule should drop the user's cached stats."""
+        from unittest.mock import AsyncMock
+        import routes.posts as posts_routes
+        from services.stats_cache import set_cached_stats, get_cached_stats
+        
+        monkeypatch.setattr(posts_routes, "schedule_post", AsyncMock(return_value={"success": True}))
+        set_cached_stats("sched_user", {"posts_scheduled": 0})
+        
+        response = sync_test_client.post("/api/post/schedule", json={
+            "user_id": "sched_user", "post_content": "Hello", "scheduled_time": 2000000000,
+        })
+        
+        assert response.status_code == 200
+        assert get_cached_stats("sched_user") is None
+
+
 class TestGeneratePreviewEndpoint:
     """Tests for the /api/post/generate-preview endpoint."""
     
@@ -198,6 +278,110 @@ class TestPublishEndpoint:
         assert data.get("test_mode") is True
 
 
+class TestQueuedPublishEndpoint:
+    """Tests for the /api/post/publish endpoint (Celery-backed)."""
+    
+    def test_publish_queues_task(self, sync_test_client: TestClient, sample_push_context):
+        """Non-test-mode publish should enqueue a task and return 202."""
+        from unittest.mock import patch, MagicMock
+        
+        task = MagicMock(id="task-123")
+        with patch("routes.posts.generate_post_with_ai", return_value="Generated post"), \
+             patch("routes.posts.publish_post_now_task") as mock_task:
+            mock_task.delay.return_value = task
+            response = sync_test_client.post(
+                "/api/post/publish",
+                json={"context": sample_push_context, "test_mode": False}
+            )
+        
+        assert response.status_code == 202
+        data = response.json()
+        assert data["status"] == "queued"
+        assert data["task_id"] == "task-123"
+        mock_task.delay.assert_called_once_with(post_content="Generated post", user_id=None)
+    
+    def test_publish_preview_is_not_accepted(self, sync_test_client: TestClient, sample_push_context):
+        """test_mode previews return 200; generation failures are errors, not 202."""
+        from unittest.mock import patch
+        
+        with patch("routes.posts.generate_post_with_ai", return_value="Generated post"):
+            response = sync_test_client.post(
+                "/api/post/publish", json={"context": sample_push_context, "test_mode": True}
+            )
+        assert response.status_code == 200
+        assert response.json()["status"] == "preview"
+        
+        with patch("routes.posts.generate_post_with_ai", return_value=None):
+            response = sync_test_client.post(
+                "/api/post/publish", json={"context": sample_push_context, "test_mode": False}
+            )
+        assert response.status_code == 502
+    
+    def _get_task(self, client, payload, user_id):
+        """GET /api/tasks/task-123 as user_id (None: unauthenticated)."""
+        from unittest.mock import patch, MagicMock
+        from app import app
+        from middleware.clerk_auth import require_auth
+        
+        result = MagicMock(state="SUCCESS", result=payload)
+        result.successful.return_value = True
+        if user_id:
+            app.dependency_overrides[require_auth] = lambda: {"user_id": user_id}
+        try:
+            with patch("routes.posts.celery_app") as mock_app:
+                mock_app.AsyncResult.return_value = result
+                return client.get("/api/tasks/task-123")
+        finally:
+            app.dependency_overrides.pop(require_auth, None)
+    
+    def test_task_status_reports_result(self, sync_test_client: TestClient):
+        """Task status endpoint should expose the Celery result to its owner."""
+        payload = {"success": True, "user_id": "owner"}
+        response = self._get_task(sync_test_client, payload, "owner")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "success"
+        assert data["result"] == payload
+    
+    def test_task_status_hidden_from_other_users(self, sync_test_client: TestClient):
+        """A finished task owned by a user must not be readable by anyone else."""
+        payload = {"success": True, "account": "urn_abc", "user_id": "owner"}
+        
+        assert self._get_task(sync_test_client, payload, "intruder").status_code == 404
+    
+    def test_task_status_requires_auth_and_an_owner(self, sync_test_client: TestClient):
+        """Anonymous callers are rejected and anonymous tasks are never shown."""
+        payload = {"success": True, "account": "urn_abc", "user_id": None}
+        
+        assert self._get_task(sync_test_client, payload, None).status_code in (401, 403)
+        assert self._get_task(sync_test_client, payload, "someone").status_code == 404
+
+
+class TestOAuthCallbackEndpoint:
+    """Tests for /auth/linkedin/callback query validation."""
+    
+    def test_callback_without_code_redirects_with_error(self, sync_test_client: TestClient):
+        """Missing code should redirect back to the frontend, not 422."""
+        response = sync_test_client.get(
+            "/auth/linkedin/callback",
+            follow_redirects=False
+        )
+        
+        assert response.status_code == 307
+        assert "error=missing_code" in response.headers["location"]
+    
+    def test_callback_rejects_oversized_code(self, sync_test_client: TestClient):
+        """Oversized query values should be rejected before processing."""
+        response = sync_test_client.get(
+            "/auth/linkedin/callback",
+            params={"code": "x" * 5000},
+            follow_redirects=False
+        )
+        
+        assert response.status_code == 422
+
+
 class TestCORSConfiguration:
     """Tests for CORS configuration."""
     
@@ -210,3 +394,102 @@ class TestCORSConfiguration:
         
         # OPTIONS request should succeed
         assert response.status_code in [200, 405]  # FastAPI may not handle OPTIONS directly
+    
+    def test_cors_preflight_is_cacheable(self, sync_test_client: TestClient):
+        """Preflight responses should carry Access-Control-Max-Age."""
+        from core.config import CORS_MAX_AGE
+        
+        response = sync_test_client.options(
+            "/api/post/generate-preview",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "POST",
+            }
+        )
+        
+        assert response.status_code == 200
+        assert response.headers["access-control-max-age"] == str(CORS_MAX_AGE)
+    
+    def test_cors_preflight_allows_auth_headers(self, sync_test_client: TestClient):
+        """Preflight should allow the headers the frontend actually sends."""
+        response = sync_test_client.options(
+            "/api/post/generate-preview",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "authorization, content-type",
+            }
+        )
+        
+        assert response.status_code == 200
+        allowed = response.headers["access-control-allow-headers"].lower()
+        assert "authorization" in allowed
+        assert "content-type" in allowed
+
+
+class TestCompression:
+    """Tests for response compression."""
+    
+    def test_large_responses_are_gzipped(self, sync_test_client: TestClient):
+        """Large JSON bodies should be gzip-encoded when the client accepts it."""
+        response = sync_test_client.get(
+            "/openapi.json",
+            headers={"Accept-Encoding": "gzip"}
+        )
+        
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") == "gzip"
+    
+    def test_small_responses_are_not_gzipped(self, sync_test_client: TestClient):
+        """Bodies under the minimum size should be sent uncompressed."""
+        response = sync_test_client.get(
+            "/health",
+            headers={"Accept-Encoding": "gzip"}
+        )
+        
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
+
+class TestPaymentsBatchEndpoint:
+    """Tests for the /api/batch endpoint."""
+    
+    def test_batch_runs_each_item(self, sync_test_client: TestClient, monkeypatch):
+        """Each sub-request gets its own status; ownership is checked per item."""
+        from unittest.mock import AsyncMock
+        from app import app
+        from middleware.clerk_auth import require_auth
+        import routes.payments as payments
+        
+        monkeypatch.setattr(payments, "get_subscription_info", AsyncMock(return_value=None))
+        app.dependency_overrides[require_auth] = lambda: {"user_id": "batch_user"}
+        try:
+            response = sync_test_client.post("/api/batch", json={"requests": {
+                "mine": {"path": "/api/subscription", "body": {"user_id": "batch_user"}},
+                "theirs": {"path": "/api/subscription", "body": {"user_id": "other_user"}},
+                "invalid": {"path": "/api/subscription", "body": {}},
+            }})
+        finally:
+            app.dependency_overrides.pop(require_auth, None)
+        
+        assert response.status_code == 200
+        responses = response.json()["responses"]
+        assert responses["mine"]["status_code"] == 200
+        assert responses["mine"]["body"]["has_subscription"] is False
+        assert responses["theirs"]["status_code"] == 403
+        assert responses["invalid"]["status_code"] == 422
+    
+    def test_batch_rejects_unknown_paths(self, sync_test_client: TestClient):
+        """Only allowlisted payment paths can be batched."""
+        from app import app
+        from middleware.clerk_auth import require_auth
+        
+        app.dependency_overrides[require_auth] = lambda: {"user_id": "batch_user"}
+        try:
+            response = sync_test_client.post("/api/batch", json={"requests": {
+                "x": {"path": "/api/settings", "body": {}},
+            }})
+        finally:
+            app.dependency_overrides.pop(require_auth, None)
+        
+        assert response.status_code == 400
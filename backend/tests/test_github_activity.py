@@ -21,7 +21,13 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 class TestGetUserActivity:
     """Tests for fetching user activity from GitHub API."""
     
-    @patch('services.github_activity.requests.get')
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        """Start each test with an empty activity cache."""
+        from services.github_activity import clear_github_cache
+        clear_github_cache()
+    
+    @patch('services.github_activity.http.get')
     def test_get_user_activity_success(self, mock_get):
         """Should return parsed activities on successful API call."""
         from services.github_activity import get_user_activity
@@ -45,7 +51,7 @@ class TestGetUserActivity:
         assert result is not None
         assert len(result) > 0
     
-    @patch('services.github_activity.requests.get')
+    @patch('services.github_activity.http.get')
     def test_get_user_activity_with_token(self, mock_get):
         """Should use Authorization header when token provided."""
         from services.github_activity import get_user_activity
@@ -64,7 +70,7 @@ class TestGetUserActivity:
             headers = call_kwargs.kwargs['headers']
             assert 'Authorization' in headers
     
-    @patch('services.github_activity.requests.get')
+    @patch('services.github_activity.http.get')
     def test_get_user_activity_not_found(self, mock_get):
         """Should handle 404 for non-existent user."""
         from services.github_activity import get_user_activity
@@ -78,7 +84,7 @@ class TestGetUserActivity:
         
         assert result is None or result == []
     
-    @patch('services.github_activity.requests.get')
+    @patch('services.github_activity.http.get')
     def test_get_user_activity_rate_limited(self, mock_get):
         """Should handle rate limit (403) gracefully."""
         from services.github_activity import get_user_activity
@@ -91,6 +97,30 @@ class TestGetUserActivity:
         result = get_user_activity("testuser")
         
         assert result is None or result == []
+    
+    @patch('services.github_activity.http.get')
+    def test_get_user_activity_cached(self, mock_get):
+        """Should serve repeat lookups from cache without calling GitHub."""
+        from services.github_activity import get_user_activity
+        
+        mock_get.return_value = MagicMock(
+            status_code=200,
+            json=lambda: [
+                {
+                    "id": "123",
+                    "type": "PushEvent",
+                    "repo": {"name": "user/repo"},
+                    "payload": {"commits": [{"sha": "abc", "message": "test"}]},
+                    "created_at": datetime.now(timezone.utc).isoformat()
+                }
+            ]
+        )
+        
+        first = get_user_activity("cacheduser", limit=10)
+        second = get_user_activity("cacheduser", limit=10)
+        
+        assert second == first
+        assert mock_get.call_count == 1
 
 
 class TestParseEvent:
@@ -290,7 +320,7 @@ class TestParseEvent:
 class TestGetGitHubStats:
     """Tests for fetching GitHub user stats."""
     
-    @patch('services.github_activity.requests.get')
+    @patch('services.github_activity.http.get')
     def test_get_github_stats_success(self, mock_get):
         """Should return user stats on success."""
         from services.github_activity import get_github_stats
@@ -312,7 +342,7 @@ class TestGetGitHubStats:
         assert result["public_repos"] == 25
         assert result["followers"] == 100
     
-    @patch('services.github_activity.requests.get')
+    @patch('services.github_activity.http.get')
     def test_get_github_stats_not_found(self, mock_get):
         """Should handle non-existent user."""
         from services.github_activity import get_github_stats
@@ -330,7 +360,7 @@ class TestGetGitHubStats:
 class TestRecentRepoUpdates:
     """Tests for scanning repositories for recent updates."""
     
-    @patch('services.github_activity.requests.get')
+    @patch('services.github_activity.http.get')
     def test_get_recent_repo_updates_success(self, mock_get):
         """Should return recently updated repos."""
         from services.github_activity import get_recent_repo_updates
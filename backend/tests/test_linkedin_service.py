@@ -49,8 +49,8 @@ class TestPostFormatting:
 class TestImageUpload:
     """Tests for LinkedIn image upload functionality."""
     
-    @patch('services.linkedin_service.requests.post')
-    @patch('services.linkedin_service.requests.put')
+    @patch('services.linkedin_service.http.post')
+    @patch('services.linkedin_service.http.put')
     def test_upload_image_registers_upload(self, mock_put, mock_post):
         """Image upload should register with LinkedIn API first."""
         from services.linkedin_service import upload_image_to_linkedin
@@ -85,7 +85,7 @@ class TestImageUpload:
         # Should return asset URN
         assert result is not None
     
-    @patch('services.linkedin_service.requests.post')
+    @patch('services.linkedin_service.http.post')
     def test_upload_image_handles_api_error(self, mock_post):
         """Image upload should handle API errors gracefully."""
         from services.linkedin_service import upload_image_to_linkedin
@@ -123,7 +123,7 @@ class TestImageUpload:
 class TestPostToLinkedIn:
     """Tests for the main posting function."""
     
-    @patch('services.linkedin_service.requests.post')
+    @patch('services.linkedin_service.http.post')
     def test_post_to_linkedin_success(self, mock_post):
         """Successful post should return True or post ID."""
         from services.linkedin_service import post_to_linkedin
@@ -142,7 +142,7 @@ class TestPostToLinkedIn:
         
         assert result is True or result is not None
     
-    @patch('services.linkedin_service.requests.post')
+    @patch('services.linkedin_service.http.post')
     def test_post_to_linkedin_with_image(self, mock_post):
         """Post with image should include media in payload."""
         from services.linkedin_service import post_to_linkedin
@@ -168,7 +168,7 @@ class TestPostToLinkedIn:
             payload = call_kwargs.kwargs['json']
             assert 'content' in str(payload) or 'media' in str(payload)
     
-    @patch('services.linkedin_service.requests.post')
+    @patch('services.linkedin_service.http.post')
     def test_post_to_linkedin_unauthorized(self, mock_post):
         """Unauthorized token should return False or error."""
         from services.linkedin_service import post_to_linkedin
@@ -186,7 +186,7 @@ class TestPostToLinkedIn:
         
         assert result is False or result is None
     
-    @patch('services.linkedin_service.requests.post')
+    @patch('services.linkedin_service.http.post')
     def test_post_to_linkedin_rate_limited(self, mock_post):
         """Rate limited response should be handled."""
         from services.linkedin_service import post_to_linkedin
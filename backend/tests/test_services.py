@@ -30,6 +30,61 @@ class TestGitHubActivityParsing:
         assert "commit" in result["title"].lower()
         assert result["context"]["commits"] == 2
     
+    def test_parse_event_includes_unix_timestamp(self, sample_github_event):
+        """Parsed events should carry created_at as Unix seconds for filtering."""
+        from services.github_activity import parse_event
+        
+        result = parse_event(sample_github_event)
+        
+        # 2024-12-21T06:00:00Z
+        assert result["timestamp"] == 1734760800
+    
+    def test_activity_revalidated_with_etag(self, sample_github_event, monkeypatch):
+        """Expired activity should be revalidated with If-None-Match and reused on 304."""
+        from unittest.mock import MagicMock
+        import services.github_activity as github_activity
+        
+        ok = MagicMock(status_code=200, headers={"ETag": '"abc"'})
+        ok.json.return_value = [sample_github_event]
+        not_modified = MagicMock(status_code=304, headers={})
+        http = MagicMock()
+        http.get.side_effect = [ok, not_modified]
+        monkeypatch.setattr(github_activity, "http", http)
+        github_activity.clear_github_cache()
+        
+        try:
+            first = github_activity.get_user_activity("etag_user", limit=5)
+            github_activity._cache.clear()  # Simulate TTL expiry
+            second = github_activity.get_user_activity("etag_user", limit=5)
+            
+            assert second == first
+            assert http.get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+        finally:
+            github_activity.clear_github_cache()
+    
+    def test_activity_cache_scoped_to_token(self, sample_github_event, monkeypatch):
+        """A cached private fetch must not be served to a request with another token."""
+        from unittest.mock import MagicMock
+        import services.github_activity as github_activity
+        
+        ok = MagicMock(status_code=200, headers={})
+        ok.json.return_value = [sample_github_event]
+        http = MagicMock()
+        http.get.return_value = ok
+        monkeypatch.setattr(github_activity, "http", http)
+        github_activity.clear_github_cache()
+        
+        try:
+            github_activity.get_user_activity("victim", limit=5, token="ghp_owner")
+            github_activity.get_user_activity("victim", limit=5, token="ghp_owner")
+            assert http.get.call_count == 1
+            
+            github_activity.get_user_activity("victim", limit=5, token="ghp_attacker")
+            assert http.get.call_count == 2
+            assert not any("ghp_" in key for key in github_activity._cache)
+        finally:
+            github_activity.clear_github_cache()
+    
     def test_parse_push_event_zero_commits_returns_update(self):
         """Push event with 0 commits should return update description."""
         from services.github_activity import parse_event
@@ -300,3 +355,538 @@ class TestAIServicePrompts:
         assert "action" in sample_pr_context
         assert "pr_number" in sample_pr_context
         assert "pr_title" in sample_pr_context
+
+
+class TestHttpClient:
+    """Tests for the shared outbound HTTP session."""
+    
+    def test_session_does_not_store_cookies(self):
+        """Shared session must not carry cookies between users' requests."""
+        from http.client import HTTPMessage
+        import requests
+        from services.http_client import http
+        
+        headers = HTTPMessage()
+        headers["Set-Cookie"] = "lidc=abc; Domain=.linkedin.com; Path=/"
+        request = requests.Request("GET", "https://api.linkedin.com/v2/me").prepare()
+        
+        http.cookies.extract_cookies(
+            requests.cookies.MockResponse(headers),
+            requests.cookies.MockRequest(request),
+        )
+        
+        assert len(http.cookies) == 0
+
+
+class TestCurrentUserId:
+    """Tests for the authenticated user_id dependency."""
+    
+    @pytest.mark.asyncio
+    async def test_returns_user_id(self):
+        """An authenticated user dict should yield its user_id."""
+        from dependencies import get_current_user_id
+        
+        assert await get_current_user_id({"user_id": "user_123"}) == "user_123"
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("current_user", [None, {}, {"user_id": ""}])
+    async def test_rejects_missing_user(self, current_user):
+        """Missing or empty users should raise 401."""
+        from fastapi import HTTPException
+        from dependencies import get_current_user_id
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user_id(current_user)
+        assert exc_info.value.status_code == 401
+
+
+class TestPostRepositoryDependency:
+    """Tests for the PostRepository dependency factories."""
+    
+    @pytest.mark.asyncio
+    async def test_scopes_repository_to_user(self):
+        """Both variants should scope the repository to the given user."""
+        from dependencies import get_post_repository, get_post_repository_optional
+        
+        for dep in (get_post_repository, get_post_repository_optional):
+            repo = await dep(user_id="user_123", db=object())
+            assert repo.user_id == "user_123"
+    
+    @pytest.mark.asyncio
+    async def test_optional_returns_none_for_anonymous(self):
+        """The optional variant should yield None without a user."""
+        from dependencies import get_post_repository_optional
+        
+        assert await get_post_repository_optional(user_id=None, db=object()) is None
+
+
+class TestRepositoryQueryCache:
+    """Tests for BaseRepository compiled-SQL caching."""
+    
+    @pytest.mark.asyncio
+    async def test_same_shape_reuses_sql_with_new_values(self):
+        """Calls with the same query shape should share one SQL text."""
+        from unittest.mock import AsyncMock
+        from repositories.posts import PostRepository
+        
+        db = AsyncMock()
+        db.prepared_fetch_one.return_value = None
+        
+        await PostRepository(db, "user_a").get_by_id(1)
+        await PostRepository(db, "user_b").get_by_id("2")
+        
+        calls = db.prepared_fetch_one.call_args_list
+        (sql_a, values_a), (sql_b, values_b) = [c.args for c in calls]
+        assert sql_a is sql_b
+        assert "$1" in sql_a and "user_a" not in sql_a
+        assert values_a == [1, "user_a"]
+        assert values_b == [2, "user_b"]
+    
+    @pytest.mark.asyncio
+    async def test_today_count_uses_dialect_accessor(self):
+        """get_today_count picks its SQL from the wrapper's public is_sqlite."""
+        from unittest.mock import AsyncMock
+        from repositories.posts import PostRepository
+        
+        db = AsyncMock()
+        db.fetch_one.return_value = (3,)
+        
+        db.is_sqlite = True
+        assert await PostRepository(db, "user_a").get_today_count() == 3
+        assert "strftime" in db.fetch_one.call_args.args[0]
+        
+        db.is_sqlite = False
+        await PostRepository(db, "user_a").get_today_count()
+        assert "date_trunc" in db.fetch_one.call_args.args[0]
+
+
+class TestSettingsRepositoryCache:
+    """Tests for SettingsRepository per-instance caching."""
+    
+    @pytest.mark.asyncio
+    async def test_getters_share_one_query_until_save(self):
+        """Helper getters should reuse the loaded row; saving invalidates it."""
+        from unittest.mock import AsyncMock
+        from repositories.settings import SettingsRepository
+        
+        db = AsyncMock()
+        db.fetch_one.return_value = {
+            "user_id": "user_123",
+            "github_username": "octocat",
+            "onboarding_complete": 1,
+            "subscription_tier": "pro",
+        }
+        repo = SettingsRepository(db, "user_123")
+        
+        assert await repo.get_github_username() == "octocat"
+        assert await repo.is_onboarding_complete() is True
+        assert await repo.get_subscription_tier() == "pro"
+        assert db.fetch_one.await_count == 1
+        
+        await repo.complete_onboarding()
+        await repo.get_settings()
+        assert db.fetch_one.await_count == 2
+
+
+class TestQueryTracker:
+    """Tests for development-mode N+1 query detection."""
+    
+    @pytest.mark.asyncio
+    async def test_warns_on_repeated_query_from_one_call_site(self):
+        """The same SQL from one line above the threshold should be reported."""
+        from structlog.testing import capture_logs
+        from services.query_tracker import QueryTrackerMiddleware, track_query
+        
+        async def app(scope, receive, send):
+            for _ in range(6):
+                track_query("SELECT * FROM user_settings WHERE user_id = $1")
+            track_query("SELECT 1")
+        
+        middleware = QueryTrackerMiddleware(app, threshold=5)
+        with capture_logs() as logs:
+            await middleware({"type": "http", "path": "/api/posts"}, None, None)
+        
+        warnings = [log for log in logs if log["event"] == "potential_n_plus_1"]
+        assert len(warnings) == 1
+        assert warnings[0]["count"] == 6
+        assert "test_services.py" in warnings[0]["call_site"]
+    
+    def test_noop_outside_tracked_request(self):
+        """Queries outside a tracked request should not raise or record."""
+        from services.query_tracker import _query_counts, track_query
+        
+        track_query("SELECT 1")
+        assert _query_counts.get() is None
+
+
+class TestRepositoryRowCache:
+    """Tests for the per-request get_by_id row cache."""
+    
+    @pytest.mark.asyncio
+    async def test_get_by_id_cached_within_request_until_update(self):
+        """Repeat lookups should hit the DB once; updates should invalidate."""
+        from unittest.mock import AsyncMock
+        from repositories.base import request_row_cache
+        from repositories.posts import PostRepository
+        
+        db = AsyncMock()
+        db.prepared_fetch_one.return_value = {"id": 7, "status": "draft"}
+        repo = PostRepository(db, "user_123")
+        
+        with request_row_cache():
+            first = await repo.get_by_id(7)
+            first["status"] = "mutated"
+            second = await repo.get_by_id("7")
+            assert second["status"] == "draft"
+            assert db.prepared_fetch_one.await_count == 1
+            
+            await repo.update_status(7, "failed")
+            await repo.get_by_id(7)
+            assert db.prepared_fetch_one.await_count == 2
+        
+        # Outside a request scope nothing is cached
+        await repo.get_by_id(7)
+        await repo.get_by_id(7)
+        assert db.prepared_fetch_one.await_count == 4
+
+
+class TestUserSettingsCache:
+    """Tests for the TTL cache in services.user_settings."""
+    
+    @pytest.mark.asyncio
+    async def test_settings_cached_until_saved(self, monkeypatch):
+        """Repeat reads should hit the DB once; saving should invalidate."""
+        from unittest.mock import AsyncMock
+        import services.user_settings as user_settings
+        
+        db = AsyncMock()
+        db.fetch_one.return_value = {
+            "user_id": "cache_user", "github_username": "octo",
+            "preferences": "{}", "persona": "{}", "subscription_tier": "pro",
+        }
+        monkeypatch.setattr(user_settings, "get_database", lambda: db)
+        user_settings.invalidate_user_settings_cache("cache_user")
+        
+        try:
+            first = await user_settings.get_user_settings("cache_user", cached=True)
+            first["preferences"]["mutated"] = True
+            second = await user_settings.get_user_settings("cache_user", cached=True)
+            assert second["preferences"] == {}
+            assert second["subscription_tier"] == "pro"
+            assert db.fetch_one.await_count == 1
+            
+            # save merges against a fresh read, then invalidates
+            await user_settings.save_user_settings("cache_user", {"github_username": "new"})
+            await user_settings.get_user_settings("cache_user", cached=True)
+            assert db.fetch_one.await_count == 3
+        finally:
+            user_settings.invalidate_user_settings_cache()
+    
+    @pytest.mark.asyncio
+    async def test_default_reads_through(self, monkeypatch):
+        """Uncached reads (settings GET, tier checks) always query the DB."""
+        from unittest.mock import AsyncMock
+        import services.user_settings as user_settings
+        
+        db = AsyncMock()
+        db.fetch_one.return_value = {"user_id": "fresh_user", "preferences": "{}", "persona": "{}"}
+        monkeypatch.setattr(user_settings, "get_database", lambda: db)
+        user_settings.invalidate_user_settings_cache("fresh_user")
+        
+        try:
+            await user_settings.get_user_settings("fresh_user", cached=True)
+            await user_settings.get_user_settings("fresh_user")
+            await user_settings.get_user_settings("fresh_user")
+            assert db.fetch_one.await_count == 3
+        finally:
+            user_settings.invalidate_user_settings_cache()
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_query(self, monkeypatch):
+        """Simultaneous reads for one user should issue a single query."""
+        import asyncio
+        from unittest.mock import AsyncMock
+        import services.user_settings as user_settings
+        
+        async def slow_fetch(*args):
+            await asyncio.sleep(0.01)
+            return {"user_id": "burst_user", "preferences": "{}", "persona": "{}"}
+        
+        db = AsyncMock()
+        db.fetch_one.side_effect = slow_fetch
+        monkeypatch.setattr(user_settings, "get_database", lambda: db)
+        user_settings.invalidate_user_settings_cache("burst_user")
+        
+        try:
+            results = await asyncio.gather(
+                *(user_settings.get_user_settings("burst_user", cached=True) for _ in range(5))
+            )
+            assert all(r["user_id"] == "burst_user" for r in results)
+            assert db.fetch_one.await_count == 1
+        finally:
+            user_settings.invalidate_user_settings_cache()
+    
+    @pytest.mark.asyncio
+    async def test_stale_row_served_on_db_error(self, monkeypatch):
+        """An expired row should be returned if the refresh query fails."""
+        from unittest.mock import AsyncMock
+        import services.user_settings as user_settings
+        
+        db = AsyncMock()
+        db.fetch_one.side_effect = [
+            {"user_id": "stale_user", "preferences": "{}", "persona": "{}"},
+            ConnectionError("db down"),
+        ]
+        monkeypatch.setattr(user_settings, "get_database", lambda: db)
+        monkeypatch.setattr(user_settings, "USER_SETTINGS_CACHE_TTL_SECONDS", 0)
+        user_settings.invalidate_user_settings_cache("stale_user")
+        
+        try:
+            await user_settings.get_user_settings("stale_user", cached=True)
+            stale = await user_settings.get_user_settings("stale_user", cached=True)
+            assert stale["user_id"] == "stale_user"
+            assert db.fetch_one.await_count == 2
+        finally:
+            user_settings.invalidate_user_settings_cache()
+
+
+class TestFeedbackStatusCache:
+    """Tests for the submitted-feedback cache in services.feedback."""
+    
+    @pytest.mark.asyncio
+    async def test_positive_status_cached(self, monkeypatch):
+        """Once a user is known to have submitted, later checks skip the DB."""
+        from unittest.mock import AsyncMock
+        import services.feedback as feedback
+        
+        db = AsyncMock()
+        db.fetch_one.side_effect = [None, {"?column?": 1}]
+        monkeypatch.setattr(feedback, "get_database", lambda: db)
+        feedback.forget_feedback_submitter("fb_user")
+        
+        try:
+            # Negative answers are not cached
+            assert await feedback.has_user_submitted_feedback("fb_user") is False
+            assert await feedback.has_user_submitted_feedback("fb_user") is True
+            assert await feedback.has_user_submitted_feedback("fb_user") is True
+            assert db.fetch_one.await_count == 2
+        finally:
+            feedback.forget_feedback_submitter("fb_user")
+
+
+class TestWebhookSignatureVerifier:
+    """Tests for the streaming Stripe signature check in services.payment_service."""
+    
+    @staticmethod
+    def _sign(secret: str, payload: bytes, timestamp: int) -> str:
+        import hashlib
+        import hmac
+        mac = hmac.new(secret.encode(), f"{timestamp}.".encode() + payload, hashlib.sha256)
+        return f"t={timestamp},v1={mac.hexdigest()}"
+    
+    def test_chunked_payload_verifies(self, monkeypatch):
+        """Feeding the body in chunks should match a signature over the whole body."""
+        import time
+        import services.payment_service as payment_service
+        
+        monkeypatch.setattr(payment_service, "STRIPE_WEBHOOK_SECRET", "whsec_test")
+        payload = b'{"id": "evt_1", "type": "ping"}'
+        verifier = payment_service.WebhookSignatureVerifier(
+            self._sign("whsec_test", payload, int(time.time()))
+        )
+        for i in range(0, len(payload), 7):
+            verifier.update(payload[i:i + 7])
+        verifier.verify()
+    
+    def test_tampered_payload_rejected(self, monkeypatch):
+        """A body that differs from the signed one should fail verification."""
+        import time
+        import services.payment_service as payment_service
+        
+        monkeypatch.setattr(payment_service, "STRIPE_WEBHOOK_SECRET", "whsec_test")
+        verifier = payment_service.WebhookSignatureVerifier(
+            self._sign("whsec_test", b'{"amount": 1}', int(time.time()))
+        )
+        verifier.update(b'{"amount": 1000}')
+        with pytest.raises(payment_service.WebhookVerificationError):
+            verifier.verify()
+    
+    def test_malformed_header_rejected(self, monkeypatch):
+        """Headers without a timestamp or v1 signature are rejected up front."""
+        import services.payment_service as payment_service
+        
+        monkeypatch.setattr(payment_service, "STRIPE_WEBHOOK_SECRET", "whsec_test")
+        with pytest.raises(payment_service.WebhookVerificationError):
+            payment_service.WebhookSignatureVerifier("v0=abc")
+    
+    def test_expired_timestamp_rejected(self, monkeypatch):
+        """A correctly signed body with a t= older than the tolerance is a replay."""
+        import time
+        import services.payment_service as payment_service
+        
+        monkeypatch.setattr(payment_service, "STRIPE_WEBHOOK_SECRET", "whsec_test")
+        payload = b'{"id": "evt_1", "type": "ping"}'
+        old = int(time.time()) - payment_service.WEBHOOK_TOLERANCE_SECONDS - 60
+        verifier = payment_service.WebhookSignatureVerifier(self._sign("whsec_test", payload, old))
+        verifier.update(payload)
+        with pytest.raises(payment_service.WebhookVerificationError, match="tolerance"):
+            verifier.verify()
+    
+    def test_any_matching_v1_signature_accepted(self, monkeypatch):
+        """During secret rotation Stripe sends several v1= values; one match suffices."""
+        import time
+        import services.payment_service as payment_service
+        
+        monkeypatch.setattr(payment_service, "STRIPE_WEBHOOK_SECRET", "whsec_test")
+        payload = b'{"id": "evt_1", "type": "ping"}'
+        timestamp = int(time.time())
+        valid = self._sign("whsec_test", payload, timestamp).split(",")[1]
+        stale = self._sign("whsec_old", payload, timestamp).split(",")[1]
+        verifier = payment_service.WebhookSignatureVerifier(
+            f"t={timestamp},{stale},{valid},v0=deadbeef"
+        )
+        verifier.update(payload)
+        verifier.verify()
+    
+    @pytest.mark.asyncio
+    async def test_handle_webhook_uses_preverified_payload(self, monkeypatch):
+        """With verifier= the event is built from the payload, not re-verified by Stripe."""
+        import json
+        import time
+        from unittest.mock import AsyncMock
+        import services.payment_service as payment_service
+        
+        monkeypatch.setattr(payment_service, "STRIPE_WEBHOOK_SECRET", "whsec_test")
+        monkeypatch.setattr(
+            payment_service, "verify_webhook_signature",
+            lambda *a, **k: pytest.fail("payload verified twice"),
+        )
+        handler = AsyncMock()
+        monkeypatch.setattr(payment_service, "_handle_subscription_updated", handler)
+        
+        payload = json.dumps({
+            "id": "evt_1",
+            "object": "event",
+            "type": "customer.subscription.updated",
+            "data": {"object": {"id": "sub_1", "status": "active"}},
+        }).encode()
+        sig_header = self._sign("whsec_test", payload, int(time.time()))
+        verifier = payment_service.WebhookSignatureVerifier(sig_header)
+        verifier.update(payload)
+        
+        ok, _ = await payment_service.handle_webhook(payload, sig_header, verifier=verifier)
+        
+        assert ok is True
+        (event_data,), _ = handler.await_args
+        assert event_data["id"] == "sub_1"
+        assert event_data["status"] == "active"
+
+
+class TestCodeExchangeCache:
+    """Tests for the replayed-callback cache in services.token_store."""
+    
+    def test_only_same_code_hits(self):
+        """Replays of one code hit; a new code or a disconnect misses."""
+        import services.token_store as token_store
+        
+        token_store.cache_exchange("ex_user", "client_a", "code_1", "urn:li:person:abc")
+        try:
+            assert token_store.get_cached_exchange("ex_user", "client_a", "code_1") == "urn:li:person:abc"
+            assert token_store.get_cached_exchange("ex_user", "client_a", "code_2") is None
+            assert token_store.get_cached_exchange("ex_user", "client_b", "code_1") is None
+            # Neither the code nor any token is held in memory
+            assert "code_1" not in repr(token_store._exchange_cache)
+            
+            token_store.forget_cached_exchanges("ex_user")
+            assert token_store.get_cached_exchange("ex_user", "client_a", "code_1") is None
+        finally:
+            token_store.forget_cached_exchanges("ex_user")
+    
+    @pytest.mark.asyncio
+    async def test_replay_reloads_token_from_store(self, monkeypatch):
+        """A replayed code returns the stored token without calling LinkedIn."""
+        from unittest.mock import AsyncMock
+        import services.auth_service as auth_service
+        import services.token_store as token_store
+        
+        stored = {"user_id": "ex_user", "access_token": "tok", "expires_at": 123}
+        monkeypatch.setattr(auth_service, "get_token_by_urn", AsyncMock(return_value=stored))
+        monkeypatch.setattr(auth_service, "_make_request", lambda *a, **k: pytest.fail("sent spent code"))
+        
+        token_store.cache_exchange("ex_user", "client_a", "code_1", "urn:li:person:abc")
+        try:
+            result = await auth_service.exchange_code_for_token_with_user(
+                "client_a", "secret", "code_1", "http://cb", "ex_user"
+            )
+            assert result.linkedin_user_urn == "urn:li:person:abc"
+            assert result.access_token == "tok"
+        finally:
+            token_store.forget_cached_exchanges("ex_user")
+
+
+class TestPaymentRedirectUrls:
+    """Tests for redirect URL validation on the payments request models."""
+    
+    def test_only_http_urls_accepted(self):
+        """Checkout/portal redirect URLs must be absolute http(s) URLs."""
+        from pydantic import ValidationError
+        from routes.payments import BillingPortalRequest, CheckoutRequest
+        
+        ok = CheckoutRequest(user_id="u", price_id="price_1", success_url="https://app.example/ok")
+        assert ok.success_url == "https://app.example/ok"
+        assert BillingPortalRequest(user_id="u").return_url.startswith("http://")
+        
+        for bad in ("javascript:alert(1)", "/relative", "https://x/" + "a" * 500):
+            with pytest.raises(ValidationError):
+                CheckoutRequest(user_id="u", price_id="price_1", cancel_url=bad)
+            with pytest.raises(ValidationError):
+                BillingPortalRequest(user_id="u", return_url=bad)
+
+
+class TestOAuthStateDecoding:
+    """Tests for the shared OAuth state helpers in services.oauth_state."""
+    
+    def test_decodes_and_validates_redirect(self):
+        """user_id and http(s)/relative redirects are extracted; others fall back."""
+        import base64
+        from services.oauth_state import DEFAULT_FRONTEND_REDIRECT, decode_state, encode_state
+        
+        def encode(payload: str) -> str:
+            return base64.urlsafe_b64encode(payload.encode()).rstrip(b'=').decode('ascii')
+        
+        assert decode_state(encode("user_1|https://app.example/settings|nonce")) == (
+            "user_1", "https://app.example/settings"
+        )
+        assert decode_state(encode("user_1|javascript:alert(1)|nonce")) == (
+            "user_1", DEFAULT_FRONTEND_REDIRECT
+        )
+        assert decode_state("legacy_user:abc") == ("legacy_user", DEFAULT_FRONTEND_REDIRECT)
+        assert decode_state(encode_state("user_2", None)) == ("user_2", DEFAULT_FRONTEND_REDIRECT)
+
+
+class TestPublishNowTask:
+    """Tests for the retry policy of services.tasks.publish_post_now_task."""
+    
+    def test_only_pre_publish_errors_retry(self, monkeypatch):
+        """Errors before the LinkedIn post retry; anything later must not."""
+        from unittest.mock import MagicMock
+        import services.tasks as tasks
+        
+        retry = MagicMock(side_effect=RuntimeError("retry scheduled"))
+        monkeypatch.setattr(tasks.publish_post_now_task, "retry", retry)
+        
+        def boom_pre(coro):
+            coro.close()
+            raise tasks.PrePublishError("db down")
+        monkeypatch.setattr(tasks, "run_async", boom_pre)
+        with pytest.raises(RuntimeError, match="retry scheduled"):
+            tasks.publish_post_now_task.run(post_content="hi", user_id="u1")
+        assert retry.call_count == 1
+        
+        def boom_post(coro):
+            coro.close()
+            raise ValueError("failed after posting")
+        monkeypatch.setattr(tasks, "run_async", boom_post)
+        result = tasks.publish_post_now_task.run(post_content="hi", user_id="u1")
+        assert result == {"success": False, "error": "publish_failed", "user_id": "u1"}
+        assert retry.call_count == 1
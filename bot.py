@@ -7,6 +7,8 @@ import time
 from dateutil import parser
 from groq import Groq
 from urllib.parse import quote
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load .env file for local development
 try:
@@ -42,6 +44,16 @@ except ImportError as e:
     print(f"⚠️  Services not available (running standalone): {e}")
     SERVICES_AVAILABLE = False
 
+# Pooled keep-alive session for GitHub API calls: one TCP/TLS handshake is
+# reused across the stats/events/repos/commits requests of a run. Retries only
+# cover connection errors on idempotent requests.
+_github_session = requests.Session()
+_github_session.mount('https://', HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+))
+
 # --- CONFIGURATION (Load from environment variables for security) ---
 # For local testing: create a .env file or set these manually
 # For GitHub Actions: secrets are automatically injected
@@ -143,11 +155,11 @@ def get_github_stats():
         headers = {}
         if GITHUB_TOKEN:
             headers['Authorization'] = f'token {GITHUB_TOKEN}'
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _github_session.get(url, headers=headers, timeout=10)
         print(f"🔎 GitHub API: GET {url} -> {response.status_code}")
         if response.status_code == 401 and headers.get('Authorization'):
             print("⚠️  GitHub token unauthorized — retrying without token (will use public API)")
-            response = requests.get(url, timeout=10)
+            response = _github_session.get(url, timeout=10)
             print(f"🔎 GitHub API (no auth): GET {url} -> {response.status_code}")
 
         if response.status_code != 200:
@@ -182,11 +194,11 @@ def get_latest_github_activity(max_items: int = None):
         headers = {}
         if GITHUB_TOKEN:
             headers['Authorization'] = f'token {GITHUB_TOKEN}'
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _github_session.get(url, headers=headers, timeout=10)
         print(f"🔎 GitHub API: GET {url} -> {response.status_code}")
         if response.status_code == 401 and headers.get('Authorization'):
             print("⚠️  GitHub token unauthorized — retrying without token (will use public API)")
-            response = requests.get(url, timeout=10)
+            response = _github_session.get(url, timeout=10)
             print(f"🔎 GitHub API (no auth): GET {url} -> {response.status_code}")
 
         if response.status_code != 200:
@@ -270,7 +282,7 @@ def get_recent_repo_updates():
         headers = {}
         if GITHUB_TOKEN:
             headers['Authorization'] = f'token {GITHUB_TOKEN}'
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = _github_session.get(url, headers=headers, timeout=10)
         print(f"🔎 GitHub API: GET {url} -> {resp.status_code}")
         if resp.status_code != 200:
             return None
@@ -291,7 +303,7 @@ def get_recent_repo_updates():
                 repo_name = r.get('name')
                 full_repo = r.get('full_name')
                 commit_url = f"https://api.github.com/repos/{full_repo}/commits?per_page=1"
-                c_resp = requests.get(commit_url, headers=headers, timeout=10)
+                c_resp = _github_session.get(commit_url, headers=headers, timeout=10)
                 if c_resp.status_code == 200:
                     commits = c_resp.json()
                     if commits:
@@ -14,43 +14,32 @@ TIER ENFORCEMENT:
 The same system prompts and persona context are used across all providers
 to ensure consistent output quality regardless of model.
 """
+import importlib
+import importlib.util
 import os
 import random
 import uuid
+from functools import lru_cache
 from typing import Optional, Literal
 from enum import Enum
 from dataclasses import dataclass
 
 import structlog
 
-# Optional AI provider imports (installed via requirements.txt)
-try:
-    from groq import Groq
-    GROQ_AVAILABLE = True
-except ImportError:
-    Groq = None  # type: ignore
-    GROQ_AVAILABLE = False
-
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OpenAI = None  # type: ignore
-    OPENAI_AVAILABLE = False
+# Optional AI provider SDKs (installed via requirements.txt).
+# Only their presence is checked here; the SDKs themselves are heavy to import
+# (~1s combined), so each client class is loaded on first use instead of at
+# module import. This keeps API cold-start and test collection fast.
+GROQ_AVAILABLE = importlib.util.find_spec("groq") is not None
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+ANTHROPIC_AVAILABLE = importlib.util.find_spec("anthropic") is not None
+MISTRAL_AVAILABLE = importlib.util.find_spec("mistralai") is not None
 
-try:
-    from anthropic import Anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    Anthropic = None  # type: ignore
-    ANTHROPIC_AVAILABLE = False
 
-try:
-    from mistralai import Mistral
-    MISTRAL_AVAILABLE = True
-except ImportError:
-    Mistral = None  # type: ignore
-    MISTRAL_AVAILABLE = False
+@lru_cache(maxsize=None)
+def _load_client_class(module: str, name: str):
+    """Import and return a provider SDK client class (once per process)."""
+    return getattr(importlib.import_module(module), name)
 
 logger = structlog.get_logger(__name__)
 
@@ -637,7 +626,7 @@ def _generate_with_groq(
         return None
     
     try:
-        client = Groq(api_key=key)
+        client = _load_client_class("groq", "Groq")(api_key=key)
         
         response = client.chat.completions.create(
             messages=[
@@ -676,7 +665,7 @@ def _generate_with_openai(
         return None
     
     try:
-        client = OpenAI(api_key=key)
+        client = _load_client_class("openai", "OpenAI")(api_key=key)
         
         response = client.chat.completions.create(
             messages=[
@@ -715,7 +704,7 @@ def _generate_with_anthropic(
         return None
     
     try:
-        client = Anthropic(api_key=key)
+        client = _load_client_class("anthropic", "Anthropic")(api_key=key)
         
         response = client.messages.create(
             model=ANTHROPIC_MODEL,
@@ -754,7 +743,7 @@ def _generate_with_mistral(
         return None
     
     try:
-        client = Mistral(api_key=key)
+        client = _load_client_class("mistralai", "Mistral")(api_key=key)
         
         response = client.chat.complete(
             model=MISTRAL_MODEL,
@@ -777,6 +766,16 @@ def _generate_with_mistral(
 # TIER ENFORCEMENT & ROUTING
 # =============================================================================
 
+def tier_from_settings(settings: Optional[dict]) -> SubscriptionTier:
+    """Resolve the subscription tier from an already-loaded settings dict."""
+    if not settings:
+        return SubscriptionTier.FREE
+    try:
+        return SubscriptionTier(settings.get('subscription_tier', 'free'))
+    except ValueError:
+        return SubscriptionTier.FREE
+
+
 async def get_user_tier(user_id: Optional[str]) -> SubscriptionTier:
     """
     Get the user's subscription tier.
@@ -789,15 +788,7 @@ async def get_user_tier(user_id: Optional[str]) -> SubscriptionTier:
     try:
         from services.user_settings import get_user_settings
         settings = await get_user_settings(user_id)
-        
-        if settings:
-            tier_str = settings.get('subscription_tier', 'free')
-            try:
-                return SubscriptionTier(tier_str)
-            except ValueError:
-                return SubscriptionTier.FREE
-        
-        return SubscriptionTier.FREE
+        return tier_from_settings(settings)
         
     except Exception as e:
         logger.warning("failed_to_get_user_tier", user_id=user_id, error=str(e))
@@ -847,6 +838,7 @@ async def generate_linkedin_post(
     anthropic_api_key: Optional[str] = None,
     mistral_api_key: Optional[str] = None,
     persona_context: Optional[str] = None,
+    user_settings: Optional[dict] = None,
 ) -> Optional[GenerationResult]:
     """
     Generate a LinkedIn post using the specified AI provider.
@@ -864,6 +856,8 @@ async def generate_linkedin_post(
         openai_api_key: Optional override for OpenAI API key
         anthropic_api_key: Optional override for Anthropic API key
         persona_context: Optional persona prompt string
+        user_settings: Optional settings already loaded by the caller; when
+            given, the tier is read from it instead of re-querying the DB
         
     Returns:
         GenerationResult with content, provider used, and downgrade status
@@ -882,7 +876,10 @@ async def generate_linkedin_post(
         requested = ModelProvider.GROQ
     
     # Get user tier and enforce restrictions
-    user_tier = await get_user_tier(user_id)
+    if user_settings is not None:
+        user_tier = tier_from_settings(user_settings)
+    else:
+        user_tier = await get_user_tier(user_id)
     actual_provider, was_downgraded = enforce_tier_provider(requested, user_tier)
     
     log = log.bind(
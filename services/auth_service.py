@@ -31,6 +31,7 @@ from __future__ import annotations
 import os
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import quote
 
@@ -43,7 +44,8 @@ from requests.exceptions import (
 )
 import structlog
 
-from services.token_store import save_token, get_token_by_urn
+from services.http_client import http
+from services.token_store import save_token, get_token_by_urn, get_cached_exchange, cache_exchange
 
 # =============================================================================
 # STRUCTURED LOGGING CONFIGURATION
@@ -51,6 +53,7 @@ from services.token_store import save_token, get_token_by_urn
 # Configure structlog for JSON output in production, pretty console in dev
 structlog.configure(
     processors=[
+        structlog.contextvars.merge_contextvars,
         structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
@@ -81,6 +84,14 @@ CLIENT_SECRET: str = os.getenv('LINKEDIN_CLIENT_SECRET', '')
 # OAuth scopes required for this application
 SCOPE: str = os.getenv('LINKEDIN_OAUTH_SCOPE', 'openid profile email w_member_social')
 
+# Authorize URL with the constant parts pre-encoded; only client_id,
+# redirect_uri and state vary per request
+_AUTHORIZE_URL_TEMPLATE = (
+    "https://www.linkedin.com/oauth/v2/authorization"
+    "?response_type=code&client_id={client_id}&redirect_uri={redirect_uri}"
+    f"&scope={quote(SCOPE)}&state={{state}}"
+)
+
 # SSL Verification: ALWAYS True in production
 # Only disable for local development with self-signed certs if absolutely necessary
 SSL_VERIFY: bool = os.getenv('SSL_VERIFY', 'true').lower() != 'false'
@@ -216,7 +227,7 @@ def _make_request(
     
     try:
         log.debug("http_request_started")
-        response = getattr(requests, method.lower())(url, **kwargs)
+        response = getattr(http, method.lower())(url, **kwargs)
         response.raise_for_status()
         log.debug("http_request_completed", status_code=response.status_code)
         return response
@@ -321,6 +332,21 @@ def _fetch_linkedin_user_id(access_token: str, user_id: Optional[str] = None) ->
 # =============================================================================
 # PUBLIC API
 # =============================================================================
+@lru_cache(maxsize=32)
+def _quote_param(value: str) -> str:
+    """URL-quote a value that repeats across requests (client IDs, callback URIs)."""
+    return quote(value)
+
+
+def _build_authorize_url(client_id: str, redirect_uri: str, state: str) -> str:
+    """Fill the pre-encoded authorize URL template."""
+    return _AUTHORIZE_URL_TEMPLATE.format(
+        client_id=_quote_param(client_id),
+        redirect_uri=_quote_param(redirect_uri),
+        state=quote(state),
+    )
+
+
 def get_authorize_url(redirect_uri: str, state: str) -> str:
     """
     Generate the LinkedIn OAuth authorization URL.
@@ -347,14 +373,7 @@ def get_authorize_url(redirect_uri: str, state: str) -> str:
             provider="linkedin",
         )
     
-    params = {
-        'response_type': 'code',
-        'client_id': CLIENT_ID,
-        'redirect_uri': redirect_uri,
-        'scope': SCOPE,
-        'state': state,
-    }
-    query_string = '&'.join([f"{k}={quote(v)}" for k, v in params.items()])
+    url = _build_authorize_url(CLIENT_ID, redirect_uri, state)
     
     logger.info(
         "oauth_authorize_url_generated",
@@ -362,7 +381,7 @@ def get_authorize_url(redirect_uri: str, state: str) -> str:
         # SECURITY: Don't log the state parameter - it's a CSRF token
     )
     
-    return f"https://www.linkedin.com/oauth/v2/authorization?{query_string}"
+    return url
 
 
 async def exchange_code_for_token(
@@ -487,16 +506,7 @@ def get_authorize_url_for_user(client_id: str, redirect_uri: str, state: str) ->
             provider="linkedin",
         )
     
-    params = {
-        'response_type': 'code',
-        'client_id': client_id,
-        'redirect_uri': redirect_uri,
-        'scope': SCOPE,
-        'state': state,
-    }
-    query_string = '&'.join([f"{k}={quote(v)}" for k, v in params.items()])
-    
-    return f"https://www.linkedin.com/oauth/v2/authorization?{query_string}"
+    return _build_authorize_url(client_id, redirect_uri, state)
 
 
 async def exchange_code_for_token_with_user(
@@ -540,6 +550,19 @@ async def exchange_code_for_token_with_user(
             provider="linkedin",
         )
 
+    # A replayed callback carries an already-redeemed code; reuse the token
+    # that exchange stored instead of sending the spent code to LinkedIn
+    if user_id:
+        cached_urn = get_cached_exchange(user_id, client_id, code)
+        stored = await get_token_by_urn(cached_urn) if cached_urn else None
+        if stored and stored.get('user_id') == user_id and stored.get('access_token'):
+            log.info("oauth_token_exchange_replayed")
+            return TokenResponse(
+                linkedin_user_urn=cached_urn,
+                access_token=stored['access_token'],
+                expires_at=stored.get('expires_at'),
+            )
+
     log.info("oauth_token_exchange_started")
     
     token_url = 'https://www.linkedin.com/oauth/v2/accessToken'
@@ -589,11 +612,14 @@ async def exchange_code_for_token_with_user(
         expires_in_seconds=expires_in,
     )
 
-    return TokenResponse(
+    result = TokenResponse(
         linkedin_user_urn=linkedin_user_urn,
         access_token=access_token,
         expires_at=expires_at,
     )
+    if user_id:
+        cache_exchange(user_id, client_id, code, linkedin_user_urn)
+    return result
 
 
 def refresh_access_token(refresh_token: str, user_id: Optional[str] = None) -> RefreshTokenResponse:
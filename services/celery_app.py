@@ -102,6 +102,7 @@ celery_app.conf.update(
 celery_app.conf.task_routes = {
     'services.tasks.publish_due_posts_task': {'queue': 'scheduler'},
     'services.tasks.publish_single_post_task': {'queue': 'publishing'},
+    'services.tasks.publish_post_now_task': {'queue': 'publishing'},
     'services.tasks.scheduler_heartbeat_task': {'queue': 'scheduler'},
 }
 
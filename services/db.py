@@ -15,8 +15,11 @@ Environment Variables:
     If DATABASE_URL is not set, the app will fail fast with RuntimeError.
 """
 import os
+import asyncio
 import logging
 
+from services.query_tracker import track_query
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -49,6 +52,15 @@ if DATABASE_URL and DATABASE_URL.startswith("postgres://"):
 # Detect if we're using SQLite
 IS_SQLITE = DATABASE_URL and DATABASE_URL.startswith("sqlite")
 
+# PostgreSQL connection pool (asyncpg, via databases). Connections are opened
+# once and reused; idle ones are closed after DB_POOL_MAX_INACTIVE_SECONDS.
+# Keep DB_POOL_MAX_SIZE x worker processes below the server's max_connections.
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "5"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "20"))
+DB_POOL_MAX_INACTIVE_SECONDS = float(os.getenv("DB_POOL_MAX_INACTIVE_SECONDS", "300"))
+# Prepared statements cached per connection (asyncpg default is 100)
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "256"))
+
 # Lazy import to avoid issues if databases package not installed
 database = None
 _wrapper = None
@@ -101,6 +113,11 @@ class DatabaseWrapper:
     def is_connected(self):
         return self._db.is_connected
     
+    @property
+    def is_sqlite(self) -> bool:
+        """True when running against SQLite (local development)."""
+        return bool(self._is_sqlite)
+    
     async def connect(self):
         return await self._db.connect()
     
@@ -108,19 +125,38 @@ class DatabaseWrapper:
         return await self._db.disconnect()
     
     async def execute(self, query: str, values: list = None):
+        track_query(query)
         if self._is_sqlite and values:
             query, values = _convert_query_for_sqlite(query, values)
         return await self._db.execute(query=query, values=values)
     
     async def fetch_one(self, query: str, values: list = None):
+        track_query(query)
         if self._is_sqlite and values:
             query, values = _convert_query_for_sqlite(query, values)
         return await self._db.fetch_one(query=query, values=values)
     
     async def fetch_all(self, query: str, values: list = None):
+        track_query(query)
         if self._is_sqlite and values:
             query, values = _convert_query_for_sqlite(query, values)
         return await self._db.fetch_all(query=query, values=values)
+    
+    async def prepared_fetch_one(self, query: str, values: list = None):
+        """
+        Fetch one row for a fixed-shape query via a prepared statement.
+        
+        On PostgreSQL this skips the databases/SQLAlchemy compile step and
+        hands the $1-style SQL straight to asyncpg, whose per-connection
+        statement cache prepares it once and afterwards only binds and
+        executes. Use it for hot, fixed-text lookups (e.g. by primary key).
+        On SQLite it is the same as fetch_one.
+        """
+        if self._is_sqlite:
+            return await self.fetch_one(query, values)
+        track_query(query)
+        async with self._db.connection() as connection:
+            return await connection.raw_connection.fetchrow(query, *(values or ()))
 
 
 def get_database():
@@ -128,7 +164,17 @@ def get_database():
     global database, _wrapper
     if database is None:
         from databases import Database
-        database = Database(DATABASE_URL)
+        if IS_SQLITE:
+            database = Database(DATABASE_URL)
+        else:
+            # Passed through to asyncpg.create_pool()
+            database = Database(
+                DATABASE_URL,
+                min_size=DB_POOL_MIN_SIZE,
+                max_size=DB_POOL_MAX_SIZE,
+                max_inactive_connection_lifetime=DB_POOL_MAX_INACTIVE_SECONDS,
+                statement_cache_size=DB_STATEMENT_CACHE_SIZE,
+            )
         _wrapper = DatabaseWrapper(database)
     return _wrapper
 
@@ -145,6 +191,33 @@ async def connect_db():
         logger.info("Database connected successfully")
 
 
+async def warm_pool(n: int = 5) -> None:
+    """
+    Prime up to ``n`` pool connections with a trivial query. Call on app startup.
+    
+    Each ping runs in its own task so the pool hands out separate
+    connections, paying the TCP/TLS/auth handshake before the first
+    user request instead of during it.
+    
+    Args:
+        n: Number of connections to warm (0 disables warming)
+    """
+    if n <= 0:
+        return
+    
+    db = get_database()
+    
+    async def _ping():
+        await db.fetch_one("SELECT 1")
+    
+    try:
+        await asyncio.gather(*(_ping() for _ in range(n)))
+        logger.info(f"Database pool warmed ({n} connections)")
+    except Exception as e:
+        # Warm-up is an optimization only - never block startup on it
+        logger.warning(f"Database pool warm-up failed: {e}")
+
+
 async def disconnect_db():
     """
     Disconnect from database. Call on app shutdown.
@@ -201,8 +274,8 @@ async def init_tables():
             github_username TEXT,
             preferences TEXT DEFAULT '{}',
             onboarding_complete INTEGER DEFAULT 0,
-            subscription_tier TEXT DEFAULT 'free',
-            subscription_status TEXT DEFAULT 'active',
+            subscription_tier VARCHAR(16) DEFAULT 'free',
+            subscription_status VARCHAR(16) DEFAULT 'active',
             subscription_expires_at BIGINT,
             created_at BIGINT,
             updated_at BIGINT
@@ -218,9 +291,9 @@ async def init_tables():
             id SERIAL PRIMARY KEY,
             user_id TEXT,
             post_content TEXT,
-            post_type TEXT,
+            post_type VARCHAR(16),
             context TEXT,
-            status TEXT,
+            status VARCHAR(16),
             linkedin_post_id TEXT,
             engagement TEXT,
             created_at BIGINT,
@@ -233,6 +306,10 @@ async def init_tables():
     await db.execute(
         "CREATE INDEX IF NOT EXISTS idx_post_history_status ON post_history(user_id, status)"
     )
+    if not IS_SQLITE:
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS brin_post_history_created ON post_history USING brin (created_at)"
+        )
     
     # =========================================================================
     # TABLE: scheduled_posts (from scheduled_posts.py)
@@ -245,7 +322,7 @@ async def init_tables():
             post_content TEXT NOT NULL,
             image_url TEXT,
             scheduled_time BIGINT NOT NULL,
-            status TEXT DEFAULT 'pending',
+            status VARCHAR(16) DEFAULT 'pending',
             error_message TEXT,
             created_at BIGINT NOT NULL,
             published_at BIGINT,
@@ -259,7 +336,12 @@ async def init_tables():
         "CREATE INDEX IF NOT EXISTS idx_scheduled_user ON scheduled_posts(user_id)"
     )
     await db.execute(
-        "CREATE INDEX IF NOT EXISTS idx_scheduled_status ON scheduled_posts(status)"
+        "CREATE INDEX IF NOT EXISTS idx_scheduled_pending ON scheduled_posts(user_id, scheduled_time) "
+        "WHERE status = 'pending'"
+    )
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_scheduled_pending_time ON scheduled_posts(scheduled_time) "
+        "WHERE status = 'pending'"
     )
     
     # =========================================================================
@@ -176,6 +176,51 @@ Reply directly to this email to respond to {from_name}.
                 "fallback": True
             }
 
+    
+    def send_email(self, to_email: str, subject: str, body: str) -> dict:
+        """
+        Send a plain-text notification email (e.g. new feedback alerts)
+        
+        Args:
+            to_email: Recipient email
+            subject: Email subject
+            body: Plain-text message body
+            
+        Returns:
+            dict: Success status and message
+        """
+        try:
+            if not (self.smtp_username and self.smtp_password):
+                logger.warning(f"SMTP not configured. Skipping email to {to_email}: {subject}")
+                return {
+                    "success": False,
+                    "message": "SMTP not configured. Please set up email credentials.",
+                    "fallback": True
+                }
+            
+            msg = MIMEText(body, 'plain')
+            msg['From'] = self.from_email
+            msg['To'] = to_email
+            msg['Subject'] = subject
+            
+            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
+                server.starttls()
+                server.login(self.smtp_username, self.smtp_password)
+                server.send_message(msg)
+            
+            logger.info(f"Email sent successfully to {to_email}")
+            return {
+                "success": True,
+                "message": "Email sent successfully"
+            }
+        except Exception as e:
+            logger.error(f"Failed to send email: {str(e)}")
+            return {
+                "success": False,
+                "message": f"Failed to send email: {str(e)}",
+                "fallback": True
+            }
+
 
 # Singleton instance
 email_service = EmailService()
@@ -12,6 +12,16 @@ from services.db import get_database
 
 logger = logging.getLogger(__name__)
 
+# Users known to have submitted feedback. Submission is permanent (short of
+# account deletion), so a positive answer never needs to go back to the DB.
+# Per-process: other workers learn it from their own first lookup.
+_submitted_users: set[str] = set()
+
+
+def forget_feedback_submitter(user_id: str) -> None:
+    """Drop a user from the submitted-feedback cache (after deleting their feedback)."""
+    _submitted_users.discard(user_id)
+
 
 async def save_feedback(
     user_id: str,
@@ -54,6 +64,7 @@ async def save_feedback(
             [user_id]
         )
         feedback_id = row['id'] if row else None
+        _submitted_users.add(user_id)
         
         return {
             'success': True,
@@ -107,5 +118,18 @@ async def get_user_feedback_count(user_id: str) -> int:
 
 async def has_user_submitted_feedback(user_id: str) -> bool:
     """Check if user has ever submitted feedback."""
-    count = await get_user_feedback_count(user_id)
-    return count > 0
+    if user_id in _submitted_users:
+        return True
+    
+    db = get_database()
+    
+    # Stops at the first matching row instead of counting them all
+    row = await db.fetch_one(
+        "SELECT 1 FROM feedback WHERE user_id = $1 LIMIT 1",
+        [user_id]
+    )
+    
+    if row is None:
+        return False
+    _submitted_users.add(user_id)
+    return True
@@ -1,10 +1,12 @@
-import requests
+import hashlib
 import os
 import logging
 import time
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional, Tuple
 
+from services.http_client import http
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -12,10 +14,20 @@ GITHUB_API = "https://api.github.com"
 
 # =============================================================================
 # SIMPLE IN-MEMORY CACHE
-# Speeds up dashboard loading by caching GitHub API responses for 5 minutes
+# Speeds up dashboard loading by caching GitHub API responses for 5 minutes.
+# Keys include a token fingerprint, so data fetched with one user's token
+# (private events/repos) is never served to a request with another token.
 # =============================================================================
 _cache: Dict[str, Tuple[Any, float]] = {}
 CACHE_TTL_SECONDS = 300  # 5 minutes
+CACHE_MAX_ENTRIES = 1024
+
+
+def _token_fingerprint(token: Optional[str]) -> str:
+    """Short, non-reversible identity for a token to scope cache keys by."""
+    if not token:
+        return "public"
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
 
 
 def _get_cached(key: str) -> Optional[Any]:
@@ -32,21 +44,42 @@ def _get_cached(key: str) -> Optional[Any]:
 
 
 def _set_cached(key: str, value: Any, ttl: int = CACHE_TTL_SECONDS) -> None:
-    """Store value in cache with TTL."""
+    """Store value in cache with TTL, evicting the oldest entry when full."""
+    if key not in _cache and len(_cache) >= CACHE_MAX_ENTRIES:
+        _cache.pop(next(iter(_cache)))
     _cache[key] = (value, time.time() + ttl)
     logger.debug(f"Cache SET for {key}, expires in {ttl}s")
 
 
+# =============================================================================
+# ETAG CACHE
+# Last successful events response per cache key. Once the TTL cache expires we
+# revalidate with If-None-Match; GitHub answers 304 (no body, and it does not
+# count against the rate limit) when nothing changed.
+# =============================================================================
+_etag_cache: Dict[str, Tuple[str, Any]] = {}
+ETAG_CACHE_MAX_ENTRIES = 1024
+
+
+def _set_etag(key: str, etag: str, value: Any) -> None:
+    """Remember the ETag for a response, evicting the oldest entry when full."""
+    if key not in _etag_cache and len(_etag_cache) >= ETAG_CACHE_MAX_ENTRIES:
+        _etag_cache.pop(next(iter(_etag_cache)))
+    _etag_cache[key] = (etag, value)
+
+
 def clear_github_cache(username: str = None) -> None:
     """Clear cache for a user or all cache."""
-    global _cache
     if username:
         keys_to_delete = [k for k in _cache if username in k]
         for k in keys_to_delete:
             del _cache[k]
+        for k in [k for k in _etag_cache if username in k]:
+            del _etag_cache[k]
         logger.info(f"Cleared cache for {username} ({len(keys_to_delete)} entries)")
     else:
-        _cache = {}
+        _cache.clear()
+        _etag_cache.clear()
         logger.info("Cleared all GitHub cache")
 
 
@@ -69,7 +102,7 @@ def get_user_activity(username: str, limit: int = 10, token: str = None):
     CACHING: Results are cached for 5 minutes to speed up dashboard loading.
     """
     # Check cache first
-    cache_key = f"activity:{username}:{limit}:{bool(token)}"
+    cache_key = f"activity:{username}:{limit}:{_token_fingerprint(token)}"
     cached = _get_cached(cache_key)
     if cached is not None:
         return cached
@@ -99,8 +132,13 @@ def get_user_activity(username: str, limit: int = 10, token: str = None):
             else:
                 logger.info(f"Fetching GitHub activity for {username} UN-AUTHENTICATED (low rate limit)")
         
+        # Revalidate the last response instead of re-downloading it
+        etag_entry = _etag_cache.get(cache_key)
+        if etag_entry:
+            headers['If-None-Match'] = etag_entry[0]
+        
         # Get user's events
-        response = requests.get(
+        response = http.get(
             url,
             headers=headers,
             timeout=10
@@ -110,6 +148,11 @@ def get_user_activity(username: str, limit: int = 10, token: str = None):
         if response.status_code == 403:
             logger.warning(f"GitHub API Rate Limit Exceeded for {username}. Headers: {response.headers}")
             return []
+        
+        if response.status_code == 304 and etag_entry:
+            logger.debug(f"GitHub activity not modified for {username}")
+            _set_cached(cache_key, etag_entry[1])
+            return etag_entry[1]
             
         if response.status_code != 200:
             logger.error(f"GitHub API Error {response.status_code}: {response.text}")
@@ -123,6 +166,11 @@ def get_user_activity(username: str, limit: int = 10, token: str = None):
             if activity:
                 activities.append(activity)
         
+        # Only successful responses are cached; errors and rate limits retry
+        _set_cached(cache_key, activities)
+        etag = response.headers.get('ETag')
+        if etag:
+            _set_etag(cache_key, etag, activities)
         return activities
     except Exception as e:
         logger.error(f"Error fetching GitHub activity: {e}")
@@ -135,9 +183,11 @@ def parse_event(event):
     repo = event.get('repo', {}).get('name', '')
     created_at = event.get('created_at', '')
     
-    # Format timestamp
+    # Format timestamp (and keep it as Unix seconds for cheap time filtering)
+    timestamp = None
     try:
         dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+        timestamp = int(dt.timestamp())
         now = datetime.now(dt.tzinfo)
         diff = now - dt
         
@@ -156,7 +206,8 @@ def parse_event(event):
         'id': event.get('id'),
         'repo': repo,
         'time_ago': time_ago,
-        'created_at': created_at
+        'created_at': created_at,
+        'timestamp': timestamp
     }
     
     if event_type == 'PushEvent':
@@ -179,7 +230,7 @@ def parse_event(event):
                         headers['Authorization'] = f'token {app_token}'
                     
                     compare_url = f"{GITHUB_API}/repos/{repo}/compare/{before_sha}...{head_sha}"
-                    compare_resp = requests.get(compare_url, headers=headers, timeout=5)
+                    compare_resp = http.get(compare_url, headers=headers, timeout=5)
                     
                     if compare_resp.status_code == 200:
                         compare_data = compare_resp.json()
@@ -334,7 +385,7 @@ def parse_event(event):
 def get_repo_details(repo_full_name: str, token: str = None):
     """Get repository details including total commit count"""
     # Check cache first
-    cache_key = f"repo_details:{repo_full_name}"
+    cache_key = f"repo_details:{repo_full_name}:{_token_fingerprint(token)}"
     cached = _get_cached(cache_key)
     if cached is not None:
         return cached
@@ -351,7 +402,7 @@ def get_repo_details(repo_full_name: str, token: str = None):
             if app_token:
                 headers['Authorization'] = f'token {app_token}'
         
-        response = requests.get(
+        response = http.get(
             f"{GITHUB_API}/repos/{repo_full_name}",
             headers=headers,
             timeout=10
@@ -365,7 +416,7 @@ def get_repo_details(repo_full_name: str, token: str = None):
             total_commits = 0
             try:
                 # Use the participation stats which gives commit counts
-                contrib_response = requests.get(
+                contrib_response = http.get(
                     f"{GITHUB_API}/repos/{repo_full_name}/contributors?per_page=100&anon=true",
                     headers=headers,
                     timeout=10
@@ -384,7 +435,7 @@ def get_repo_details(repo_full_name: str, token: str = None):
             if total_commits == 0:
                 try:
                     # Get first page of commits to check total via Link header
-                    commits_resp = requests.get(
+                    commits_resp = http.get(
                         f"{GITHUB_API}/repos/{repo_full_name}/commits?per_page=1",
                         headers=headers,
                         timeout=5
@@ -405,7 +456,7 @@ def get_repo_details(repo_full_name: str, token: str = None):
                             commits_data = commits_resp.json()
                             if isinstance(commits_data, list) and len(commits_data) > 0:
                                 # Try to get actual count by fetching with higher per_page
-                                commits_resp2 = requests.get(
+                                commits_resp2 = http.get(
                                     f"{GITHUB_API}/repos/{repo_full_name}/commits?per_page=100",
                                     headers=headers,
                                     timeout=10
@@ -470,13 +521,13 @@ def get_github_stats(username: str, token: str = None):
             if app_token:
                 headers['Authorization'] = f'token {app_token}'
         
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http.get(url, headers=headers, timeout=10)
         
         # Handle unauthorized token
         if response.status_code == 401 and 'Authorization' in headers:
             logger.warning("GitHub token unauthorized, retrying without auth")
             del headers['Authorization']
-            response = requests.get(url, headers=headers, timeout=10)
+            response = http.get(url, headers=headers, timeout=10)
 
         if response.status_code != 200:
             logger.warning(f"Could not fetch GitHub user info: {response.status_code}")
@@ -521,7 +572,7 @@ def get_recent_repo_updates(username: str, token: str = None, hours: int = 24):
             if app_token:
                 headers['Authorization'] = f'token {app_token}'
         
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http.get(url, headers=headers, timeout=10)
         
         if response.status_code != 200:
             logger.warning(f"Could not fetch repos: {response.status_code}")
@@ -548,7 +599,7 @@ def get_recent_repo_updates(username: str, token: str = None, hours: int = 24):
                 
                 # Try to get latest commit info
                 commit_url = f"{GITHUB_API}/repos/{full_repo}/commits?per_page=1"
-                c_resp = requests.get(commit_url, headers=headers, timeout=10)
+                c_resp = http.get(commit_url, headers=headers, timeout=10)
                 
                 if c_resp.status_code == 200:
                     commits = c_resp.json()
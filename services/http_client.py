@@ -0,0 +1,98 @@
+"""
+Shared HTTP Session
+
+A single pooled requests.Session for outbound API calls (LinkedIn, GitHub,
+Unsplash, OAuth token exchange). Reusing one session keeps TCP/TLS
+connections alive between calls instead of re-handshaking on every request.
+
+Async endpoints use the httpx.AsyncClient from get_async_http() instead, so
+outbound calls don't block the event loop.
+
+SECURITY NOTES:
+- Cookies are disabled: the session is shared across users, and provider
+  cookies must never leak from one user's request into another's.
+- Auth is always passed per-request via headers, never stored on the session.
+"""
+
+import os
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+# HTTP/2 lets the async client multiplex concurrent calls to one host over a
+# single connection; it needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Number of distinct hosts to keep pools for, and connections per host.
+# Size POOL_MAXSIZE to roughly the number of threads making outbound calls.
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "50"))
+
+# Async client pool limits and defaults
+ASYNC_HTTP_MAX_CONNECTIONS = int(os.getenv("ASYNC_HTTP_MAX_CONNECTIONS", "100"))
+ASYNC_HTTP_MAX_KEEPALIVE = int(os.getenv("ASYNC_HTTP_MAX_KEEPALIVE", "50"))
+ASYNC_HTTP_TIMEOUT = int(os.getenv("AUTH_REQUEST_TIMEOUT", "15"))
+SSL_VERIFY = os.getenv("SSL_VERIFY", "true").lower() != "false"
+
+
+def _build_session() -> requests.Session:
+    """Create a keep-alive session with a bounded connection pool."""
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Process-wide session; closed by the API lifespan on shutdown
+http = _build_session()
+
+
+def close_http_session() -> None:
+    """Close all pooled connections (call on application shutdown)."""
+    http.close()
+
+
+def _build_async_client() -> httpx.AsyncClient:
+    """Create a keep-alive async client with the same no-cookie policy."""
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=ASYNC_HTTP_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=ASYNC_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=ASYNC_HTTP_MAX_KEEPALIVE,
+        ),
+        verify=SSL_VERIFY,
+        cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+    )
+
+
+_async_http: Optional[httpx.AsyncClient] = None
+
+
+def get_async_http() -> httpx.AsyncClient:
+    """Process-wide async client; recreated if it was closed by a shutdown."""
+    global _async_http
+    if _async_http is None or _async_http.is_closed:
+        _async_http = _build_async_client()
+    return _async_http
+
+
+async def close_async_http() -> None:
+    """Close the async client's pooled connections (call on application shutdown)."""
+    global _async_http
+    if _async_http is not None:
+        await _async_http.aclose()
+        _async_http = None
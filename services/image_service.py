@@ -1,9 +1,10 @@
 import os
 import random
 from urllib.parse import quote
-import requests
 import logging
 
+from services.http_client import http
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -91,7 +92,7 @@ def get_relevant_image(post_content: str, unsplash_key: str = None):
     try:
         url = f"https://api.unsplash.com/photos/random?query={quote(search_term)}&orientation=landscape&content_filter=high"
         headers = {'Authorization': f'Client-ID {key}'}
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http.get(url, headers=headers, timeout=10)
 
         if response.status_code == 200:
             data = response.json()
@@ -99,7 +100,7 @@ def get_relevant_image(post_content: str, unsplash_key: str = None):
             image_description = data.get('alt_description', 'No description')
             print(f"✅ Found image: {image_description}")
             print(f"   Downloading...")
-            img_response = requests.get(image_download_url, timeout=10)
+            img_response = http.get(image_download_url, timeout=10)
             if img_response.status_code == 200:
                 print(f"✅ Image downloaded successfully ({len(img_response.content)} bytes)")
                 return img_response.content
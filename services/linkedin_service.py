@@ -18,6 +18,8 @@ SECURITY NOTES:
 import os
 import requests
 
+from services.http_client import http
+
 # Fallback credentials from environment (used if per-user tokens not available)
 # CREDENTIAL CLASSIFICATION:
 # - LINKEDIN_ACCESS_TOKEN: (A) App-level secret - CLI fallback only, web uses per-user DB tokens
@@ -82,7 +84,7 @@ def upload_image_to_linkedin(
             }
         }
 
-        response = requests.post(register_url, headers=headers, json=register_data, timeout=30)
+        response = http.post(register_url, headers=headers, json=register_data, timeout=30)
         
         if response.status_code != 200:
             # Log error without exposing token
@@ -99,7 +101,7 @@ def upload_image_to_linkedin(
         # Step 2: Upload the actual image
         print("⬆️  Uploading to LinkedIn...")
         upload_headers = {'Authorization': f'Bearer {token}'}
-        upload_response = requests.put(upload_url, headers=upload_headers, data=image_data, timeout=60)
+        upload_response = http.put(upload_url, headers=upload_headers, data=image_data, timeout=60)
 
         if upload_response.status_code in [200, 201]:
             print(f"✅ Image uploaded successfully: {asset_urn}")
@@ -209,7 +211,7 @@ def post_to_linkedin(
     print(f"🤖 Posting: '{preview}...'")
     
     try:
-        response = requests.post(url, headers=headers, json=post_data, timeout=30)
+        response = http.post(url, headers=headers, json=post_data, timeout=30)
         
         if response.status_code == 201:
             print("\n✅ SUCCESS! Post is live.")
@@ -0,0 +1,94 @@
+"""
+LinkedIn OAuth State and Redirect Helpers
+
+Shared by both LinkedIn callback routers (backend/routes/linkedin.py and the
+legacy backend/routes/auth.py) so the two flows encode, decode and redirect
+identically.
+
+STATE FORMAT:
+    Unpadded base64url (RFC 4648 section 5) of
+    "user_id|frontend_redirect_uri|random_state". Links issued by older
+    builds used a raw "user_id:random" string, which is still accepted.
+"""
+
+import base64
+import re
+import secrets
+from functools import lru_cache
+from typing import Optional, Tuple
+from urllib.parse import urlencode
+
+import structlog
+from fastapi.responses import RedirectResponse
+
+logger = structlog.get_logger(__name__)
+
+# LinkedIn OAuth redirect targets. The backend callback MUST match the URI
+# registered in the LinkedIn Developer Portal.
+BACKEND_CALLBACK_URI = "http://localhost:8000/auth/linkedin/callback"
+DEFAULT_FRONTEND_REDIRECT = "http://localhost:3000/settings"
+
+# Decoded state "user_id|frontend_redirect_uri|random_state"; the redirect
+# group only matches values starting with http or / (others are ignored)
+_STATE_RE = re.compile(r"([^|]*)\|((?:http|/)[^|]*)?")
+
+# Turns exception text into a compact error=... code for the redirect
+_ERROR_CODE_XLAT = str.maketrans(" &?#", "____")
+
+
+def encode_state(user_id: Optional[str], redirect_uri: Optional[str]) -> str:
+    """Build the opaque state for /auth/linkedin/start (with a random nonce)."""
+    payload = f"{user_id or ''}|{redirect_uri or DEFAULT_FRONTEND_REDIRECT}|{secrets.token_urlsafe(16)}"
+    # Unpadded keeps the URL short; decode_state restores the padding
+    return base64.urlsafe_b64encode(payload.encode()).rstrip(b'=').decode('ascii')
+
+
+@lru_cache(maxsize=1024)
+def decode_state(state: str) -> Tuple[Optional[str], str]:
+    """
+    Decode OAuth state into (user_id, frontend_redirect).
+    
+    A pure function of the raw state, so browser/proxy retries of the same
+    callback reuse the cached result instead of decoding it again.
+    """
+    # Default redirect if decoding fails
+    frontend_redirect = DEFAULT_FRONTEND_REDIRECT
+    user_id = None
+    
+    try:
+        decoded = base64.urlsafe_b64decode(state.encode('ascii') + b'=' * (-len(state) % 4)).decode()
+        match = _STATE_RE.match(decoded)
+        if match:
+            user_id_part, redirect_part = match.groups()
+            if user_id_part:
+                user_id = user_id_part
+            if redirect_part:
+                frontend_redirect = redirect_part
+                # Clean up any Double encoding if present
+                if 'localhost:8000' in frontend_redirect:
+                    frontend_redirect = DEFAULT_FRONTEND_REDIRECT
+        
+        # Legacy state support (user_id:random) - in case old link used
+        elif ':' in decoded:
+            user_id = decoded.partition(':')[0] or None
+    
+    except Exception:
+        logger.error("oauth_state_decode_failed", exc_info=True)
+        # Try legacy format (raw string)
+        if ':' in state:
+            user_id = state.partition(':')[0] or None
+    
+    return user_id, frontend_redirect
+
+
+def error_code(exc: Exception) -> str:
+    """Compact error=... code for the frontend redirect from an exception."""
+    return str(exc)[:50].translate(_ERROR_CODE_XLAT)
+
+
+def frontend_redirect(redirect_to: str, **params: str) -> RedirectResponse:
+    """Redirect back to the frontend with URL-encoded query params (never cached)."""
+    return RedirectResponse(
+        f"{redirect_to}?{urlencode(params)}",
+        headers={"Cache-Control": "no-store"},
+    )
@@ -11,6 +11,9 @@ SECURITY CRITICAL:
 - All Stripe API calls use server-side secret key
 - Customer IDs are never exposed to frontend
 """
+import hashlib
+import hmac
+import json
 import os
 import time
 from typing import Optional, Dict, Any, Tuple
@@ -21,6 +24,7 @@ import stripe
 import structlog
 
 from services.db import get_database
+from services.user_settings import invalidate_user_settings_cache
 
 logger = structlog.get_logger(__name__)
 
@@ -33,6 +37,9 @@ STRIPE_WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET")
 STRIPE_SUCCESS_URL = os.getenv("STRIPE_SUCCESS_URL", "http://localhost:3000/dashboard?payment=success")
 STRIPE_CANCEL_URL = os.getenv("STRIPE_CANCEL_URL", "http://localhost:3000/pricing")
 
+# Reject signed webhooks older than this (matches stripe.Webhook's default)
+WEBHOOK_TOLERANCE_SECONDS = 300
+
 # Initialize Stripe client
 if STRIPE_SECRET_KEY:
     stripe.api_key = STRIPE_SECRET_KEY
@@ -289,19 +296,95 @@ def verify_webhook_signature(payload: bytes, sig_header: str) -> stripe.Event:
         raise WebhookVerificationError(f"Invalid webhook payload: {e}")
 
 
-async def handle_webhook(payload: bytes, sig_header: str) -> Tuple[bool, str]:
+class WebhookSignatureVerifier:
+    """
+    Incremental Stripe signature check, fed the body chunk by chunk.
+    
+    Stripe signs "{timestamp}.{payload}" with HMAC-SHA256, so the MAC can be
+    started from the header and updated while the body is still streaming
+    in, instead of hashing a fully buffered copy afterwards.
+    
+    Usage:
+        verifier = WebhookSignatureVerifier(sig_header)
+        async for chunk in request.stream():
+            verifier.update(chunk)
+        verifier.verify()
+    
+    Raises:
+        WebhookVerificationError: On construction if the secret is missing or
+            the header is malformed; from verify() if no signature matches.
+    """
+    
+    def __init__(self, sig_header: str):
+        if not STRIPE_WEBHOOK_SECRET:
+            raise WebhookVerificationError(
+                "STRIPE_WEBHOOK_SECRET not configured. Cannot verify webhook."
+            )
+        
+        timestamp = None
+        self._signatures = []
+        for part in sig_header.split(","):
+            key, _, value = part.strip().partition("=")
+            if key == "t":
+                timestamp = value
+            elif key == "v1":
+                self._signatures.append(value)
+        
+        if not timestamp or not timestamp.isdigit() or not self._signatures:
+            logger.error("webhook_signature_invalid", error="malformed header")
+            raise WebhookVerificationError("Invalid webhook signature: malformed header")
+        
+        self._timestamp = int(timestamp)
+        self._mac = hmac.new(
+            STRIPE_WEBHOOK_SECRET.encode(), f"{timestamp}.".encode(), hashlib.sha256
+        )
+    
+    def update(self, chunk: bytes) -> None:
+        self._mac.update(chunk)
+    
+    def verify(self) -> None:
+        expected = self._mac.hexdigest()
+        if not any(hmac.compare_digest(expected, sig) for sig in self._signatures):
+            logger.error("webhook_signature_invalid", error="no matching signature")
+            raise WebhookVerificationError("Invalid webhook signature: no matching signature")
+        if self._timestamp < time.time() - WEBHOOK_TOLERANCE_SECONDS:
+            logger.error("webhook_signature_invalid", error="timestamp outside tolerance")
+            raise WebhookVerificationError("Invalid webhook signature: timestamp outside tolerance")
+
+
+def _construct_verified_event(payload: bytes) -> stripe.Event:
+    """Build an Event from a payload whose signature was already checked."""
+    try:
+        data = json.loads(payload)
+    except ValueError as e:
+        logger.error("webhook_payload_invalid", error=str(e))
+        raise WebhookVerificationError(f"Invalid webhook payload: {e}")
+    return stripe.Event.construct_from(data, stripe.api_key)
+
+
+async def handle_webhook(
+    payload: bytes,
+    sig_header: str,
+    verifier: Optional[WebhookSignatureVerifier] = None,
+) -> Tuple[bool, str]:
     """
     Process Stripe webhook event.
     
     Args:
         payload: Raw request body bytes
         sig_header: Stripe-Signature header value
+        verifier: Verifier already fed the full payload while it streamed in;
+                  if omitted the signature is checked here from payload
         
     Returns:
         Tuple of (success: bool, message: str)
     """
     # Verify signature first (SECURITY CRITICAL)
-    event = verify_webhook_signature(payload, sig_header)
+    if verifier is not None:
+        verifier.verify()
+        event = _construct_verified_event(payload)
+    else:
+        event = verify_webhook_signature(payload, sig_header)
     
     event_type = event.type
     event_data = event.data.object
@@ -462,6 +545,8 @@ async def _handle_invoice_failed(invoice: Dict[str, Any]) -> None:
             "updated_at": now,
         }
     )
+    # The affected user_id is only known to the subquery, so drop everyone
+    invalidate_user_settings_cache()
     
     log.info("invoice_failed_processed")
 
@@ -553,6 +638,7 @@ async def _handle_subscription_deleted(subscription: Dict[str, Any]) -> None:
             "updated_at": now,
         }
     )
+    invalidate_user_settings_cache(user_id)
     
     log.info("subscription_deleted_processed", user_id=user_id)
 
@@ -648,6 +734,7 @@ async def _update_subscription_record(
             "updated_at": now,
         }
     )
+    invalidate_user_settings_cache(user_id)
     
     log.info("subscription_record_updated")
 
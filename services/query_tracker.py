@@ -0,0 +1,82 @@
+"""
+N+1 Query Detection (development only)
+
+Counts queries per (SQL text, call site) within a single request and logs a
+warning when the same query is issued repeatedly from the same line - the
+signature of a loop doing one query per row instead of one query per batch.
+
+Enabled by adding QueryTrackerMiddleware to the app (backend/app.py does
+this only when DEV_MODE is set). Outside a tracked request, track_query() is a
+single ContextVar lookup, so production pays effectively nothing.
+"""
+
+import os
+import traceback
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Per-request counter of (sql, call_site) -> count; None when not tracking
+_query_counts: ContextVar[Optional[Counter]] = ContextVar("query_counts", default=None)
+
+# Data-access layers to skip when locating the call site of a query
+_INTERNAL_FILES = (
+    os.path.join("services", "db.py"),
+    os.path.join("repositories", "base.py"),
+    os.path.join("services", "query_tracker.py"),
+)
+
+
+def _call_site() -> str:
+    """First stack frame outside the data-access layer, as 'file:line'."""
+    for frame in reversed(traceback.extract_stack(limit=12)):
+        if not frame.filename.endswith(_INTERNAL_FILES):
+            return f"{frame.filename}:{frame.lineno}"
+    return "unknown"
+
+
+def track_query(sql: str) -> None:
+    """Record a query against the current request (no-op when not tracking)."""
+    counts = _query_counts.get()
+    if counts is not None:
+        counts[(" ".join(sql.split()), _call_site())] += 1
+
+
+class QueryTrackerMiddleware:
+    """
+    ASGI middleware that warns about likely N+1 query patterns per request.
+
+    Args:
+        app: The wrapped ASGI application
+        threshold: Warn when one (sql, call site) pair runs more than this
+                   many times in a single request
+    """
+
+    def __init__(self, app, threshold: int = 5):
+        self.app = app
+        self.threshold = threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        counts = Counter()
+        token = _query_counts.set(counts)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _query_counts.reset(token)
+            for (sql, call_site), count in counts.items():
+                if count > self.threshold:
+                    logger.warning(
+                        "potential_n_plus_1",
+                        path=scope.get("path"),
+                        sql=sql[:200],
+                        call_site=call_site,
+                        count=count,
+                    )
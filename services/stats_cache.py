@@ -0,0 +1,45 @@
+"""
+Dashboard Stats Cache
+
+Short-lived per-user cache for GET /api/stats/{user_id}. The stats are
+several COUNT(*) aggregations and the dashboard reloads often, so results
+are kept for STATS_CACHE_TTL_SECONDS. Anything that writes posts or
+scheduled posts calls invalidate_stats_cache(user_id).
+
+The cache is per API process and is only invalidated by writes made in
+that process. Status changes made by Celery tasks (scheduled posts being
+published) show up once the TTL expires.
+"""
+
+import time
+from typing import Dict, Optional, Tuple
+
+STATS_CACHE_TTL_SECONDS = 30
+STATS_CACHE_MAX_ENTRIES = 1024
+STATS_CACHE_CONTROL = f"private, max-age={STATS_CACHE_TTL_SECONDS}"
+_stats_cache: Dict[str, Tuple[dict, float]] = {}
+
+
+def get_cached_stats(user_id: str) -> Optional[dict]:
+    """Return cached stats for a user if not expired."""
+    entry = _stats_cache.get(user_id)
+    if entry is None:
+        return None
+    stats, expires_at = entry
+    if time.monotonic() >= expires_at:
+        _stats_cache.pop(user_id, None)
+        return None
+    return stats
+
+
+def set_cached_stats(user_id: str, stats: dict) -> None:
+    """Store stats for a user, evicting the oldest entry when full."""
+    if user_id not in _stats_cache and len(_stats_cache) >= STATS_CACHE_MAX_ENTRIES:
+        _stats_cache.pop(next(iter(_stats_cache)))
+    _stats_cache[user_id] = (stats, time.monotonic() + STATS_CACHE_TTL_SECONDS)
+
+
+def invalidate_stats_cache(user_id: Optional[str]) -> None:
+    """Drop cached stats for a user (call after creating/removing posts)."""
+    if user_id:
+        _stats_cache.pop(user_id, None)
@@ -4,6 +4,7 @@ Celery Tasks - Background Task Definitions
 This module contains Celery tasks for background processing:
 - publish_due_posts_task: Periodic task that checks and publishes scheduled posts
 - publish_single_post_task: Publish a single post (can be called directly)
+- publish_post_now_task: Publish a freshly generated post (from /api/post/publish)
 - scheduler_heartbeat_task: Health check for monitoring
 
 IMPORTANT: Async/Sync Bridge
@@ -208,6 +209,103 @@ async def _publish_single_post_async(
         return {'success': False, 'error': str(e)}
 
 
+class PrePublishError(Exception):
+    """Failure before anything was sent to LinkedIn - safe to retry the task."""
+    pass
+
+
+async def _publish_post_now_async(
+    post_content: str,
+    user_id: Optional[str] = None,
+) -> dict:
+    """
+    Async implementation for publishing an unscheduled post right away.
+    
+    Uses the user's stored LinkedIn token (refreshed if near expiry) when a
+    user_id is given, otherwise the environment-configured account (CLI /
+    single-user deployments).
+    
+    Returns:
+        Dict with success status, image asset, account URN and the owning
+        user_id. Token problems are reported in the dict with the HTTP
+        status the API would have used (401 / 502) instead of raising.
+        
+    Raises:
+        PrePublishError: For unexpected failures before the post request
+            (DB, image lookup/upload), which are safe to retry.
+    """
+    from services.token_store import get_token_by_user_id
+    from services.image_service import get_relevant_image
+    from services.linkedin_service import post_to_linkedin, upload_image_to_linkedin
+    from services.auth_service import (
+        get_access_token_for_urn,
+        TokenNotFoundError,
+        TokenRefreshError,
+        AuthProviderError,
+    )
+    from services.db import connect_db
+    
+    access_token = None
+    linkedin_urn = None
+    
+    def failed(error: str, status_code: int) -> dict:
+        return {
+            'success': False,
+            'error': error,
+            'status_code': status_code,
+            'account': linkedin_urn,
+            'user_id': user_id,
+        }
+    
+    try:
+        if user_id:
+            await connect_db()
+            tokens = await get_token_by_user_id(user_id)
+            linkedin_urn = tokens.get('linkedin_user_urn') if tokens else None
+            if not linkedin_urn:
+                raise TokenNotFoundError(message="No LinkedIn token for user", user_id=user_id)
+            access_token = await get_access_token_for_urn(linkedin_urn)
+        
+        image_asset = None
+        image_data = get_relevant_image(post_content)
+        if image_data:
+            image_asset = upload_image_to_linkedin(
+                image_data,
+                access_token=access_token,
+                linkedin_user_urn=linkedin_urn,
+            )
+    except TokenNotFoundError:
+        return failed("LinkedIn not connected. Please reconnect your account.", 401)
+    except TokenRefreshError:
+        return failed("LinkedIn session expired. Please reconnect your account.", 401)
+    except AuthProviderError:
+        return failed("LinkedIn is temporarily unavailable. Please try again later.", 502)
+    except RuntimeError as e:
+        # Missing credentials - retrying won't help
+        return failed(str(e), 401)
+    except Exception as e:
+        raise PrePublishError(str(e)) from e
+    
+    # Past this point the post may have reached LinkedIn, so nothing below
+    # is retried (post_to_linkedin reports transport errors as False)
+    try:
+        success = post_to_linkedin(
+            post_content,
+            image_asset,
+            access_token=access_token,
+            linkedin_user_urn=linkedin_urn,
+        )
+    except RuntimeError as e:
+        return failed(str(e), 401)
+    
+    return {
+        'success': bool(success),
+        'image_asset': image_asset,
+        'account': linkedin_urn,
+        'user_id': user_id,
+    }
+
+
 # =============================================================================
 # CELERY TASKS
 # =============================================================================
@@ -312,6 +410,57 @@ def publish_single_post_task(
         raise self.retry(exc=e)
 
 
+@celery_app.task(
+    bind=True,
+    name='services.tasks.publish_post_now_task',
+    max_retries=3,
+    default_retry_delay=30,
+)
+def publish_post_now_task(
+    self,
+    post_content: str,
+    user_id: Optional[str] = None,
+):
+    """
+    Task: Publish a freshly generated post (image lookup, upload, post).
+    
+    Queued by /api/post/publish so the request returns immediately instead
+    of holding the API worker for the LinkedIn/Unsplash round-trips.
+    Poll /api/tasks/{task_id} for the result.
+    
+    Args:
+        post_content: The post text content
+        user_id: Clerk user ID (optional; env account used if missing)
+    """
+    log = logger.bind(
+        task_id=self.request.id,
+        task_name='publish_post_now',
+        user_id=user_id,
+    )
+    log.info("task_started")
+    
+    try:
+        result = run_async(_publish_post_now_async(
+            post_content=post_content,
+            user_id=user_id,
+        ))
+    except PrePublishError as e:
+        # Nothing was sent to LinkedIn yet, so a retry cannot double-post
+        log.warning("task_retrying", error=str(e))
+        raise self.retry(exc=e)
+    except Exception:
+        # The post may already be live - never retry (it would publish twice)
+        log.exception("task_failed")
+        return {'success': False, 'error': 'publish_failed', 'user_id': user_id}
+    
+    if result['success']:
+        log.info("task_completed", result=result)
+    else:
+        log.warning("task_completed_with_error", result=result)
+    
+    return result
+
+
 @celery_app.task(name='services.tasks.scheduler_heartbeat_task')
 def scheduler_heartbeat_task():
     """
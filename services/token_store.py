@@ -33,12 +33,62 @@ SECURITY NOTES:
     - Uses parameterized queries to prevent SQL injection
 """
 
+import hashlib
 import logging
+import time
+from typing import Dict, Optional, Tuple
 from services.db import get_database
 from services.encryption import encrypt_value, decrypt_value, is_encrypted, mask_token
 
 logger = logging.getLogger(__name__)
 
+# =============================================================================
+# CODE EXCHANGE CACHE
+# Remembers the last successful authorization-code exchange per
+# "user_id@client_id", so a replayed OAuth callback (double click, browser
+# retry) reuses its result instead of re-sending an already-spent code to
+# LinkedIn. A different code always goes to LinkedIn. Disconnecting clears
+# the user's entries.
+# Only a digest of the code and the resulting LinkedIn URN are kept - never
+# the access token, which stays encrypted at rest in the accounts table.
+# =============================================================================
+EXCHANGE_CACHE_TTL_SECONDS = 300
+EXCHANGE_CACHE_MAX_ENTRIES = 1024
+_exchange_cache: Dict[str, Tuple[str, str, float]] = {}
+
+
+def _code_digest(code: str) -> str:
+    """SHA-256 of an authorization code (the raw code is never stored)."""
+    return hashlib.sha256(code.encode()).hexdigest()
+
+
+def get_cached_exchange(user_id: str, client_id: str, code: str) -> Optional[str]:
+    """Return the LinkedIn URN if this exact code was already redeemed."""
+    entry = _exchange_cache.get(f"{user_id}@{client_id}")
+    if entry is None:
+        return None
+    code_digest, linkedin_user_urn, expires_at = entry
+    if code_digest != _code_digest(code) or time.monotonic() >= expires_at:
+        return None
+    return linkedin_user_urn
+
+
+def cache_exchange(user_id: str, client_id: str, code: str, linkedin_user_urn: str) -> None:
+    """Record a successful exchange, evicting the oldest entry when full."""
+    key = f"{user_id}@{client_id}"
+    if key not in _exchange_cache and len(_exchange_cache) >= EXCHANGE_CACHE_MAX_ENTRIES:
+        _exchange_cache.pop(next(iter(_exchange_cache)))
+    _exchange_cache[key] = (
+        _code_digest(code), linkedin_user_urn, time.monotonic() + EXCHANGE_CACHE_TTL_SECONDS
+    )
+
+
+def forget_cached_exchanges(user_id: str) -> None:
+    """Drop every cached exchange for a user, across all client IDs."""
+    prefix = f"{user_id}@"
+    for key in [k for k in _exchange_cache if k.startswith(prefix)]:
+        del _exchange_cache[key]
+
 
 async def save_token(
     linkedin_user_urn: str, 
@@ -317,6 +367,7 @@ async def delete_token_by_user_id(user_id: str) -> bool:
         - Enforces tenant isolation (can only delete own token)
         - No cross-user deletion possible
     """
+    forget_cached_exchanges(user_id)
     db = get_database()
     
     try:
@@ -20,6 +20,9 @@ GDPR COMPLIANCE:
 
 import logging
 from services.db import get_database
+from services.user_settings import invalidate_user_settings_cache
+from services.feedback import forget_feedback_submitter
+from services.token_store import forget_cached_exchanges
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +35,7 @@ async def delete_user_tokens(user_id: str) -> int:
             "DELETE FROM accounts WHERE user_id = :p1", 
             [user_id]
         )
+        forget_cached_exchanges(user_id)
         deleted = result if isinstance(result, int) else 1
         logger.info(f"🗑️  Deleted {deleted} token record(s) for user {user_id[:8]}...")
         return deleted
@@ -48,6 +52,7 @@ async def delete_user_settings(user_id: str) -> int:
             "DELETE FROM user_settings WHERE user_id = :p1", 
             [user_id]
         )
+        invalidate_user_settings_cache(user_id)
         deleted = result if isinstance(result, int) else 1
         logger.info(f"🗑️  Deleted {deleted} settings record(s) for user {user_id[:8]}...")
         return deleted
@@ -96,6 +101,7 @@ async def delete_user_feedback(user_id: str) -> int:
             "DELETE FROM feedback WHERE user_id = :p1", 
             [user_id]
         )
+        forget_feedback_submitter(user_id)
         deleted = result if isinstance(result, int) else 1
         logger.info(f"🗑️  Deleted {deleted} feedback record(s) for user {user_id[:8]}...")
         return deleted
@@ -29,13 +29,102 @@ MULTI-TENANT ISOLATION:
     - Uses parameterized queries to prevent SQL injection
 """
 
+import asyncio
 import json
+import os
 import time
 import logging
+from typing import Dict, Optional, Tuple
 from services.db import get_database
 
 logger = logging.getLogger(__name__)
 
+# =============================================================================
+# SETTINGS CACHE
+# Short-lived, per-process cache of raw user_settings rows for the GitHub
+# scan, which polls the same user's row repeatedly. It is opt-in
+# (get_user_settings(..., cached=True)): writers only invalidate the worker
+# that handled the write, so anything that must see a just-saved API key or
+# a just-upgraded tier (settings GET, tier checks, payments) reads through
+# to the database. Concurrent cached misses for one user share a single
+# query, and an expired row is served if the database is unreachable.
+# =============================================================================
+USER_SETTINGS_CACHE_TTL_SECONDS = int(os.getenv("USER_SETTINGS_CACHE_TTL", "60"))
+USER_SETTINGS_CACHE_MAX_ENTRIES = 2048
+_settings_cache: Dict[str, Tuple[Optional[dict], float]] = {}
+_settings_inflight: Dict[str, asyncio.Task] = {}
+
+
+def _get_cached_row(user_id: str) -> Tuple[bool, Optional[dict]]:
+    """Return (hit, row) for a user; row may be None for "no settings"."""
+    entry = _settings_cache.get(user_id)
+    if entry is None:
+        return False, None
+    row, expires_at = entry
+    if time.monotonic() >= expires_at:
+        # Kept (until evicted or invalidated) as a fallback for DB outages
+        return False, None
+    return True, row
+
+
+def _set_cached_row(user_id: str, row: Optional[dict]) -> None:
+    """Store a row for a user, evicting the oldest entry when full."""
+    if user_id not in _settings_cache and len(_settings_cache) >= USER_SETTINGS_CACHE_MAX_ENTRIES:
+        _settings_cache.pop(next(iter(_settings_cache)))
+    _settings_cache[user_id] = (row, time.monotonic() + USER_SETTINGS_CACHE_TTL_SECONDS)
+
+
+def invalidate_user_settings_cache(user_id: Optional[str] = None) -> None:
+    """Drop cached settings for a user, or for everyone if user_id is None."""
+    if user_id is None:
+        _settings_cache.clear()
+        _settings_inflight.clear()
+    else:
+        _settings_cache.pop(user_id, None)
+        _settings_inflight.pop(user_id, None)
+
+
+async def _fetch_row(user_id: str) -> Optional[dict]:
+    """Read a user's raw settings row straight from the database."""
+    db = get_database()
+    row = await db.fetch_one(
+        "SELECT * FROM user_settings WHERE user_id = $1", 
+        [user_id]
+    )
+    return dict(row) if row else None
+
+
+def _finish_fetch(user_id: str, task: asyncio.Task) -> None:
+    """Cache a completed fetch unless it was invalidated while in flight."""
+    if _settings_inflight.get(user_id) is not task:
+        return
+    del _settings_inflight[user_id]
+    if not task.cancelled() and task.exception() is None:
+        _set_cached_row(user_id, task.result())
+
+
+async def _load_row(user_id: str) -> Optional[dict]:
+    """Cached raw row for a user, querying at most once per user at a time."""
+    hit, row = _get_cached_row(user_id)
+    if hit:
+        return row
+    
+    task = _settings_inflight.get(user_id)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_row(user_id))
+        _settings_inflight[user_id] = task
+        task.add_done_callback(lambda t: _finish_fetch(user_id, t))
+    
+    try:
+        # Shielded so one cancelled caller doesn't fail the others waiting
+        return await asyncio.shield(task)
+    except Exception:
+        stale = _settings_cache.get(user_id)
+        if stale is None:
+            raise
+        logger.warning("Serving stale settings for %s after DB error", user_id, exc_info=True)
+        return stale[0]
+
 
 async def save_user_settings(user_id: str, settings: dict) -> None:
     """
@@ -109,14 +198,17 @@ async def save_user_settings(user_id: str, settings: dict) -> None:
         timestamp,
         existing.get('created_at', timestamp)
     ])
+    invalidate_user_settings_cache(user_id)
 
 
-async def get_user_settings(user_id: str) -> dict | None:
+async def get_user_settings(user_id: str, cached: bool = False) -> dict | None:
     """
     Get user preferences by Clerk user ID.
     
     Args:
         user_id: Clerk user ID
+        cached: Serve from the per-process settings cache (may be up to
+                USER_SETTINGS_CACHE_TTL_SECONDS stale on other workers)
         
     Returns:
         Dict with user preferences, or None if not found
@@ -125,18 +217,13 @@ async def get_user_settings(user_id: str) -> dict | None:
         - Query explicitly filters by user_id
         - User can only retrieve their own settings
     """
-    db = get_database()
+    # The cache holds the raw row; JSON is parsed per call so callers always
+    # get fresh dicts they are free to mutate
+    row_dict = await _load_row(user_id) if cached else await _fetch_row(user_id)
     
-    row = await db.fetch_one(
-        "SELECT * FROM user_settings WHERE user_id = $1", 
-        [user_id]
-    )
-    
-    if not row:
+    if not row_dict:
         return None
     
-    row_dict = dict(row)
-    
     # Parse preferences JSON
     preferences_raw = row_dict.get('preferences', '{}')
     try: